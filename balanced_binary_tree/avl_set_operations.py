@@ -0,0 +1,190 @@
+"""
+基于 join 的AVL树集合运算
+
+join(left, key, right) 把所有键都小于 key 的树、key 本身和所有键都大于 key 的树合并成
+一棵AVL树，代价是 O(|两棵树的高度差| + 1)。split、union、intersection、difference
+都只用 join 表达（Blelloch、Ferizovic、Sun，"Just Join for Parallel Ordered Sets"），
+大小为 m 和 n（m <= n）的两棵树的集合运算是 O(m log(n/m + 1))，比逐个插入的
+O(m log(n + m)) 少得多。
+
+union/intersection/difference 在拆开的左右两半上的两次递归互不依赖，可以分给不同的
+工作者并行执行；CPython 中纯 Python 代码受 GIL 限制，这里按顺序执行。
+
+这些函数直接复用输入树的节点：运算结束后输入树被清空，结果是一棵新的 AVLTree。
+"""
+
+from avl_tree import AVLNode, AVLTree
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _attach(node, left, right):
+    node.left = left
+    node.right = right
+    node.height = 1 + max(_height(left), _height(right))
+    return node
+
+
+def _rotate_left(x):
+    y = x.right
+    _attach(x, x.left, y.left)
+    return _attach(y, x, y.right)
+
+
+def _rotate_right(x):
+    y = x.left
+    _attach(x, y.right, x.right)
+    return _attach(y, y.left, x)
+
+
+def _join_right(left, node, right):
+    # left 比 right 高 2 以上：沿 left 的右脊下降到高度相差不超过1处挂上 node
+    middle = left.right
+    if _height(middle) <= _height(right) + 1:
+        joined = _attach(node, middle, right)
+        if joined.height <= _height(left.left) + 1:
+            return _attach(left, left.left, joined)
+        return _rotate_left(_attach(left, left.left, _rotate_right(joined)))
+    joined = _join_right(middle, node, right)
+    tree = _attach(left, left.left, joined)
+    if joined.height <= _height(left.left) + 1:
+        return tree
+    return _rotate_left(tree)
+
+
+def _join_left(left, node, right):
+    middle = right.left
+    if _height(middle) <= _height(left) + 1:
+        joined = _attach(node, left, middle)
+        if joined.height <= _height(right.right) + 1:
+            return _attach(right, joined, right.right)
+        return _rotate_right(_attach(right, _rotate_left(joined), right.right))
+    joined = _join_left(left, node, middle)
+    tree = _attach(right, joined, right.right)
+    if joined.height <= _height(right.right) + 1:
+        return tree
+    return _rotate_right(tree)
+
+
+def _join(left, node, right):
+    if _height(left) > _height(right) + 1:
+        return _join_right(left, node, right)
+    if _height(right) > _height(left) + 1:
+        return _join_left(left, node, right)
+    return _attach(node, left, right)
+
+
+def _split(tree, key):
+    """按 key 拆分，返回 (左子树, 是否包含 key, 右子树)"""
+    if not tree:
+        return None, False, None
+    left, right = tree.left, tree.right
+    if key == tree.key:
+        return left, True, right
+    if key < tree.key:
+        low, found, high = _split(left, key)
+        return low, found, _join(high, tree, right)
+    low, found, high = _split(right, key)
+    return _join(left, tree, low), found, high
+
+
+def _split_last(tree):
+    # 摘下最大节点，返回 (剩余部分, 最大节点)
+    if not tree.right:
+        return tree.left, tree
+    rest, last = _split_last(tree.right)
+    return _join(tree.left, tree, rest), last
+
+
+def _join2(left, right):
+    # 没有中间键的 join
+    if not left:
+        return right
+    left, last = _split_last(left)
+    return _join(left, last, right)
+
+
+def _union(first, second):
+    if not first:
+        return second
+    if not second:
+        return first
+    second_left, second_right = second.left, second.right
+    low, _, high = _split(first, second.key)
+    # 以下两次递归互不依赖
+    left = _union(low, second_left)
+    right = _union(high, second_right)
+    return _join(left, second, right)
+
+
+def _intersection(first, second):
+    if not first or not second:
+        return None
+    second_left, second_right = second.left, second.right
+    low, found, high = _split(first, second.key)
+    left = _intersection(low, second_left)
+    right = _intersection(high, second_right)
+    if found:
+        return _join(left, second, right)
+    return _join2(left, right)
+
+
+def _difference(first, second):
+    if not first:
+        return None
+    if not second:
+        return first
+    low, _, high = _split(first, second.key)
+    left = _difference(low, second.left)
+    right = _difference(high, second.right)
+    return _join2(left, right)
+
+
+def _extreme_key(node, side):
+    while getattr(node, side):
+        node = getattr(node, side)
+    return node.key
+
+
+def _take(tree):
+    root = tree.root
+    tree.root = None
+    return root
+
+
+def _result(root):
+    tree = AVLTree()
+    tree.root = root
+    return tree
+
+
+def join(left, key, right):
+    """合并 left、key 和 right，要求 left 的键都小于 key，right 的键都大于 key"""
+    if left.root and _extreme_key(left.root, 'right') >= key:
+        raise ValueError("join 要求左树的所有键都小于 key")
+    if right.root and _extreme_key(right.root, 'left') <= key:
+        raise ValueError("join 要求右树的所有键都大于 key")
+    return _result(_join(_take(left), AVLNode(key), _take(right)))
+
+
+def split(tree, key):
+    """按 key 拆成 (键小于 key 的树, 是否包含 key, 键大于 key 的树)"""
+    low, found, high = _split(_take(tree), key)
+    return _result(low), found, _result(high)
+
+
+def union(first, second):
+    """两棵树的并集"""
+    return _result(_union(_take(first), _take(second)))
+
+
+def intersection(first, second):
+    """两棵树的交集"""
+    return _result(_intersection(_take(first), _take(second)))
+
+
+def difference(first, second):
+    """在 first 中但不在 second 中的键"""
+    return _result(_difference(_take(first), _take(second)))
@@ -0,0 +1,146 @@
+"""
+AVL树基准测试：递归版本 AVLTree 与迭代版本 IterativeAVLTree
+
+测量随机顺序插入、查找、删除的吞吐量（每秒操作数）、完整中序遍历的耗时，
+以及用tracemalloc测量的每个键占用的内存。两个版本的中序遍历结果必须一致。
+
+使用方法：
+    python benchmark.py                               # 默认100万个键
+    python benchmark.py --sizes 100000 1000000 --repeats 3 --json results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+
+from avl_tree import AVLTree
+from iterative_avl_tree import IterativeAVLTree
+
+# 名称 -> 构造函数。结构需要提供 insert(key)、search(key)、delete(key)、inorder()
+STRUCTURES = {
+    'AVLTree': AVLTree,
+    'IterativeAVLTree': IterativeAVLTree,
+}
+
+DEFAULT_SIZES = [1000000]
+
+
+def build(factory, keys):
+    tree = factory()
+    insert = tree.insert
+    for key in keys:
+        insert(key)
+    return tree
+
+
+def measure_memory(factory, keys):
+    """建树过程中新分配的字节数（键是预先存在的对象，不计入）"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tree = build(factory, keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return current - baseline
+
+
+def benchmark_structure(name, factory, size, repeats=1, seed=0, memory=True):
+    rng = random.Random(seed)
+    keys = list(range(size))
+    insert_order = keys[:]
+    rng.shuffle(insert_order)
+    search_order = keys[:]
+    rng.shuffle(search_order)
+    delete_order = keys[:]
+    rng.shuffle(delete_order)
+
+    row = {'structure': name, 'size': size, 'repeats': repeats, 'sorted': True}
+    times = {'insert': [], 'search': [], 'inorder': [], 'delete': []}
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        tree = build(factory, insert_order)
+        times['insert'].append(time.perf_counter() - begin)
+
+        search = tree.search
+        begin = time.perf_counter()
+        for key in search_order:
+            search(key)
+        times['search'].append(time.perf_counter() - begin)
+
+        begin = time.perf_counter()
+        result = tree.inorder()
+        times['inorder'].append(time.perf_counter() - begin)
+        row['sorted'] = row['sorted'] and result == keys
+        del result
+
+        delete = tree.delete
+        begin = time.perf_counter()
+        for key in delete_order:
+            delete(key)
+        times['delete'].append(time.perf_counter() - begin)
+        del tree
+
+    for operation, samples in times.items():
+        median = statistics.median(samples)
+        row[f'{operation}_time'] = median
+        row[f'{operation}_ops_per_sec'] = size / median if median else float('inf')
+
+    if memory:
+        row['bytes_per_key'] = measure_memory(factory, insert_order) / size if size else 0.0
+    return row
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, structures=tuple(STRUCTURES), repeats=1, seed=0, memory=True, verbose=True):
+    rows = []
+    for size in sizes:
+        for name in structures:
+            row = benchmark_structure(name, STRUCTURES[name], size, repeats, seed, memory)
+            rows.append(row)
+            if verbose:
+                print_row(row)
+    return rows
+
+
+def print_row(row):
+    memory = f"{row['bytes_per_key']:>7.1f}" if 'bytes_per_key' in row else f"{'-':>7}"
+    print(f"{row['structure']:<18} {row['size']:>9}  插入 {row['insert_ops_per_sec']:>10,.0f}/s  "
+          f"查找 {row['search_ops_per_sec']:>10,.0f}/s  删除 {row['delete_ops_per_sec']:>10,.0f}/s  "
+          f"中序遍历 {row['inorder_time']:>6.3f}s  每键 {memory} B  {'有序' if row['sorted'] else '结果错误'}")
+
+
+def write_json(rows, path, config=None):
+    environment = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment, 'config': config or {}, 'results': rows},
+                  f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AVL树基准测试")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="键的数量")
+    parser.add_argument('--structures', nargs='+', default=list(STRUCTURES), choices=list(STRUCTURES))
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="不测量每个键的内存")
+    parser.add_argument('--json', help="JSON输出路径")
+    args = parser.parse_args(argv)
+
+    rows = run_benchmark(args.sizes, args.structures, args.repeats, args.seed, not args.no_memory)
+    if args.json:
+        write_json(rows, args.json, {key: value for key, value in vars(args).items() if key != 'json'})
+        print(f"JSON结果已保存到 {args.json}")
+    if not all(row['sorted'] for row in rows):
+        raise SystemExit("中序遍历结果与预期不一致")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
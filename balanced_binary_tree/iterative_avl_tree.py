@@ -0,0 +1,219 @@
+class IterativeAVLNode:
+    __slots__ = ('key', 'left', 'right', 'height')
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+
+class IterativeAVLTree:
+    """与 AVLTree 接口相同的AVL树，所有操作都不使用递归。
+
+    插入和删除把从根到目标位置的节点记在显式路径栈上，然后自底向上更新高度并旋转；
+    某个节点的高度不变且无需旋转时，上面的祖先也不会变化，调整提前结束。
+    遍历是基于显式栈的生成器，查找只是一个循环，不创建任何栈帧。
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    @staticmethod
+    def get_height(node):
+        return node.height if node is not None else 0
+
+    def get_balance(self, node):
+        if node is None:
+            return 0
+        return self.get_height(node.left) - self.get_height(node.right)
+
+    def _update_height(self, node):
+        left, right = node.left, node.right
+        left_height = left.height if left is not None else 0
+        right_height = right.height if right is not None else 0
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+
+    def left_rotate(self, z):
+        y = z.right
+        z.right = y.left
+        y.left = z
+        self._update_height(z)
+        self._update_height(y)
+        return y
+
+    def right_rotate(self, z):
+        y = z.left
+        z.left = y.right
+        y.right = z
+        self._update_height(z)
+        self._update_height(y)
+        return y
+
+    def _rebalance(self, node):
+        # 更新 node 的高度，必要时旋转，返回该子树的新根
+        self._update_height(node)
+        balance = self.get_balance(node)
+        if balance > 1:
+            if self.get_balance(node.left) < 0:
+                node.left = self.left_rotate(node.left)
+            return self.right_rotate(node)
+        if balance < -1:
+            if self.get_balance(node.right) > 0:
+                node.right = self.right_rotate(node.right)
+            return self.left_rotate(node)
+        return node
+
+    def _fix_path(self, path):
+        # 自底向上重新平衡路径上的节点，并把旋转后的子树根挂回父节点
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+            if subtree.height == old_height:
+                break
+
+    def insert(self, key):
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return
+
+        new_node = IterativeAVLNode(key)
+        self.size += 1
+        if not path:
+            self.root = new_node
+            return
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._fix_path(path)
+
+    def delete(self, key):
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return
+
+        if node.left is not None and node.right is not None:
+            # 与递归版本相同：用右子树的最小键替换，再摘除那个最小节点
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.size -= 1
+        self._fix_path(path)
+
+    def search(self, key):
+        node = self.root
+        while node is not None:
+            node_key = node.key
+            if key == node_key:
+                return node
+            node = node.left if key < node_key else node.right
+        return None
+
+    def iter_preorder(self):
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_inorder(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def iter_postorder(self):
+        stack = []
+        node = self.root
+        last = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                stack.pop()
+                yield top.key
+                last = top
+
+    def preorder(self):
+        return list(self.iter_preorder())
+
+    def inorder(self):
+        return list(self.iter_inorder())
+
+    def postorder(self):
+        return list(self.iter_postorder())
+
+if __name__ == "__main__":
+    avl = IterativeAVLTree()
+
+    # 测试插入操作
+    keys = [9, 5, 10, 0, 6, 11, -1, 1, 2]
+    for key in keys:
+        avl.insert(key)
+
+    print("中序遍历:", avl.inorder())
+    print("前序遍历:", avl.preorder())
+    print("后序遍历:", avl.postorder())
+
+    # 测试查找操作
+    print("查找键值 6:", avl.search(6) is not None)
+    print("查找键值 12:", avl.search(12) is not None)
+
+    # 测试删除操作
+    for key in (10, 5, 9):
+        avl.delete(key)
+        print(f"删除键值 {key} 后中序遍历:", avl.inorder())
@@ -0,0 +1,85 @@
+import sys
+import os
+
+# 添加当前目录到路径，以便导入AVL树模块
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import random
+
+from avl_tree import AVLTree
+import avl_set_operations
+from test_iterative_avl_tree import check_avl
+
+def build(keys):
+    avl = AVLTree()
+    for key in keys:
+        avl.insert(key)
+    return avl
+
+def test_set_operations():
+    """测试 union/intersection/difference 的结果与 Python set 一致，且结果仍是AVL树"""
+    print("测试AVL集合运算...")
+    rng = random.Random(2)
+    for _ in range(150):
+        first = set(rng.sample(range(300), rng.randrange(120)))
+        second = set(rng.sample(range(300), rng.randrange(120)))
+        for operation, expected in ((avl_set_operations.union, first | second),
+                                    (avl_set_operations.intersection, first & second),
+                                    (avl_set_operations.difference, first - second)):
+            left, right = build(first), build(second)
+            result = operation(left, right)
+            check_avl(result.root)
+            assert result.inorder() == sorted(expected), f"{operation.__name__} 结果错误"
+            assert left.root is None and right.root is None, "输入树应被清空"
+            # 结果仍是可正常使用的AVL树
+            result.insert(1000)
+            result.delete(1000)
+            check_avl(result.root)
+    print("AVL集合运算测试通过！\n")
+
+def test_split_and_join():
+    """测试 split 拆出的两半和 join 的结果都满足AVL平衡不变式"""
+    print("测试AVL split/join...")
+    rng = random.Random(3)
+    for _ in range(200):
+        keys = set(rng.sample(range(500), rng.randrange(200)))
+        key = rng.randrange(500)
+        low, found, high = avl_set_operations.split(build(keys), key)
+        check_avl(low.root)
+        check_avl(high.root)
+        assert low.inorder() == sorted(k for k in keys if k < key)
+        assert high.inorder() == sorted(k for k in keys if k > key)
+        assert found == (key in keys)
+
+        joined = avl_set_operations.join(low, key, high)
+        check_avl(joined.root)
+        assert joined.inorder() == sorted(keys | {key})
+
+    # 高度相差很大的两棵树也能直接合并
+    small, large = build(range(3)), build(range(10, 5000))
+    joined = avl_set_operations.join(small, 5, large)
+    check_avl(joined.root)
+    assert joined.inorder() == [0, 1, 2, 5] + list(range(10, 5000))
+
+    try:
+        avl_set_operations.join(build([1, 5]), 3, build([7]))
+        assert False, "左树含有大于 key 的键时应该抛出 ValueError"
+    except ValueError:
+        pass
+    print("AVL split/join测试通过！\n")
+
+def run_all_tests():
+    """运行所有测试"""
+    print("=" * 50)
+    print("AVL集合运算测试套件")
+    print("=" * 50)
+
+    test_set_operations()
+    test_split_and_join()
+
+    print("=" * 50)
+    print("所有测试通过！")
+    print("=" * 50)
+
+if __name__ == "__main__":
+    run_all_tests()
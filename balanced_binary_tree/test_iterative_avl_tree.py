@@ -0,0 +1,103 @@
+import sys
+import os
+
+# 添加当前目录到路径，以便导入AVL树模块
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import math
+import random
+
+from avl_tree import AVLTree
+from iterative_avl_tree import IterativeAVLTree
+
+def check_avl(node, low=None, high=None):
+    """检查二叉搜索树顺序、记录的高度和平衡因子，返回子树高度"""
+    if node is None:
+        return 0
+    assert low is None or node.key > low, "违反二叉搜索树顺序"
+    assert high is None or node.key < high, "违反二叉搜索树顺序"
+    left = check_avl(node.left, low, node.key)
+    right = check_avl(node.right, node.key, high)
+    assert abs(left - right) <= 1, f"节点 {node.key} 失衡"
+    assert node.height == 1 + max(left, right), f"节点 {node.key} 的高度记录错误"
+    return node.height
+
+def test_insert_delete_search():
+    """测试插入、删除和查找，包括重复插入和删除不存在的键"""
+    print("测试迭代AVL树的插入、删除和查找...")
+    avl = IterativeAVLTree()
+    for key in [9, 5, 10, 0, 6, 11, -1, 1, 2, 5, 9]:
+        avl.insert(key)
+    assert avl.inorder() == [-1, 0, 1, 2, 5, 6, 9, 10, 11]
+    assert len(avl) == 9
+    assert avl.search(6).key == 6 and avl.search(7) is None
+    assert 10 in avl and 3 not in avl
+    check_avl(avl.root)
+
+    avl.delete(10)
+    avl.delete(3)
+    assert avl.inorder() == [-1, 0, 1, 2, 5, 6, 9, 11]
+    assert len(avl) == 8 and 10 not in avl
+    check_avl(avl.root)
+
+    for key in avl.inorder():
+        avl.delete(key)
+    assert avl.root is None and len(avl) == 0 and avl.inorder() == []
+    print("插入、删除和查找测试通过！\n")
+
+def test_matches_recursive_tree():
+    """随机插入/删除后与递归版 AVLTree 的形状完全一致，并满足平衡与高度不变式"""
+    print("测试迭代AVL树与递归版本一致...")
+    rng = random.Random(0)
+    for _ in range(100):
+        recursive = AVLTree()
+        iterative = IterativeAVLTree()
+        keys = set()
+        for _ in range(200):
+            key = rng.randrange(100)
+            if rng.random() < 0.6:
+                recursive.insert(key)
+                iterative.insert(key)
+                keys.add(key)
+            else:
+                recursive.delete(key)
+                iterative.delete(key)
+                keys.discard(key)
+        assert iterative.preorder() == recursive.preorder()
+        assert iterative.inorder() == sorted(keys)
+        assert iterative.postorder() == recursive.postorder()
+        assert len(iterative) == len(keys)
+        height = check_avl(iterative.root)
+        assert height == AVLTree().get_height(recursive.root)
+        # AVL树的高度不超过 1.44 log2(n + 2)
+        assert height <= 1.4405 * math.log2(len(keys) + 2)
+    print("与递归版本一致性测试通过！\n")
+
+def test_long_sorted_input():
+    """有序插入十万个键：不受递归深度限制，高度保持对数级"""
+    print("测试有序插入...")
+    avl = IterativeAVLTree()
+    n = 100000
+    for key in range(n):
+        avl.insert(key)
+    assert len(avl) == n
+    assert check_avl(avl.root) <= 1.4405 * math.log2(n + 2)
+    assert list(avl) == list(range(n))
+    print("有序插入测试通过！\n")
+
+def run_all_tests():
+    """运行所有测试"""
+    print("=" * 50)
+    print("迭代AVL树测试套件")
+    print("=" * 50)
+
+    test_insert_delete_search()
+    test_matches_recursive_tree()
+    test_long_sorted_input()
+
+    print("=" * 50)
+    print("所有测试通过！")
+    print("=" * 50)
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,526 @@
+"""
+Throughput benchmark for the genetic algorithm variants.
+
+Runs each algorithm for a fixed number of generations on a cheap fitness
+function (the decoded value itself), so the measurement is dominated by the
+engine: selection, crossover, mutation, decoding and survivor selection.
+Reports generations/s and individuals/s (population size x generations / time).
+
+The evaluators suite times one fitness evaluation of a population with each
+fitness evaluator against the serial one on the kind of fitness function
+the evaluator is meant for:
+    vectorized  cheap arithmetic fitness, NumPy over the whole array
+    process     CPU-bound pure-Python fitness (--work iterations per call)
+    asyncio     fitness that waits on a simulator (--latency seconds per call)
+
+The cache suite runs each algorithm on the CPU-bound fitness with and without
+a FitnessCache and reports the time, the number of fitness calls and the hit rate.
+
+The selection suite times drawing all 2n parent indices of one generation with
+each selection operator, the per-pair random.choices loop it replaced (only for
+populations up to --legacy-limit, it is quadratic), and survivor selection of
+the best n out of 3n with a full argsort versus argpartition.
+
+The islands suite has two parts. Scaling runs an IslandModel with a fixed population
+per island in separate processes and reports individuals/s as islands are added.
+Quality compares, at equal total population and generations, a single
+population with a ring of islands running the same algorithm (ElitistGA and
+AdaptiveMutationGA) on a deceptive trap function: best fitness and diversity of
+the final population, averaged over --seeds.
+
+The genomes suite covers the real-valued and permutation encodings: sphere
+minimization over [-5, 5]^length (SBX crossover, Gaussian mutation) and a random
+euclidean TSP with length cities (OX/PMX crossover, swap/inversion mutation). It
+times one crossover and mutation pass over the population, vectorized and applied
+pair by pair (up to --legacy-limit), then runs ElitistGA with tournament selection
+and a VectorizedEvaluator and reports generations/s and the best fitness.
+
+The phases suite runs each algorithm with a GenerationProfiler and reports the
+mean time per generation of selection, crossover, mutation, evaluation and
+survivor selection, the profiler's overhead against an unprofiled run, and the
+time to write one Checkpoint.
+
+Usage:
+    python benchmark.py                                  # pop 1,000 and 10,000
+    python benchmark.py --populations 100000 --generations 5 --length 64
+    python benchmark.py --algorithms ClassicGA SteadyStateGA --json results.json
+    python benchmark.py evaluators --populations 10000 --work 2000 --latency 0.001
+    python benchmark.py cache --populations 1000 --generations 20 --cache-size 100000
+    python benchmark.py selection --populations 10000 100000 1000000
+    python benchmark.py islands --islands 1 2 4 --island-population 2000 --generations 50
+    python benchmark.py genomes --populations 1000 10000 --length 50 --generations 100
+    python benchmark.py phases --populations 10000 100000 --generations 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from genetic_algorithms import ClassicGA, ElitistGA, SteadyStateGA, AdaptiveMutationGA
+from fitness_evaluators import SerialEvaluator, VectorizedEvaluator, ProcessPoolEvaluator, AsyncioEvaluator
+from fitness_cache import FitnessCache
+from selection import SELECTION_OPERATORS, top_k
+from island_model import IslandModel
+from genomes import RealGenome, PermutationGenome
+from profiling import PHASES, GenerationProfiler
+from checkpointing import Checkpoint
+
+ALGORITHMS = {
+    'ClassicGA': ClassicGA,
+    'ElitistGA': ElitistGA,
+    'SteadyStateGA': SteadyStateGA,
+    'AdaptiveMutationGA': AdaptiveMutationGA,
+}
+
+DEFAULT_POPULATIONS = [1000, 10000]
+DEFAULT_GENERATIONS = 20
+DEFAULT_LENGTH = 32
+
+SUITES = ('algorithms', 'evaluators', 'cache', 'selection', 'islands', 'genomes', 'phases')
+DEFAULT_WORK = 2000
+DEFAULT_LATENCY = 0.001
+DEFAULT_CONCURRENCY = 256
+DEFAULT_CACHE_SIZE = 100000
+DEFAULT_LEGACY_LIMIT = 10000
+DEFAULT_ISLANDS = [1, 2, 4]
+DEFAULT_ISLAND_POPULATION = 2000
+DEFAULT_SEEDS = 5
+TRAP_BLOCKS = 8
+TRAP_SIZE = 4
+GENOMES = {
+    'real-sbx-gaussian': lambda: RealGenome(-5.0, 5.0),
+    'permutation-ox-swap': lambda: PermutationGenome('ox', 'swap'),
+    'permutation-ox-inversion': lambda: PermutationGenome('ox', 'inversion'),
+    'permutation-pmx-swap': lambda: PermutationGenome('pmx', 'swap'),
+    'permutation-pmx-inversion': lambda: PermutationGenome('pmx', 'inversion'),
+}
+
+
+def identity_fitness(x):
+    return x
+
+
+def quadratic_fitness(x):
+    # Works on a single int and on an array of decoded values; floats so the array version cannot overflow
+    return -(x - 512.0) ** 2 + 512.0 ** 2
+
+
+class CPUBoundFitness:
+    """Picklable pure-Python fitness that burns `work` loop iterations per call"""
+    def __init__(self, work):
+        self.work = work
+    def __call__(self, x):
+        total = 0
+        for i in range(self.work):
+            total += (x ^ i) & 1
+        return total
+
+
+def trap_fitness(x):
+    """Concatenated deceptive traps: each 4-bit block scores 4 when all ones, else 3 - (number of ones)"""
+    total = 0
+    for block in range(TRAP_BLOCKS):
+        ones = bin((x >> (TRAP_SIZE * block)) & ((1 << TRAP_SIZE) - 1)).count('1')
+        total += TRAP_SIZE if ones == TRAP_SIZE else TRAP_SIZE - 1 - ones
+    return total
+
+
+def population_diversity(population):
+    """(fraction of distinct chromosomes, mean pairwise Hamming distance)"""
+    packed = np.ascontiguousarray(np.packbits(population, axis=1))
+    unique = len(np.unique(packed.view(np.dtype((np.void, packed.shape[1]))).ravel())) / len(population)
+    ones = population.mean(axis=0)
+    n = len(population)
+    hamming = float((2 * ones * (1 - ones)).sum() * n / (n - 1)) if n > 1 else 0.0
+    return unique, hamming
+
+
+def sphere_fitness(x):
+    """Negated sphere function on an array of real-valued chromosomes, maximum 0 at the origin"""
+    return -np.sum(np.asarray(x) ** 2, axis=-1)
+
+
+class TourLengthFitness:
+    """Negated length of the closed tours through random cities, for an array of permutations"""
+    def __init__(self, cities, seed=0):
+        self.coordinates = np.random.default_rng(seed).random((cities, 2))
+    def __call__(self, tours):
+        points = self.coordinates[np.asarray(tours)]
+        return -np.linalg.norm(points - np.roll(points, -1, axis=-2), axis=-1).sum(axis=-1)
+
+
+class CountingFitness:
+    """Wraps a fitness function and counts how often it is called"""
+    def __init__(self, fitness_func):
+        self.fitness_func = fitness_func
+        self.calls = 0
+    def __call__(self, x):
+        self.calls += 1
+        return self.fitness_func(x)
+
+
+class SimulatedFitness:
+    """Fitness that waits `latency` seconds on an external simulator"""
+    def __init__(self, latency):
+        self.latency = latency
+    def blocking(self, x):
+        time.sleep(self.latency)
+        return x
+    async def __call__(self, x):
+        await asyncio.sleep(self.latency)
+        return x
+
+
+def benchmark_algorithm(name, population_size, generations=DEFAULT_GENERATIONS, length=DEFAULT_LENGTH, seed=0):
+    algorithm = ALGORITHMS[name](identity_fitness, length, population_size=population_size,
+                                 max_generations=generations, seed=seed)
+    begin = time.perf_counter()
+    result = algorithm.run()
+    elapsed = time.perf_counter() - begin
+    return {
+        'algorithm': name,
+        'population_size': population_size,
+        'generations': generations,
+        'chromosome_length': length,
+        'time': elapsed,
+        'generations_per_sec': generations / elapsed,
+        'individuals_per_sec': population_size * generations / elapsed,
+        'best_fitness': float(result['best_fitness']),
+    }
+
+
+def run_benchmark(populations=DEFAULT_POPULATIONS, algorithms=tuple(ALGORITHMS), generations=DEFAULT_GENERATIONS,
+                  length=DEFAULT_LENGTH, seed=0, verbose=True):
+    rows = []
+    for population_size in populations:
+        for name in algorithms:
+            row = benchmark_algorithm(name, population_size, generations, length, seed)
+            rows.append(row)
+            if verbose:
+                print(f"{name:<20} pop {population_size:>8}  {row['generations_per_sec']:>10,.1f} gen/s  "
+                      f"{row['individuals_per_sec']:>12,.0f} individuals/s")
+    return rows
+
+
+def _time_evaluation(evaluator, fitness_func, decoded):
+    begin = time.perf_counter()
+    fitness = evaluator.evaluate(fitness_func, decoded)
+    return time.perf_counter() - begin, fitness
+
+
+def benchmark_evaluators(population_size, work=DEFAULT_WORK, latency=DEFAULT_LATENCY,
+                         concurrency=DEFAULT_CONCURRENCY, length=DEFAULT_LENGTH, seed=0):
+    """(mode, serial time, evaluator time) for one evaluation of a random population"""
+    decoded = np.random.default_rng(seed).integers(0, 1 << min(length, 62), size=population_size)
+    serial = SerialEvaluator()
+    rows = []
+
+    serial_time, expected = _time_evaluation(serial, quadratic_fitness, decoded)
+    elapsed, fitness = _time_evaluation(VectorizedEvaluator(), quadratic_fitness, decoded)
+    rows.append(('vectorized', serial_time, elapsed, np.allclose(fitness, expected, rtol=1e-12, atol=0)))
+
+    fitness_func = CPUBoundFitness(work)
+    serial_time, expected = _time_evaluation(serial, fitness_func, decoded)
+    with ProcessPoolEvaluator() as evaluator:
+        evaluator.evaluate(fitness_func, decoded[:1])  # start the workers outside the timed region
+        elapsed, fitness = _time_evaluation(evaluator, fitness_func, decoded)
+    rows.append(('process', serial_time, elapsed, np.array_equal(fitness, expected)))
+
+    simulator = SimulatedFitness(latency)
+    serial_time, expected = _time_evaluation(serial, simulator.blocking, decoded)
+    elapsed, fitness = _time_evaluation(AsyncioEvaluator(concurrency), simulator, decoded)
+    rows.append(('asyncio', serial_time, elapsed, np.array_equal(fitness, expected)))
+
+    return [{'mode': mode, 'population_size': population_size, 'serial_time': serial_time, 'time': elapsed,
+             'speedup': serial_time / elapsed, 'matches_serial': matches}
+            for mode, serial_time, elapsed, matches in rows]
+
+
+def run_evaluators(populations=DEFAULT_POPULATIONS, work=DEFAULT_WORK, latency=DEFAULT_LATENCY,
+                   concurrency=DEFAULT_CONCURRENCY, length=DEFAULT_LENGTH, seed=0, verbose=True):
+    rows = []
+    for population_size in populations:
+        for row in benchmark_evaluators(population_size, work, latency, concurrency, length, seed):
+            rows.append(row)
+            if verbose:
+                print(f"{row['mode']:<12} pop {population_size:>8}  serial {row['serial_time']:>8.3f}s  "
+                      f"evaluator {row['time']:>8.3f}s  {row['speedup']:>7.1f}x"
+                      f"{'' if row['matches_serial'] else '  RESULTS DIFFER'}")
+    return rows
+
+
+def benchmark_cache(name, population_size, generations=DEFAULT_GENERATIONS, length=DEFAULT_LENGTH,
+                    work=DEFAULT_WORK, cache_size=DEFAULT_CACHE_SIZE, seed=0):
+    rows = []
+    for cache in (None, FitnessCache(cache_size)):
+        fitness_func = CountingFitness(CPUBoundFitness(work))
+        algorithm = ALGORITHMS[name](fitness_func, length, population_size=population_size,
+                                     max_generations=generations, seed=seed, cache=cache)
+        begin = time.perf_counter()
+        result = algorithm.run()
+        elapsed = time.perf_counter() - begin
+        row = {'algorithm': name, 'population_size': population_size, 'generations': generations,
+               'cache': cache is not None, 'time': elapsed, 'fitness_calls': fitness_func.calls,
+               'best_fitness': float(result['best_fitness'])}
+        if cache is not None:
+            row.update(cache.stats())
+        rows.append(row)
+    return rows
+
+
+def run_cache(populations=DEFAULT_POPULATIONS, algorithms=tuple(ALGORITHMS), generations=DEFAULT_GENERATIONS,
+              length=DEFAULT_LENGTH, work=DEFAULT_WORK, cache_size=DEFAULT_CACHE_SIZE, seed=0, verbose=True):
+    rows = []
+    for population_size in populations:
+        for name in algorithms:
+            for row in benchmark_cache(name, population_size, generations, length, work, cache_size, seed):
+                rows.append(row)
+                if verbose:
+                    hit_rate = f"  hit rate {row['hit_rate']:>6.1%}" if row['cache'] else ""
+                    print(f"{name:<20} pop {population_size:>8}  {'cache' if row['cache'] else 'no cache':<8}  "
+                          f"{row['time']:>8.2f}s  {row['fitness_calls']:>9,} fitness calls{hit_rate}")
+    return rows
+
+
+def _legacy_roulette(fitness, rng):
+    # The selection loop GeneticAlgorithm used before: one random.choices call per parent pair
+    population = list(range(len(fitness)))
+    total_fitness = sum(fitness)
+    probabilities = [value / total_fitness for value in fitness]
+    return [random.choices(population, weights=probabilities, k=2) for _ in range(len(population))]
+
+
+def _time_call(function, *args):
+    begin = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - begin
+
+
+def benchmark_selection(population_size, legacy_limit=DEFAULT_LEGACY_LIMIT, seed=0):
+    rng = np.random.default_rng(seed)
+    fitness = rng.random(population_size)
+    rows = []
+    if population_size <= legacy_limit:
+        random.seed(seed)
+        rows.append(('random.choices per pair', _time_call(_legacy_roulette, fitness.tolist(), rng)))
+    for name, operator in SELECTION_OPERATORS.items():
+        rows.append((name, _time_call(operator, rng, fitness, 2 * population_size)))
+    combined = rng.random(3 * population_size)
+    rows.append(('survivors: argsort', _time_call(lambda: np.argsort(-combined, kind='stable')[:population_size])))
+    rows.append(('survivors: argpartition', _time_call(top_k, combined, population_size)))
+    return [{'operator': name, 'population_size': population_size, 'time': elapsed} for name, elapsed in rows]
+
+
+def run_selection(populations=DEFAULT_POPULATIONS, legacy_limit=DEFAULT_LEGACY_LIMIT, seed=0, verbose=True):
+    rows = []
+    for population_size in populations:
+        for row in benchmark_selection(population_size, legacy_limit, seed):
+            rows.append(row)
+            if verbose:
+                print(f"{row['operator']:<24} pop {population_size:>8}  {row['time'] * 1000:>10.2f} ms")
+    return rows
+
+
+def benchmark_island_scaling(islands, island_population=DEFAULT_ISLAND_POPULATION,
+                             generations=DEFAULT_GENERATIONS, seed=0):
+    length = TRAP_BLOCKS * TRAP_SIZE
+    model = IslandModel(trap_fitness, length, islands=islands, generations=generations, seed=seed,
+                        population_size=island_population)
+    begin = time.perf_counter()
+    model.run()
+    elapsed = time.perf_counter() - begin
+    return {'part': 'scaling', 'islands': islands, 'island_population': island_population, 'generations': generations,
+            'time': elapsed, 'individuals_per_sec': islands * island_population * generations / elapsed}
+
+
+def benchmark_island_quality(islands, island_population=DEFAULT_ISLAND_POPULATION, generations=DEFAULT_GENERATIONS,
+                             seeds=DEFAULT_SEEDS):
+    length = TRAP_BLOCKS * TRAP_SIZE
+    rows = []
+    for algorithm_class in (ElitistGA, AdaptiveMutationGA):
+        for model in ('single', 'islands'):
+            best, unique, hamming = [], [], []
+            for seed in range(seeds):
+                if model == 'islands':
+                    result = IslandModel(trap_fitness, length, islands=islands, algorithm_class=algorithm_class,
+                                         generations=generations, seed=seed, processes=False,
+                                         population_size=island_population).run()
+                    population = np.concatenate([island['population'] for island in result['island_results']])
+                else:
+                    algorithm = algorithm_class(trap_fitness, length, population_size=islands * island_population,
+                                                max_generations=generations, seed=seed)
+                    result = algorithm.run()
+                    population = algorithm.population
+                best.append(float(result['best_fitness']))
+                diversity = population_diversity(population)
+                unique.append(diversity[0])
+                hamming.append(diversity[1])
+            rows.append({'part': 'quality', 'algorithm': algorithm_class.__name__, 'model': model, 'islands': islands,
+                         'island_population': island_population, 'generations': generations, 'seeds': seeds,
+                         'best_fitness': float(np.mean(best)),
+                         'optimum_found': sum(value == TRAP_BLOCKS * TRAP_SIZE for value in best),
+                         'unique_fraction': float(np.mean(unique)), 'mean_hamming': float(np.mean(hamming))})
+    return rows
+
+
+def run_islands(islands=DEFAULT_ISLANDS, island_population=DEFAULT_ISLAND_POPULATION,
+                generations=DEFAULT_GENERATIONS, seeds=DEFAULT_SEEDS, seed=0, verbose=True):
+    rows = []
+    if verbose:
+        print(f"{os.cpu_count()} CPU(s)")
+    for count in islands:
+        row = benchmark_island_scaling(count, island_population, generations, seed)
+        rows.append(row)
+        if verbose:
+            print(f"scaling  {count:>3} islands x {island_population}  {row['time']:>8.2f}s  "
+                  f"{row['individuals_per_sec']:>12,.0f} individuals/s")
+    for row in benchmark_island_quality(max(islands), island_population, generations, seeds):
+        rows.append(row)
+        if verbose:
+            print(f"quality  {row['algorithm']:<20} {row['model']:<8} best {row['best_fitness']:>6.2f}  "
+                  f"optimum {row['optimum_found']}/{seeds}  distinct {row['unique_fraction']:>6.1%}  "
+                  f"mean Hamming {row['mean_hamming']:>6.2f}")
+    return rows
+
+
+def _genome_fitness(name, length, seed):
+    if name.startswith('real'):
+        return sphere_fitness
+    return TourLengthFitness(length, seed)
+
+
+def _breed(genome, rng, parents1, parents2):
+    child1, child2 = genome.crossover(rng, parents1, parents2, 0.8)
+    return genome.mutate(rng, np.concatenate([child1, child2]), 0.1)
+
+
+def _breed_pairwise(genome, rng, parents1, parents2):
+    return [_breed(genome, rng, parents1[i:i + 1], parents2[i:i + 1]) for i in range(len(parents1))]
+
+
+def benchmark_genome(name, population_size, generations=DEFAULT_GENERATIONS, length=DEFAULT_LENGTH,
+                     legacy_limit=DEFAULT_LEGACY_LIMIT, seed=0):
+    genome = GENOMES[name]()
+    rng = np.random.default_rng(seed)
+    parents = genome.initialize(rng, population_size, length)
+    half = population_size // 2
+    vectorized_time = _time_call(_breed, genome, rng, parents[:half], parents[half:2 * half])
+    pairwise_time = (_time_call(_breed_pairwise, genome, rng, parents[:half], parents[half:2 * half])
+                     if population_size <= legacy_limit else None)
+    algorithm = ElitistGA(_genome_fitness(name, length, seed), length, population_size=population_size,
+                          max_generations=generations, seed=seed, evaluator=VectorizedEvaluator(),
+                          selection='tournament', genome=genome)
+    begin = time.perf_counter()
+    result = algorithm.run()
+    elapsed = time.perf_counter() - begin
+    return {'genome': name, 'population_size': population_size, 'generations': generations,
+            'chromosome_length': length, 'operators_time': vectorized_time, 'pairwise_operators_time': pairwise_time,
+            'time': elapsed, 'generations_per_sec': generations / elapsed,
+            'initial_best_fitness': float(algorithm.best_fitness_history[0]),
+            'best_fitness': float(result['best_fitness'])}
+
+
+def run_genomes(populations=DEFAULT_POPULATIONS, generations=DEFAULT_GENERATIONS, length=DEFAULT_LENGTH,
+                legacy_limit=DEFAULT_LEGACY_LIMIT, seed=0, verbose=True):
+    rows = []
+    for population_size in populations:
+        for name in GENOMES:
+            row = benchmark_genome(name, population_size, generations, length, legacy_limit, seed)
+            rows.append(row)
+            if verbose:
+                pairwise = (f"{row['pairwise_operators_time'] * 1000:>9.1f} ms" if row['pairwise_operators_time']
+                            is not None else f"{'-':>12}")
+                print(f"{name:<26} pop {population_size:>8}  operators {row['operators_time'] * 1000:>7.1f} ms "
+                      f"(pairwise {pairwise})  {row['generations_per_sec']:>8,.1f} gen/s  "
+                      f"best {row['initial_best_fitness']:>10.3f} -> {row['best_fitness']:>10.3f}")
+    return rows
+
+
+def benchmark_phases(name, population_size, generations=DEFAULT_GENERATIONS, length=DEFAULT_LENGTH, seed=0):
+    profiler = GenerationProfiler()
+    algorithm = ALGORITHMS[name](identity_fitness, length, population_size=population_size,
+                                 max_generations=generations, seed=seed, profiler=profiler)
+    profiled_time = _time_call(algorithm.run)
+    unprofiled_time = benchmark_algorithm(name, population_size, generations, length, seed)['time']
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint_time = _time_call(Checkpoint(os.path.join(directory, 'checkpoint.npz')).save, algorithm)
+    totals = profiler.summary()['totals']
+    row = {'algorithm': name, 'population_size': population_size, 'generations': generations,
+           'profiled_time': profiled_time, 'unprofiled_time': unprofiled_time, 'checkpoint_time': checkpoint_time}
+    row.update({phase: totals[phase] / generations for phase in PHASES + ('other', 'total')})
+    return row
+
+
+def run_phases(populations=DEFAULT_POPULATIONS, algorithms=tuple(ALGORITHMS), generations=DEFAULT_GENERATIONS,
+               length=DEFAULT_LENGTH, seed=0, verbose=True):
+    rows = []
+    for population_size in populations:
+        for name in algorithms:
+            row = benchmark_phases(name, population_size, generations, length, seed)
+            rows.append(row)
+            if verbose:
+                phases = '  '.join(f"{phase} {row[phase] * 1000:>7.2f}" for phase in PHASES + ('other',))
+                print(f"{name:<20} pop {population_size:>8}  ms/gen: {phases}  total {row['total'] * 1000:>8.2f}  "
+                      f"run {row['profiled_time']:.3f}s vs {row['unprofiled_time']:.3f}s unprofiled  "
+                      f"checkpoint {row['checkpoint_time'] * 1000:.1f} ms")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genetic algorithm throughput benchmark")
+    parser.add_argument('suite', nargs='?', default='algorithms', choices=SUITES)
+    parser.add_argument('--populations', type=int, nargs='+', default=DEFAULT_POPULATIONS)
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--generations', type=int, default=DEFAULT_GENERATIONS)
+    parser.add_argument('--length', type=int, default=DEFAULT_LENGTH, help="chromosome length: bits, genes or cities")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--work', type=int, default=DEFAULT_WORK,
+                        help="evaluators: loop iterations per call of the CPU-bound fitness")
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY,
+                        help="evaluators: seconds per call of the simulated fitness")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="evaluators: in-flight calls for the asyncio evaluator")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE, help="cache: FitnessCache maxsize")
+    parser.add_argument('--legacy-limit', type=int, default=DEFAULT_LEGACY_LIMIT,
+                        help="selection: largest population for the quadratic random.choices loop")
+    parser.add_argument('--islands', type=int, nargs='+', default=DEFAULT_ISLANDS, help="islands: island counts")
+    parser.add_argument('--island-population', type=int, default=DEFAULT_ISLAND_POPULATION,
+                        help="islands: population per island")
+    parser.add_argument('--seeds', type=int, default=DEFAULT_SEEDS, help="islands: runs averaged for quality")
+    parser.add_argument('--json', help="path for JSON output")
+    args = parser.parse_args(argv)
+
+    if args.suite == 'evaluators':
+        rows = run_evaluators(args.populations, args.work, args.latency, args.concurrency, args.length, args.seed)
+    elif args.suite == 'cache':
+        rows = run_cache(args.populations, args.algorithms, args.generations, args.length, args.work,
+                         args.cache_size, args.seed)
+    elif args.suite == 'selection':
+        rows = run_selection(args.populations, args.legacy_limit, args.seed)
+    elif args.suite == 'phases':
+        rows = run_phases(args.populations, args.algorithms, args.generations, args.length, args.seed)
+    elif args.suite == 'genomes':
+        rows = run_genomes(args.populations, args.generations, args.length, args.legacy_limit, args.seed)
+    elif args.suite == 'islands':
+        rows = run_islands(args.islands, args.island_population, args.generations, args.seeds, args.seed)
+    else:
+        rows = run_benchmark(args.populations, args.algorithms, args.generations, args.length, args.seed)
+    if args.json:
+        environment = {'python': platform.python_version(), 'platform': platform.platform(),
+                       'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        config = {key: value for key, value in vars(args).items() if key != 'json'}
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment, 'config': config, 'results': rows}, f, indent=2)
+        print(f"JSON results saved to {args.json}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
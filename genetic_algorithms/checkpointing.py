@@ -0,0 +1,48 @@
+import json
+import os
+
+import numpy as np
+
+class Checkpoint:
+    """Periodic snapshot of a run, so an interrupted run can be resumed.
+
+    Pass it as checkpoint= to any GeneticAlgorithm. Every `interval` generations and at the end of
+    run(), the generation counter, population, fitness histories, stop reason and the state of the
+    random generator are written to `path` (.npz, replaced atomically). When run() starts and the
+    file exists, the algorithm is restored from it and continues where it stopped; a resumed run
+    produces the same result as an uninterrupted one. The fitness cache is not part of the
+    checkpoint, it has its own save().
+    """
+    def __init__(self, path, interval=10, resume=True):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        self.path = path
+        self.interval = interval
+        self.resume = resume
+    def due(self, generation):
+        return generation % self.interval == 0
+    def save(self, algorithm):
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'wb') as f:
+            np.savez(f, generation=algorithm.generation, population=algorithm.population,
+                     best_fitness_history=np.array(algorithm.best_fitness_history, dtype=float),
+                     average_fitness_history=np.array(algorithm.average_fitness_history, dtype=float),
+                     stop_reason=algorithm.stop_reason or '',
+                     rng_state=json.dumps(algorithm.rng.bit_generator.state))
+        os.replace(temporary, self.path)
+    def restore(self, algorithm):
+        """Load the checkpoint into algorithm if resuming and the file exists; returns whether it did"""
+        if not self.resume or not os.path.exists(self.path):
+            return False
+        with np.load(self.path) as data:
+            population = data['population']
+            if population.shape != algorithm.population.shape:
+                raise ValueError(f"checkpoint population has shape {population.shape}, "
+                                 f"expected {algorithm.population.shape}")
+            algorithm.generation = int(data['generation'])
+            algorithm.population = population
+            algorithm.best_fitness_history = data['best_fitness_history'].tolist()
+            algorithm.average_fitness_history = data['average_fitness_history'].tolist()
+            algorithm.stop_reason = str(data['stop_reason']) or None
+            algorithm.rng.bit_generator.state = json.loads(str(data['rng_state']))
+        return True
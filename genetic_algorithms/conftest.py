@@ -0,0 +1,4 @@
+import importlib.util
+
+# test_ga.py is the plotting comparison script; it needs matplotlib and is skipped without it
+collect_ignore = [] if importlib.util.find_spec('matplotlib') else ['test_ga.py']
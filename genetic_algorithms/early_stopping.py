@@ -0,0 +1,24 @@
+class EarlyStopping:
+    """Stops a run once the best fitness reaches target_fitness or stagnates.
+
+    The run stagnates when the best fitness of the last `patience` generations is not more than
+    min_delta above the best fitness before them. The check only looks at best_fitness_history,
+    so it gives the same answer after a run is resumed from a checkpoint.
+    """
+    def __init__(self, patience=None, min_delta=0.0, target_fitness=None):
+        if patience is not None and patience <= 0:
+            raise ValueError(f"patience must be positive, got {patience}")
+        self.patience = patience
+        self.min_delta = min_delta
+        self.target_fitness = target_fitness
+    def check(self, best_fitness_history):
+        """'target' or 'stagnation' if the run should stop after the recorded generations, otherwise None"""
+        if not best_fitness_history:
+            return None
+        if self.target_fitness is not None and best_fitness_history[-1] >= self.target_fitness:
+            return 'target'
+        if self.patience is not None and len(best_fitness_history) > self.patience:
+            before = max(best_fitness_history[:-self.patience])
+            if max(best_fitness_history[-self.patience:]) - before <= self.min_delta:
+                return 'stagnation'
+        return None
@@ -0,0 +1,105 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+def _pack_bits(population):
+    return np.packbits(population, axis=1)
+class FitnessCache:
+    """Bounded LRU cache of fitness values keyed by the packed genome.
+
+    A cache belongs to one fitness function, one genome type and one chromosome length. Pass it as cache= to any
+    GeneticAlgorithm; identical chromosomes, within a population or across generations and runs,
+    are then evaluated once. With path= the cache is loaded from that .npz file if it exists,
+    and save() writes it back so later runs start warm.
+    """
+    def __init__(self, maxsize=100000, path=None):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.path = path
+        self.chromosome_length = None
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+    def __len__(self):
+        return len(self._entries)
+    def _keys(self, population, pack):
+        if self.chromosome_length is None:
+            self.chromosome_length = population.shape[1]
+        elif population.shape[1] != self.chromosome_length:
+            raise ValueError(f"cache holds chromosomes of length {self.chromosome_length}, got {population.shape[1]}")
+        packed = pack(population)
+        width = packed.shape[1]
+        data = packed.tobytes()
+        return [data[start:start + width] for start in range(0, len(data), width)]
+    def evaluate(self, population, evaluate_rows, pack=None):
+        """Fitness of every row of population; evaluate_rows(rows) is called once with the rows not in the cache.
+
+        pack(population) returns one uint8 row per chromosome used as its key, bit packing by default.
+        """
+        keys = self._keys(population, pack if pack is not None else _pack_bits)
+        fitness = np.empty(len(keys), dtype=float)
+        entries = self._entries
+        missing = {}
+        for i, key in enumerate(keys):
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+                fitness[i] = value
+            elif key in missing:
+                missing[key].append(i)
+            else:
+                missing[key] = [i]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            values = evaluate_rows(population[[indices[0] for indices in missing.values()]])
+            for (key, indices), value in zip(missing.items(), values.tolist()):
+                fitness[indices] = value
+                entries[key] = value
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        return fitness
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+    def save(self, path=None):
+        path = path if path is not None else self.path
+        if path is None:
+            raise ValueError("no path given for saving the fitness cache")
+        width = len(next(iter(self._entries))) if self._entries else 0
+        packed = np.frombuffer(b''.join(self._entries), dtype=np.uint8).reshape(len(self._entries), width)
+        with open(path, 'wb') as f:
+            np.savez(f, chromosome_length=self.chromosome_length or 0, packed=packed,
+                     fitness=np.array(list(self._entries.values()), dtype=float))
+    def load(self, path):
+        with np.load(path) as data:
+            chromosome_length = int(data['chromosome_length']) or None
+            packed = data['packed']
+            fitness = data['fitness']
+        if self.chromosome_length is not None and chromosome_length not in (None, self.chromosome_length):
+            raise ValueError(f"cache file holds chromosomes of length {chromosome_length}, "
+                             f"expected {self.chromosome_length}")
+        self.chromosome_length = self.chromosome_length or chromosome_length
+        # Entries are saved least recently used first, so the most recent ones survive a smaller maxsize
+        for row, value in zip(packed, fitness.tolist()):
+            key = row.tobytes()
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,76 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+def _batches(values, batch_size):
+    if not batch_size or batch_size >= len(values):
+        return [values]
+    return [values[start:start + batch_size] for start in range(0, len(values), batch_size)]
+def _values(decoded):
+    # Binary genomes decode to one scalar per chromosome, passed as a Python int; other genomes decode to
+    # rows, passed as NumPy arrays
+    return decoded.tolist() if decoded.ndim == 1 else list(decoded)
+def _evaluate_batch(fitness_func, values):
+    return [fitness_func(x) for x in values]
+class SerialEvaluator:
+    """Calls fitness_func(x) once per decoded value in the calling thread."""
+    def evaluate(self, fitness_func, decoded):
+        return np.array(_evaluate_batch(fitness_func, _values(decoded)), dtype=float)
+class VectorizedEvaluator:
+    """Calls fitness_func(decoded) on whole arrays of decoded values, optionally in batches of batch_size."""
+    def __init__(self, batch_size=None):
+        self.batch_size = batch_size
+    def evaluate(self, fitness_func, decoded):
+        results = [np.asarray(fitness_func(batch), dtype=float) for batch in _batches(decoded, self.batch_size)]
+        fitness = np.concatenate(results) if len(results) > 1 else results[0]
+        if fitness.shape != (len(decoded),):
+            raise ValueError(f"vectorized fitness function returned shape {fitness.shape}, expected ({len(decoded)},)")
+        return fitness
+class ProcessPoolEvaluator:
+    """Evaluates batches of decoded values in worker processes, for expensive pure-Python fitness functions.
+
+    fitness_func must be picklable (a module-level function). The pool is created on first use and reused
+    across generations; call close() or use the evaluator as a context manager to shut it down.
+    """
+    def __init__(self, max_workers=None, batch_size=None):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._executor = None
+    def evaluate(self, fitness_func, decoded):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers)
+        values = _values(decoded)
+        batch_size = self.batch_size or -(-len(values) // (4 * (self.max_workers or os.cpu_count() or 1)))
+        futures = [self._executor.submit(_evaluate_batch, fitness_func, batch) for batch in _batches(values, batch_size)]
+        return np.array([fitness for future in futures for fitness in future.result()], dtype=float)
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+class AsyncioEvaluator:
+    """Awaits an async fitness_func(x) for every decoded value, e.g. one that queries a local simulator.
+
+    At most concurrency calls are in flight at a time; batch_size values are gathered per round.
+    Results are returned in population order. Runs its own event loop, so it must not be called
+    from inside a running loop.
+    """
+    def __init__(self, concurrency=64, batch_size=None):
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+    def evaluate(self, fitness_func, decoded):
+        return np.array(asyncio.run(self._evaluate(fitness_func, _values(decoded))), dtype=float)
+    async def _evaluate(self, fitness_func, values):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async def evaluate_one(x):
+            async with semaphore:
+                return await fitness_func(x)
+        results = []
+        for batch in _batches(values, self.batch_size):
+            results.extend(await asyncio.gather(*(evaluate_one(x) for x in batch)))
+        return results
@@ -1,9 +1,14 @@
-import random
+from contextlib import nullcontext
+
 import numpy as np
+from fitness_evaluators import SerialEvaluator
+from genomes import get_genome
+from selection import get_selection_operator, top_k, bottom_k
 
 class GeneticAlgorithm:
     def __init__(self, fitness_func, chromosome_length, population_size=50, crossover_rate=0.8, mutation_rate=0.1,
-                 elitism=False, elitism_size=1, max_generations=100):
+                 elitism=False, elitism_size=1, max_generations=100, seed=None, evaluator=None, cache=None,
+                 selection='roulette', genome='binary', early_stopping=None, checkpoint=None, profiler=None):
         self.fitness_func = fitness_func
         self.chromosome_length = chromosome_length
         self.population_size = population_size
@@ -12,143 +17,165 @@ class GeneticAlgorithm:
         self.elitism = elitism
         self.elitism_size = elitism_size
         self.max_generations = max_generations
+        self.rng = np.random.default_rng(seed)
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.cache = cache
+        self.selection = get_selection_operator(selection)
+        self.genome = get_genome(genome)
+        self.early_stopping = early_stopping
+        self.checkpoint = checkpoint
+        self.profiler = profiler
         self.population = self._initialize_population()
         self.best_fitness_history = []
         self.average_fitness_history = []
+        self.generation = 0
+        self.stop_reason = None
     def _initialize_population(self):
-        return [''.join(random.choice('01') for _ in range(self.chromosome_length)) for _ in range(self.population_size)]
-    def _decode(self, chromosome):
-        return int(chromosome, 2)
+        return self.genome.initialize(self.rng, self.population_size, self.chromosome_length)
+    def _decode(self, population):
+        return self.genome.decode(population)
+    def _diversity(self, population):
+        return self.genome.diversity(population)
+    def _phase(self, name):
+        return self.profiler.phase(name) if self.profiler is not None else nullcontext()
     def _evaluate_fitness(self, population):
-        return [self.fitness_func(self._decode(chromosome)) for chromosome in population]
-    def _select_parents(self, population, fitness_values):
-        total_fitness = sum(fitness_values)
-        if total_fitness == 0:
-            probabilities = [1/len(population)] * len(population)
-        else:
-            probabilities = [fitness/total_fitness for fitness in fitness_values]
-        parents = []
-        for _ in range(len(population)):
-            parents.append(random.choices(population, weights=probabilities, k=2))
-        return parents
-    def _crossover(self, parent1, parent2):
-        if random.random() < self.crossover_rate:
-            crossover_point = random.randint(1, len(parent1)-1)
-            child1 = parent1[:crossover_point] + parent2[crossover_point:]
-            child2 = parent2[:crossover_point] + parent1[crossover_point:]
-            return child1, child2
-        else:
-            return parent1, parent2
-    def _mutate(self, chromosome):
-        mutated = list(chromosome)
-        for i in range(len(mutated)):
-            if random.random() < self.mutation_rate:
-                mutated[i] = '1' if mutated[i] == '0' else '0'
-        return ''.join(mutated)
+        with self._phase('evaluation'):
+            if self.cache is None:
+                return self.evaluator.evaluate(self.fitness_func, self._decode(population))
+            return self.cache.evaluate(population,
+                                       lambda rows: self.evaluator.evaluate(self.fitness_func, self._decode(rows)),
+                                       pack=self.genome.pack)
+    def _select_parents(self, population, fitness_values, count=None):
+        count = len(population) if count is None else count
+        with self._phase('selection'):
+            return self.selection(self.rng, fitness_values, 2 * count).reshape(count, 2)
+    def _crossover(self, parents1, parents2):
+        return self.genome.crossover(self.rng, parents1, parents2, self.crossover_rate)
+    def _mutate(self, population):
+        return self.genome.mutate(self.rng, population, self.mutation_rate)
+    def _breed(self, population, parents):
+        with self._phase('crossover'):
+            child1, child2 = self._crossover(population[parents[:, 0]], population[parents[:, 1]])
+            offspring = np.empty((2 * len(parents), self.chromosome_length), dtype=child1.dtype)
+            offspring[0::2] = child1
+            offspring[1::2] = child2
+        with self._phase('mutation'):
+            return self._mutate(offspring)
     def _select_survivors(self, population, fitness_values, offspring, offspring_fitness):
-        combined_population = population + offspring
-        combined_fitness = fitness_values + offspring_fitness
-        sorted_indices = np.argsort(combined_fitness)[::-1]
-        new_population = [combined_population[i] for i in sorted_indices[:self.population_size]]
-        return new_population
-    def run(self):
-        for generation in range(self.max_generations):
-            fitness_values = self._evaluate_fitness(self.population)
-            self.best_fitness_history.append(max(fitness_values))
-            self.average_fitness_history.append(sum(fitness_values)/len(fitness_values))
-            parents = self._select_parents(self.population, fitness_values)
-            offspring = []
-            for parent1, parent2 in parents:
-                child1, child2 = self._crossover(parent1, parent2)
-                offspring.extend([self._mutate(child1), self._mutate(child2)])
-            offspring_fitness = self._evaluate_fitness(offspring)
+        combined_population = np.concatenate([population, offspring])
+        combined_fitness = np.concatenate([fitness_values, offspring_fitness])
+        survivors = top_k(combined_fitness, self.population_size)
+        return combined_population[survivors], combined_fitness[survivors]
+    def _replace_population(self, fitness_values, offspring, offspring_fitness):
+        with self._phase('survivors'):
             if self.elitism:
-                elites = [self.population[i] for i in np.argsort(fitness_values)[::-1][:self.elitism_size]]
-                self.population = self._select_survivors(self.population, fitness_values, offspring, offspring_fitness)
-                for i, elite in enumerate(elites):
-                    self.population[i] = elite
-            else:
-                self.population = self._select_survivors(self.population, fitness_values, offspring, offspring_fitness)
+                elites = self.population[top_k(fitness_values, self.elitism_size)]
+            self.population, survivor_fitness = self._select_survivors(self.population, fitness_values, offspring,
+                                                                       offspring_fitness)
+            if self.elitism:
+                self.population[bottom_k(survivor_fitness, len(elites))] = elites
+    def _record(self, fitness_values):
+        self.best_fitness_history.append(fitness_values.max())
+        self.average_fitness_history.append(fitness_values.mean())
+    def _result(self):
         final_fitness = self._evaluate_fitness(self.population)
-        best_index = np.argmax(final_fitness)
+        best_index = int(np.argmax(final_fitness))
         return {
-            'best_chromosome': self.population[best_index],
+            'best_chromosome': self.genome.format(self.population[best_index]),
             'best_fitness': final_fitness[best_index],
             'best_fitness_history': self.best_fitness_history,
-            'average_fitness_history': self.average_fitness_history
+            'average_fitness_history': self.average_fitness_history,
+            'generations': self.generation,
+            'stop_reason': self.stop_reason
         }
+    def _generation(self):
+        fitness_values = self._evaluate_fitness(self.population)
+        self._record(fitness_values)
+        parents = self._select_parents(self.population, fitness_values)
+        offspring = self._breed(self.population, parents)
+        offspring_fitness = self._evaluate_fitness(offspring)
+        self._replace_population(fitness_values, offspring, offspring_fitness)
+    def evolve(self, generations):
+        """Run up to `generations` more generations; stops early once early_stopping says so"""
+        for _ in range(generations):
+            if self.stop_reason is not None:
+                break
+            if self.profiler is not None:
+                self.profiler.start_generation(self.generation)
+            self._generation()
+            self.generation += 1
+            if self.profiler is not None:
+                self.profiler.end_generation()
+            if self.early_stopping is not None:
+                self.stop_reason = self.early_stopping.check(self.best_fitness_history)
+            if self.checkpoint is not None and self.checkpoint.due(self.generation):
+                self.checkpoint.save(self)
+    def emigrants(self, count):
+        return self.population[top_k(self._evaluate_fitness(self.population), count)]
+    def immigrate(self, migrants):
+        migrants = migrants[:self.population_size]
+        self.population[bottom_k(self._evaluate_fitness(self.population), len(migrants))] = migrants
+    def run(self):
+        if self.checkpoint is not None:
+            self.checkpoint.restore(self)
+        self.evolve(self.max_generations - self.generation)
+        if self.checkpoint is not None:
+            self.checkpoint.save(self)
+        return self._result()
 class ClassicGA(GeneticAlgorithm):
     def __init__(self, fitness_func, chromosome_length, population_size=50, crossover_rate=0.8, mutation_rate=0.1,
-                 max_generations=100):
+                 max_generations=100, seed=None, evaluator=None, cache=None,
+                 selection='roulette', genome='binary', early_stopping=None, checkpoint=None, profiler=None):
         super().__init__(fitness_func, chromosome_length, population_size, crossover_rate, mutation_rate,
-                        elitism=False, max_generations=max_generations)
+                        elitism=False, max_generations=max_generations, seed=seed, evaluator=evaluator,
+                        cache=cache, selection=selection, genome=genome,
+                        early_stopping=early_stopping, checkpoint=checkpoint, profiler=profiler)
 class ElitistGA(GeneticAlgorithm):
     def __init__(self, fitness_func, chromosome_length, population_size=50, crossover_rate=0.8, mutation_rate=0.1,
-                 elitism_size=2, max_generations=100):
+                 elitism_size=2, max_generations=100, seed=None, evaluator=None, cache=None,
+                 selection='roulette', genome='binary', early_stopping=None, checkpoint=None, profiler=None):
         super().__init__(fitness_func, chromosome_length, population_size, crossover_rate, mutation_rate,
-                        elitism=True, elitism_size=elitism_size, max_generations=max_generations)
+                        elitism=True, elitism_size=elitism_size, max_generations=max_generations, seed=seed,
+                        evaluator=evaluator, cache=cache, selection=selection, genome=genome,
+                        early_stopping=early_stopping, checkpoint=checkpoint, profiler=profiler)
 class SteadyStateGA(GeneticAlgorithm):
     def __init__(self, fitness_func, chromosome_length, population_size=50, crossover_rate=0.8, mutation_rate=0.1,
-                 max_generations=100):
+                 max_generations=100, seed=None, evaluator=None, cache=None,
+                 selection='roulette', genome='binary', early_stopping=None, checkpoint=None, profiler=None):
         super().__init__(fitness_func, chromosome_length, population_size, crossover_rate, mutation_rate,
-                        elitism=False, max_generations=max_generations)
+                        elitism=False, max_generations=max_generations, seed=seed, evaluator=evaluator,
+                        cache=cache, selection=selection, genome=genome,
+                        early_stopping=early_stopping, checkpoint=checkpoint, profiler=profiler)
     def _select_survivors(self, population, fitness_values, offspring, offspring_fitness):
         new_population = population.copy()
-        for child in offspring:
+        for child, child_fitness in zip(offspring, offspring_fitness):
             worst_index = np.argmin(fitness_values)
             new_population[worst_index] = child
-            fitness_values[worst_index] = self.fitness_func(self._decode(child))
-        return new_population
-    def run(self):
-        for generation in range(self.max_generations):
-            fitness_values = self._evaluate_fitness(self.population)
-            self.best_fitness_history.append(max(fitness_values))
-            self.average_fitness_history.append(sum(fitness_values)/len(fitness_values))
-            parents = self._select_parents(self.population, fitness_values)
-            offspring = []
-            for parent1, parent2 in parents[:2]:
-                child1, child2 = self._crossover(parent1, parent2)
-                offspring.extend([self._mutate(child1), self._mutate(child2)])
-            self.population = self._select_survivors(self.population, fitness_values, offspring, [])
-        final_fitness = self._evaluate_fitness(self.population)
-        best_index = np.argmax(final_fitness)
-        return {
-            'best_chromosome': self.population[best_index],
-            'best_fitness': final_fitness[best_index],
-            'best_fitness_history': self.best_fitness_history,
-            'average_fitness_history': self.average_fitness_history
-        }
+            fitness_values[worst_index] = child_fitness
+        return new_population, fitness_values
+    def _generation(self):
+        fitness_values = self._evaluate_fitness(self.population)
+        self._record(fitness_values)
+        parents = self._select_parents(self.population, fitness_values, count=2)
+        offspring = self._breed(self.population, parents)
+        offspring_fitness = self._evaluate_fitness(offspring)
+        with self._phase('survivors'):
+            self.population, _ = self._select_survivors(self.population, fitness_values, offspring, offspring_fitness)
 class AdaptiveMutationGA(GeneticAlgorithm):
     def __init__(self, fitness_func, chromosome_length, population_size=50, crossover_rate=0.8, initial_mutation_rate=0.1,
-                 elitism=False, elitism_size=1, max_generations=100):
+                 elitism=False, elitism_size=1, max_generations=100, seed=None, evaluator=None, cache=None,
+                 selection='roulette', genome='binary', early_stopping=None, checkpoint=None, profiler=None):
         super().__init__(fitness_func, chromosome_length, population_size, crossover_rate, initial_mutation_rate,
-                        elitism, elitism_size, max_generations)
+                        elitism, elitism_size, max_generations, seed, evaluator, cache, selection, genome,
+                        early_stopping, checkpoint, profiler)
         self.initial_mutation_rate = initial_mutation_rate
-    def run(self):
-        for generation in range(self.max_generations):
-            fitness_values = self._evaluate_fitness(self.population)
-            self.best_fitness_history.append(max(fitness_values))
-            self.average_fitness_history.append(sum(fitness_values)/len(fitness_values))
-            diversity = len(set(self.population)) / self.population_size
+    def _generation(self):
+        fitness_values = self._evaluate_fitness(self.population)
+        self._record(fitness_values)
+        with self._phase('mutation'):
+            diversity = self._diversity(self.population)
             self.mutation_rate = self.initial_mutation_rate * (1 + (1 - diversity) * 2)
-            parents = self._select_parents(self.population, fitness_values)
-            offspring = []
-            for parent1, parent2 in parents:
-                child1, child2 = self._crossover(parent1, parent2)
-                offspring.extend([self._mutate(child1), self._mutate(child2)])
-            offspring_fitness = self._evaluate_fitness(offspring)
-            if self.elitism:
-                elites = [self.population[i] for i in np.argsort(fitness_values)[::-1][:self.elitism_size]]
-                self.population = self._select_survivors(self.population, fitness_values, offspring, offspring_fitness)
-                for i, elite in enumerate(elites):
-                    self.population[i] = elite
-            else:
-                self.population = self._select_survivors(self.population, fitness_values, offspring, offspring_fitness)
-        final_fitness = self._evaluate_fitness(self.population)
-        best_index = np.argmax(final_fitness)
-        return {
-            'best_chromosome': self.population[best_index],
-            'best_fitness': final_fitness[best_index],
-            'best_fitness_history': self.best_fitness_history,
-            'average_fitness_history': self.average_fitness_history
-        }
\ No newline at end of file
+        parents = self._select_parents(self.population, fitness_values)
+        offspring = self._breed(self.population, parents)
+        offspring_fitness = self._evaluate_fitness(offspring)
+        self._replace_population(fitness_values, offspring, offspring_fitness)
@@ -0,0 +1,198 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
+
+@lru_cache(maxsize=None)
+def _powers(length):
+    # Bit i of the decoded value is column length-1-i, so decoding matches int(chromosome, 2).
+    # Past 63 bits the powers are Python ints and the dot product runs on object arrays.
+    powers = [1 << i for i in range(length - 1, -1, -1)]
+    return np.array(powers, dtype=np.int64 if length < 64 else object)
+def _segments(rng, count, length):
+    """Random cut points start < end per row; the segment is columns start..end-1"""
+    cuts = np.sort(rng.integers(0, length + 1, size=(count, 2)), axis=1)
+    equal = cuts[:, 0] == cuts[:, 1]
+    cuts[equal, 1] = np.minimum(cuts[equal, 0] + 1, length)
+    cuts[equal, 0] = cuts[equal, 1] - 1
+    return cuts[:, 0], cuts[:, 1]
+class Genome(ABC):
+    """Encoding of a chromosome as a row of a (population, length) NumPy array.
+
+    A genome creates random populations, decodes them into the values passed to the fitness
+    function, and implements crossover and mutation on whole arrays of parents at once.
+    Subclasses must implement initialize, crossover and mutate; one that misses any of them
+    cannot be instantiated.
+    """
+    @abstractmethod
+    def initialize(self, rng, size, length):
+        """Random population of shape (size, length)"""
+    def decode(self, population):
+        return population
+    @abstractmethod
+    def crossover(self, rng, parents1, parents2, rate):
+        """Two children per pair of rows; pairs cross with probability rate, otherwise the children are copies"""
+    @abstractmethod
+    def mutate(self, rng, population, rate):
+        """Mutated copy of population"""
+    def format(self, chromosome):
+        return chromosome.tolist()
+    def pack(self, population):
+        """Rows as uint8 byte strings, used as fitness cache keys"""
+        population = np.ascontiguousarray(population)
+        return population.view(np.uint8).reshape(len(population), -1)
+    def diversity(self, population):
+        """Fraction of distinct chromosomes in the population"""
+        packed = np.ascontiguousarray(self.pack(population))
+        rows = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        return len(np.unique(rows)) / len(population)
+class BinaryGenome(Genome):
+    """Bitstrings decoded as one unsigned integer; one-point crossover and bit-flip mutation.
+
+    mutation rate is the probability of flipping each bit.
+    """
+    def initialize(self, rng, size, length):
+        return rng.integers(0, 2, size=(size, length), dtype=np.uint8)
+    def decode(self, population):
+        powers = _powers(population.shape[1])
+        return population @ powers if powers.dtype != object else population.astype(object) @ powers
+    def crossover(self, rng, parents1, parents2, rate):
+        count, length = parents1.shape
+        if length < 2:
+            return parents1.copy(), parents2.copy()
+        crossing = rng.random(count) < rate
+        points = rng.integers(1, length, size=count)
+        swap = (np.arange(length) >= points[:, None]) & crossing[:, None]
+        return np.where(swap, parents2, parents1), np.where(swap, parents1, parents2)
+    def mutate(self, rng, population, rate):
+        return population ^ (rng.random(population.shape) < rate).astype(np.uint8)
+    def format(self, chromosome):
+        return ''.join('1' if bit else '0' for bit in chromosome)
+    def pack(self, population):
+        return np.packbits(population, axis=1)
+class RealGenome(Genome):
+    """Real-valued vectors within [low, high]; simulated binary crossover and Gaussian mutation.
+
+    low and high are scalars or per-gene arrays. eta is the SBX distribution index: larger values
+    keep children closer to their parents. mutation rate is the probability of perturbing each gene
+    by a normal step with standard deviation sigma * (high - low). Children are clipped to the bounds.
+    """
+    def __init__(self, low=0.0, high=1.0, eta=15.0, sigma=0.1):
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        if np.any(self.high < self.low):
+            raise ValueError("high must not be below low")
+        self.eta = eta
+        self.sigma = sigma
+    def initialize(self, rng, size, length):
+        low, high = np.broadcast_to(self.low, length), np.broadcast_to(self.high, length)
+        return rng.uniform(low, high, size=(size, length))
+    def crossover(self, rng, parents1, parents2, rate):
+        count, length = parents1.shape
+        u = rng.random((count, length))
+        beta = np.where(u <= 0.5, (2 * u) ** (1 / (self.eta + 1)), (1 / (2 * (1 - u))) ** (1 / (self.eta + 1)))
+        # Each gene of a crossing pair is recombined with probability 1/2, as in the usual SBX variant
+        recombine = (rng.random(count) < rate)[:, None] & (rng.random((count, length)) < 0.5)
+        mean = (parents1 + parents2) / 2
+        spread = beta * (parents1 - parents2) / 2
+        # Genes that are not recombined are copied exactly rather than rebuilt from mean and spread
+        child1 = np.where(recombine, mean + spread, parents1)
+        child2 = np.where(recombine, mean - spread, parents2)
+        return np.clip(child1, self.low, self.high), np.clip(child2, self.low, self.high)
+    def mutate(self, rng, population, rate):
+        mutating = rng.random(population.shape) < rate
+        steps = rng.normal(0.0, 1.0, population.shape) * (self.sigma * (self.high - self.low))
+        return np.clip(population + mutating * steps, self.low, self.high)
+class PermutationGenome(Genome):
+    """Permutations of 0..length-1, e.g. city orders for TSP or job orders for scheduling.
+
+    crossover is 'ox' (order crossover) or 'pmx' (partially mapped crossover); mutation is 'swap'
+    (exchange two positions) or 'inversion' (reverse a segment). mutation rate is the probability
+    that a chromosome is mutated once.
+    """
+    CROSSOVERS = ('ox', 'pmx')
+    MUTATIONS = ('swap', 'inversion')
+    def __init__(self, crossover='ox', mutation='swap'):
+        if crossover not in self.CROSSOVERS:
+            raise ValueError(f"unknown permutation crossover {crossover!r}, expected one of {self.CROSSOVERS}")
+        if mutation not in self.MUTATIONS:
+            raise ValueError(f"unknown permutation mutation {mutation!r}, expected one of {self.MUTATIONS}")
+        self.crossover_operator = crossover
+        self.mutation_operator = mutation
+    def initialize(self, rng, size, length):
+        return rng.permuted(np.tile(np.arange(length, dtype=np.int64), (size, 1)), axis=1)
+    def crossover(self, rng, parents1, parents2, rate):
+        count, length = parents1.shape
+        if length < 2:
+            return parents1.copy(), parents2.copy()
+        crossing = np.flatnonzero(rng.random(count) < rate)
+        start, end = _segments(rng, len(crossing), length)
+        child1, child2 = parents1.copy(), parents2.copy()
+        operator = self._order_crossover if self.crossover_operator == 'ox' else self._partially_mapped_crossover
+        child1[crossing] = operator(parents1[crossing], parents2[crossing], start, end)
+        child2[crossing] = operator(parents2[crossing], parents1[crossing], start, end)
+        return child1, child2
+    def _order_crossover(self, donor, other, start, end):
+        """Copy donor[start:end], then fill the other positions from end onwards with the other parent's
+        remaining genes in their order from end onwards"""
+        count, length = donor.shape
+        rows = np.arange(count)[:, None]
+        columns = np.arange(length)
+        kept = (columns >= start[:, None]) & (columns < end[:, None])
+        in_segment = np.zeros((count, length), dtype=bool)
+        in_segment[rows, donor] = kept
+        rotation = (end[:, None] + columns) % length
+        other_rotated = other[rows, rotation]
+        # A stable argsort of the boolean masks puts the genes and positions to fill first, in order
+        genes = np.take_along_axis(other_rotated, np.argsort(in_segment[rows, other_rotated], axis=1, kind='stable'), 1)
+        positions = np.take_along_axis(rotation, np.argsort(kept[rows, rotation], axis=1, kind='stable'), 1)
+        filling = columns < (length - (end - start))[:, None]
+        child = donor.copy()
+        child[np.broadcast_to(rows, filling.shape)[filling], positions[filling]] = genes[filling]
+        return child
+    def _partially_mapped_crossover(self, donor, other, start, end):
+        """Copy donor[start:end] into the other parent; genes outside the segment that clash are mapped
+        through the segment (donor gene -> other gene at the same position) until they no longer clash"""
+        count, length = donor.shape
+        rows = np.arange(count)[:, None]
+        columns = np.arange(length)
+        kept = (columns >= start[:, None]) & (columns < end[:, None])
+        mapping = np.broadcast_to(columns, (count, length)).copy()
+        mapping[rows, donor] = np.where(kept, other, donor)
+        # Genes outside the donor segment map to themselves, so a chain ends after at most segment-length
+        # steps; composing the mapping with itself k times follows chains of 2**k steps
+        for _ in range(int((end - start).max(initial=0)).bit_length()):
+            mapping = mapping[rows, mapping]
+        return np.where(kept, donor, mapping[rows, other])
+    def mutate(self, rng, population, rate):
+        count, length = population.shape
+        mutating = np.flatnonzero(rng.random(count) < rate)
+        population = population.copy()
+        if length < 2 or not len(mutating):
+            return population
+        # Two distinct positions, so every mutation changes the chromosome
+        first = rng.integers(0, length, size=len(mutating))
+        second = (first + rng.integers(1, length, size=len(mutating))) % length
+        if self.mutation_operator == 'swap':
+            population[mutating, first], population[mutating, second] = (population[mutating, second],
+                                                                         population[mutating, first])
+        else:
+            start, end = np.minimum(first, second), np.maximum(first, second) + 1
+            columns = np.arange(length)
+            inside = (columns >= start[:, None]) & (columns < end[:, None])
+            source = np.where(inside, (start + end - 1)[:, None] - columns, columns)
+            population[mutating] = population[mutating[:, None], source]
+        return population
+GENOMES = {
+    'binary': BinaryGenome,
+    'real': RealGenome,
+    'permutation': PermutationGenome,
+}
+def get_genome(genome):
+    """Resolve a name from GENOMES with default parameters, or pass through a Genome instance"""
+    if isinstance(genome, Genome):
+        return genome
+    try:
+        return GENOMES[genome]()
+    except KeyError:
+        raise ValueError(f"unknown genome {genome!r}, expected one of {sorted(GENOMES)} or a Genome instance") from None
@@ -0,0 +1,139 @@
+import multiprocessing
+import queue
+
+import numpy as np
+
+from genetic_algorithms import ElitistGA
+
+TOPOLOGIES = ('ring', 'fully_connected')
+
+def migration_targets(islands, topology):
+    """targets[i] lists the islands that island i sends its emigrants to"""
+    if topology == 'ring':
+        return [[(i + 1) % islands] if islands > 1 else [] for i in range(islands)]
+    if topology == 'fully_connected':
+        return [[j for j in range(islands) if j != i] for i in range(islands)]
+    raise ValueError(f"unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+def _epochs(generations, migration_interval):
+    # Lengths of the runs between migrations; the last one may be shorter
+    full, rest = divmod(generations, migration_interval)
+    return [migration_interval] * full + ([rest] if rest else [])
+def _island_result(index, algorithm):
+    result = algorithm._result()
+    result['island'] = index
+    result['population'] = algorithm.population
+    return result
+def _padded(histories):
+    # Islands stopped early by early_stopping keep their last value for the remaining generations
+    length = max(len(history) for history in histories)
+    return np.array([list(history) + [history[-1]] * (length - len(history)) for history in histories])
+def _run_island(index, algorithm_class, kwargs, seed, generations, migration_interval, migration_size,
+                targets, senders, inboxes, results):
+    algorithm = algorithm_class(seed=seed, **kwargs)
+    epochs = _epochs(generations, migration_interval)
+    for epoch, length in enumerate(epochs):
+        algorithm.evolve(length)
+        if epoch == len(epochs) - 1 or not migration_size:
+            continue
+        # Synchronous migration: queues are unbounded, so every island can post before it waits
+        emigrants = algorithm.emigrants(migration_size)
+        for target in targets:
+            inboxes[target].put((index, emigrants))
+        arrivals = sorted(inboxes[index].get() for _ in range(senders))
+        if arrivals:
+            algorithm.immigrate(np.concatenate([migrants for _, migrants in arrivals]))
+    results.put(_island_result(index, algorithm))
+class IslandModel:
+    """Island-model GA: independent populations that exchange their best individuals.
+
+    Each island runs algorithm_class(fitness_func, chromosome_length, **kwargs) for `generations`
+    generations. Every migration_interval generations, each island sends copies of its
+    migration_size best individuals to its neighbours in the topology ('ring' or 'fully_connected').
+    The arrivals replace the receiver's worst individuals. Migration is synchronous, so a run with
+    a given seed is reproducible. With processes=True each island runs in its own process
+    (fitness_func and kwargs must be picklable); otherwise the islands take turns in this process.
+    """
+    def __init__(self, fitness_func, chromosome_length, islands=4, algorithm_class=ElitistGA, generations=100,
+                 migration_interval=10, migration_size=2, topology='ring', processes=True, seed=None, **kwargs):
+        if generations < 1:
+            raise ValueError(f"generations must be positive, got {generations}")
+        if migration_interval <= 0:
+            raise ValueError(f"migration_interval must be positive, got {migration_interval}")
+        if kwargs.get('checkpoint') is not None:
+            raise ValueError("islands cannot share one checkpoint file")
+        self.islands = islands
+        self.algorithm_class = algorithm_class
+        self.generations = generations
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.targets = migration_targets(islands, topology)
+        self.processes = processes
+        self.kwargs = dict(kwargs, fitness_func=fitness_func, chromosome_length=chromosome_length,
+                           max_generations=generations)
+        self.seeds = np.random.SeedSequence(seed).spawn(islands)
+    def _senders(self):
+        counts = [0] * self.islands
+        for targets in self.targets:
+            for target in targets:
+                counts[target] += 1
+        return counts
+    def _run_in_process(self):
+        algorithms = [self.algorithm_class(seed=seed, **self.kwargs) for seed in self.seeds]
+        epochs = _epochs(self.generations, self.migration_interval)
+        for epoch, length in enumerate(epochs):
+            for algorithm in algorithms:
+                algorithm.evolve(length)
+            if epoch == len(epochs) - 1 or not self.migration_size:
+                continue
+            emigrants = [algorithm.emigrants(self.migration_size) for algorithm in algorithms]
+            arrivals = [[] for _ in algorithms]
+            for source, targets in enumerate(self.targets):
+                for target in targets:
+                    arrivals[target].append(emigrants[source])
+            for algorithm, migrants in zip(algorithms, arrivals):
+                if migrants:
+                    algorithm.immigrate(np.concatenate(migrants))
+        return [_island_result(index, algorithm) for index, algorithm in enumerate(algorithms)]
+    def _run_processes(self):
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(self.islands)]
+        results = context.Queue()
+        senders = self._senders()
+        workers = [context.Process(target=_run_island,
+                                   args=(index, self.algorithm_class, self.kwargs, self.seeds[index], self.generations,
+                                         self.migration_interval, self.migration_size, self.targets[index],
+                                         senders[index], inboxes, results))
+                   for index in range(self.islands)]
+        for worker in workers:
+            worker.start()
+        island_results = []
+        try:
+            # Drain the results before joining: a process does not exit until its queued data is consumed.
+            # If an island dies, its neighbours would wait for its migrants forever, so stop everything.
+            while len(island_results) < len(workers):
+                try:
+                    island_results.append(results.get(timeout=0.5))
+                except queue.Empty:
+                    failed = [worker.exitcode for worker in workers if worker.exitcode]
+                    if failed:
+                        raise RuntimeError(f"{len(failed)} island process(es) exited with codes {failed}") from None
+        finally:
+            for worker in workers:
+                if len(island_results) < len(workers):
+                    worker.terminate()
+                worker.join()
+        return sorted(island_results, key=lambda result: result['island'])
+    def run(self):
+        island_results = self._run_processes() if self.processes else self._run_in_process()
+        best = max(island_results, key=lambda result: result['best_fitness'])
+        best_history = _padded([result['best_fitness_history'] for result in island_results]).max(axis=0)
+        average_history = _padded([result['average_fitness_history'] for result in island_results]).mean(axis=0)
+        return {
+            'best_chromosome': best['best_chromosome'],
+            'best_fitness': best['best_fitness'],
+            'best_island': best['island'],
+            'best_fitness_history': best_history.tolist(),
+            'average_fitness_history': average_history.tolist(),
+            'island_results': island_results
+        }
@@ -0,0 +1,44 @@
+import time
+from contextlib import contextmanager
+
+PHASES = ('selection', 'crossover', 'mutation', 'evaluation', 'survivors')
+
+class GenerationProfiler:
+    """Wall time of each phase of every generation.
+
+    Pass it as profiler= to any GeneticAlgorithm. After each generation a record
+    {'generation', 'selection', 'crossover', 'mutation', 'evaluation', 'survivors', 'other', 'total'}
+    (seconds) is appended to records and passed to callback(record) if one is given, e.g. to log
+    progress. Work outside a generation, such as the final evaluation in run(), is not recorded.
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.records = []
+        self._current = None
+        self._begin = None
+    def start_generation(self, generation):
+        self._current = {'generation': generation, **dict.fromkeys(PHASES, 0.0)}
+        self._begin = time.perf_counter()
+    def end_generation(self):
+        record = self._current
+        record['total'] = time.perf_counter() - self._begin
+        record['other'] = max(record['total'] - sum(record[phase] for phase in PHASES), 0.0)
+        self._current = None
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+    @contextmanager
+    def phase(self, name):
+        if self._current is None:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] += time.perf_counter() - begin
+    def summary(self):
+        """Total seconds per phase over all recorded generations, with each phase's share of the total"""
+        totals = {key: sum(record[key] for record in self.records) for key in PHASES + ('other', 'total')}
+        fractions = {key: totals[key] / totals['total'] if totals['total'] else 0.0 for key in PHASES + ('other',)}
+        return {'generations': len(self.records), 'totals': totals, 'fractions': fractions}
@@ -0,0 +1,104 @@
+import numpy as np
+
+def _selection_weights(fitness):
+    """Non-negative weights for fitness-proportional selection.
+
+    Negative fitness values are shifted so the worst individual gets weight 0; if every weight is 0
+    the selection is uniform.
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    minimum = fitness.min()
+    weights = fitness - minimum if minimum < 0 else fitness
+    if weights.sum() <= 0:
+        return np.ones(len(fitness))
+    return weights
+class AliasTable:
+    """Walker/Vose alias table: O(n) to build, O(1) per sample.
+
+    Each column i holds prob[i] of its own mass and 1 - prob[i] of alias[i]. The table is built in
+    vectorized rounds: every small column (mass < 1) takes its deficit from the large column whose
+    cumulative surplus covers it, and large columns that drop below 1 are handled in the next round.
+    """
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        n = len(weights)
+        scaled = weights * (n / weights.sum())
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+        small = np.flatnonzero(scaled < 1)
+        large = np.flatnonzero(scaled > 1)
+        while len(small) and len(large):
+            deficit = 1 - scaled[small]
+            consumed_before = np.cumsum(deficit) - deficit
+            surplus = np.cumsum(scaled[large] - 1)
+            donor = np.searchsorted(surplus, consumed_before, side='right')
+            assigned = donor < len(large)
+            if not assigned.any():
+                break
+            taker = small[assigned]
+            self.prob[taker] = scaled[taker]
+            self.alias[taker] = large[donor[assigned]]
+            scaled[large] -= np.bincount(donor[assigned], weights=deficit[assigned], minlength=len(large))
+            small = np.concatenate([small[~assigned], large[scaled[large] < 1]])
+            large = large[scaled[large] > 1]
+        # Columns left over by rounding keep their own index with probability 1
+    def sample(self, rng, count):
+        columns = rng.integers(0, len(self.prob), size=count)
+        return np.where(rng.random(count) < self.prob[columns], columns, self.alias[columns])
+def roulette_selection(rng, fitness, count):
+    """Fitness-proportional selection with an alias table: O(n + count)"""
+    return AliasTable(_selection_weights(fitness)).sample(rng, count)
+def stochastic_universal_sampling(rng, fitness, count):
+    """Fitness-proportional selection with count evenly spaced pointers and one random offset.
+
+    Every individual is selected floor or ceil of its expected number of times. The result is
+    shuffled so consecutive indices can be paired as parents.
+    """
+    cumulative = np.cumsum(_selection_weights(fitness))
+    step = cumulative[-1] / count
+    pointers = (rng.random() + np.arange(count)) * step
+    selected = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(cumulative) - 1)
+    rng.shuffle(selected)
+    return selected
+def rank_selection(rng, fitness, count):
+    """Linear ranking: the worst individual has weight 1, the best weight n, independent of fitness scale"""
+    ranks = np.empty(len(fitness))
+    ranks[np.argsort(fitness, kind='stable')] = np.arange(1, len(fitness) + 1)
+    return AliasTable(ranks).sample(rng, count)
+def tournament_selection(rng, fitness, count, tournament_size=2):
+    """Winner of tournament_size uniformly drawn contestants (with replacement), for count tournaments at once"""
+    fitness = np.asarray(fitness)
+    contestants = rng.integers(0, len(fitness), size=(count, tournament_size))
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+def top_k(fitness, k):
+    """Indices of the k largest fitness values in no particular order, O(n) with argpartition"""
+    fitness = np.asarray(fitness)
+    if k >= len(fitness):
+        return np.arange(len(fitness))
+    if k <= 0:
+        return np.arange(0)
+    return np.argpartition(fitness, len(fitness) - k)[len(fitness) - k:]
+def bottom_k(fitness, k):
+    """Indices of the k smallest fitness values in no particular order"""
+    fitness = np.asarray(fitness)
+    if k >= len(fitness):
+        return np.arange(len(fitness))
+    if k <= 0:
+        return np.arange(0)
+    return np.argpartition(fitness, k - 1)[:k]
+SELECTION_OPERATORS = {
+    'roulette': roulette_selection,
+    'sus': stochastic_universal_sampling,
+    'rank': rank_selection,
+    'tournament': tournament_selection,
+}
+def get_selection_operator(selection):
+    """Resolve a name from SELECTION_OPERATORS, or pass through a callable selection(rng, fitness, count)"""
+    if callable(selection):
+        return selection
+    try:
+        return SELECTION_OPERATORS[selection]
+    except KeyError:
+        raise ValueError(f"unknown selection operator {selection!r}, expected one of {sorted(SELECTION_OPERATORS)} "
+                         f"or a callable") from None
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from fitness_cache import FitnessCache
+from genetic_algorithms import ClassicGA, SteadyStateGA
+
+def onemax(x):
+    return bin(x).count('1')
+def counting(calls):
+    def evaluate_rows(rows):
+        calls.append(rows.copy())
+        return rows.sum(axis=1).astype(float)
+    return evaluate_rows
+def rows(*values, length=8):
+    return np.array([[(value >> (length - 1 - i)) & 1 for i in range(length)] for value in values], dtype=np.uint8)
+def test_hits_misses_and_duplicates():
+    cache = FitnessCache()
+    calls = []
+    population = rows(1, 3, 1, 7, 3)
+    assert cache.evaluate(population, counting(calls)).tolist() == [1, 2, 1, 3, 2]
+    # Duplicates within a population are evaluated once, in order of first appearance
+    assert len(calls) == 1 and calls[0].tolist() == rows(1, 3, 7).tolist()
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 3
+    assert cache.evaluate(rows(7, 15, 1), counting(calls)).tolist() == [3, 4, 1]
+    assert calls[1].tolist() == rows(15).tolist()
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (4, 4, 4)
+    assert stats['hit_rate'] == 0.5
+    cache.evaluate(rows(1, 3), counting(calls))
+    assert len(calls) == 2
+def test_least_recently_used_entry_is_evicted():
+    cache = FitnessCache(maxsize=3)
+    calls = []
+    cache.evaluate(rows(1, 2, 3), counting(calls))
+    cache.evaluate(rows(1), counting(calls))
+    cache.evaluate(rows(4), counting(calls))
+    assert cache.stats()['evictions'] == 1 and len(cache) == 3
+    # 2 was the least recently used, so it is the one evaluated again
+    calls.clear()
+    cache.evaluate(rows(1, 3, 4), counting(calls))
+    assert calls == []
+    cache.evaluate(rows(2), counting(calls))
+    assert len(calls) == 1
+def test_rejects_other_chromosome_lengths_and_bad_maxsize():
+    cache = FitnessCache()
+    cache.evaluate(rows(1), counting([]))
+    with pytest.raises(ValueError):
+        cache.evaluate(rows(1, length=9), counting([]))
+    with pytest.raises(ValueError):
+        FitnessCache(maxsize=0)
+    with pytest.raises(ValueError):
+        FitnessCache().save()
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / 'cache.npz'
+    cache = FitnessCache(path=path)
+    cache.evaluate(rows(1, 2, 3, 4), counting([]))
+    cache.evaluate(rows(1), counting([]))
+    cache.save()
+    calls = []
+    warm = FitnessCache(path=path)
+    assert len(warm) == 4 and warm.chromosome_length == 8
+    assert warm.evaluate(rows(4, 3, 2, 1), counting(calls)).tolist() == [1, 2, 1, 1]
+    assert calls == []
+    # Loading into a smaller cache keeps the most recently used entries
+    small = FitnessCache(maxsize=2, path=path)
+    small.evaluate(rows(1, 4), counting(calls))
+    assert calls == []
+    with pytest.raises(ValueError):
+        other = FitnessCache()
+        other.evaluate(rows(1, length=9), counting([]))
+        other.load(path)
+@pytest.mark.parametrize('algorithm_class', [ClassicGA, SteadyStateGA])
+def test_cached_run_matches_uncached_run(algorithm_class):
+    def run(cache):
+        return algorithm_class(onemax, 12, population_size=20, max_generations=20, seed=9, cache=cache).run()
+    cache = FitnessCache()
+    result = run(cache)
+    expected = run(None)
+    assert result['best_chromosome'] == expected['best_chromosome']
+    assert result['average_fitness_history'] == expected['average_fitness_history']
+    assert cache.stats()['hits'] > 0
@@ -0,0 +1,62 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from fitness_evaluators import SerialEvaluator, VectorizedEvaluator, ProcessPoolEvaluator, AsyncioEvaluator
+from genetic_algorithms import ElitistGA
+
+def onemax(x):
+    return bin(x).count('1')
+def onemax_vectorized(decoded):
+    return np.array([bin(x).count('1') for x in decoded.tolist()])
+async def onemax_async(x):
+    await asyncio.sleep(0)
+    return bin(x).count('1')
+DECODED = np.arange(37, dtype=np.int64) * 12345
+EXPECTED = [bin(x).count('1') for x in DECODED.tolist()]
+def test_serial_evaluator():
+    fitness = SerialEvaluator().evaluate(onemax, DECODED)
+    assert fitness.dtype == float and fitness.tolist() == EXPECTED
+@pytest.mark.parametrize('batch_size', [None, 1, 5, 37, 100])
+def test_vectorized_evaluator_batches(batch_size):
+    sizes = []
+    def fitness_func(decoded):
+        sizes.append(len(decoded))
+        return onemax_vectorized(decoded)
+    assert VectorizedEvaluator(batch_size).evaluate(fitness_func, DECODED).tolist() == EXPECTED
+    assert sum(sizes) == len(DECODED)
+    assert max(sizes) == min(batch_size or len(DECODED), len(DECODED))
+def test_vectorized_evaluator_rejects_wrong_shape():
+    with pytest.raises(ValueError):
+        VectorizedEvaluator().evaluate(lambda decoded: np.zeros(3), DECODED)
+    with pytest.raises(ValueError):
+        VectorizedEvaluator().evaluate(lambda decoded: np.zeros((len(decoded), 1)), DECODED)
+@pytest.mark.parametrize('batch_size', [None, 4])
+def test_process_pool_evaluator(batch_size):
+    with ProcessPoolEvaluator(max_workers=2, batch_size=batch_size) as evaluator:
+        assert evaluator.evaluate(onemax, DECODED).tolist() == EXPECTED
+        assert evaluator.evaluate(onemax, DECODED[:3]).tolist() == EXPECTED[:3]
+    assert evaluator._executor is None
+@pytest.mark.parametrize('concurrency, batch_size', [(64, None), (2, 5)])
+def test_asyncio_evaluator(concurrency, batch_size):
+    in_flight = peak = 0
+    async def fitness_func(x):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return bin(x).count('1')
+    assert AsyncioEvaluator(concurrency, batch_size).evaluate(fitness_func, DECODED).tolist() == EXPECTED
+    assert peak <= concurrency
+def test_evaluators_give_the_same_run():
+    def run(fitness_func, evaluator):
+        return ElitistGA(fitness_func, 20, population_size=16, max_generations=5, seed=5, evaluator=evaluator).run()
+    expected = run(onemax, None)
+    with ProcessPoolEvaluator(max_workers=2) as pool:
+        results = [run(onemax_vectorized, VectorizedEvaluator(batch_size=7)), run(onemax, pool),
+                   run(onemax_async, AsyncioEvaluator(batch_size=5))]
+    for result in results:
+        assert result['best_chromosome'] == expected['best_chromosome']
+        assert result['average_fitness_history'] == expected['average_fitness_history']
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from genetic_algorithms import ClassicGA, ElitistGA, SteadyStateGA, AdaptiveMutationGA
+
+ALGORITHMS = [ClassicGA, ElitistGA, SteadyStateGA, AdaptiveMutationGA]
+
+def onemax(x):
+    return bin(x).count('1')
+def test_decode_matches_int_of_bit_string():
+    for length in (1, 8, 63, 64, 100):
+        algorithm = ClassicGA(onemax, length, population_size=20, seed=length)
+        decoded = algorithm._decode(algorithm.population)
+        expected = [int(''.join(map(str, row)), 2) for row in algorithm.population.tolist()]
+        assert [int(value) for value in decoded] == expected
+def test_one_point_crossover_swaps_tails():
+    algorithm = ClassicGA(onemax, 12, population_size=200, crossover_rate=1.0, seed=1)
+    parents1 = np.zeros((200, 12), dtype=np.uint8)
+    parents2 = np.ones((200, 12), dtype=np.uint8)
+    child1, child2 = algorithm._crossover(parents1, parents2)
+    # Every child is a head of one parent followed by the tail of the other, cut strictly inside
+    assert (child1 + child2 == 1).all()
+    cuts = child1.argmax(axis=1)
+    assert ((cuts >= 1) & (cuts <= 11)).all()
+    assert (child1 == (np.arange(12) >= cuts[:, None])).all()
+    algorithm.crossover_rate = 0.0
+    child1, child2 = algorithm._crossover(parents1, parents2)
+    assert (child1 == parents1).all() and (child2 == parents2).all()
+def test_mutation_flips_bits_at_the_given_rate():
+    algorithm = ClassicGA(onemax, 50, population_size=400, seed=2)
+    population = algorithm.population.copy()
+    algorithm.mutation_rate = 0.0
+    assert (algorithm._mutate(population) == population).all()
+    algorithm.mutation_rate = 1.0
+    assert (algorithm._mutate(population) == 1 - population).all()
+    algorithm.mutation_rate = 0.1
+    flipped = (algorithm._mutate(population) != population).mean()
+    assert abs(flipped - 0.1) < 0.01
+def test_diversity_counts_distinct_chromosomes():
+    algorithm = AdaptiveMutationGA(onemax, 10, population_size=4, seed=0)
+    population = np.array([[0] * 10, [0] * 10, [1] * 10, [1] + [0] * 9], dtype=np.uint8)
+    assert algorithm._diversity(population) == 0.75
+@pytest.mark.parametrize('algorithm_class', ALGORITHMS)
+def test_run_is_reproducible_and_keeps_population_shape(algorithm_class):
+    results = [algorithm_class(onemax, 24, population_size=30, max_generations=15, seed=7).run() for _ in range(2)]
+    assert results[0]['best_chromosome'] == results[1]['best_chromosome']
+    assert results[0]['average_fitness_history'] == results[1]['average_fitness_history']
+    result = results[0]
+    assert len(result['best_fitness_history']) == len(result['average_fitness_history']) == 15
+    assert len(result['best_chromosome']) == 24 and set(result['best_chromosome']) <= {'0', '1'}
+    assert result['best_fitness'] == onemax(int(result['best_chromosome'], 2))
+def test_elitism_never_loses_the_best_individual():
+    algorithm = ElitistGA(onemax, 32, population_size=40, max_generations=40, mutation_rate=0.3, seed=3)
+    history = algorithm.run()['best_fitness_history']
+    assert all(later >= earlier for earlier, later in zip(history, history[1:]))
+def test_engine_improves_onemax():
+    result = ElitistGA(onemax, 32, population_size=60, max_generations=60, seed=4).run()
+    assert result['best_fitness'] >= 28
+    assert np.mean(result['average_fitness_history'][-5:]) > result['average_fitness_history'][0]
@@ -0,0 +1,111 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from fitness_evaluators import SerialEvaluator, VectorizedEvaluator, ProcessPoolEvaluator, AsyncioEvaluator
+from genetic_algorithms import ElitistGA, SteadyStateGA
+from genomes import Genome, BinaryGenome, RealGenome, PermutationGenome, get_genome
+
+def sphere(x):
+    return -float(np.sum(x ** 2))
+def sphere_vectorized(population):
+    return -np.sum(population ** 2, axis=1)
+async def sphere_async(x):
+    await asyncio.sleep(0)
+    return -float(np.sum(x ** 2))
+def displacement(x):
+    return -float(np.abs(x - np.arange(len(x))).sum())
+def displacement_vectorized(population):
+    return -np.abs(population - np.arange(population.shape[1])).sum(axis=1)
+async def displacement_async(x):
+    await asyncio.sleep(0)
+    return -float(np.abs(x - np.arange(len(x))).sum())
+def is_permutation(population):
+    return (np.sort(population, axis=1) == np.arange(population.shape[1])).all()
+@pytest.mark.parametrize('genome, fitness, vectorized, asynchronous', [
+    (RealGenome(-5, 5), sphere, sphere_vectorized, sphere_async),
+    (PermutationGenome('pmx', 'inversion'), displacement, displacement_vectorized, displacement_async),
+])
+def test_every_evaluator_runs_every_genome(genome, fitness, vectorized, asynchronous):
+    def run(fitness_func, evaluator):
+        return ElitistGA(fitness_func, 6, population_size=12, max_generations=5, seed=6, genome=genome,
+                         evaluator=evaluator).run()
+    expected = run(fitness, SerialEvaluator())
+    with ProcessPoolEvaluator(max_workers=2, batch_size=5) as pool:
+        results = [run(vectorized, VectorizedEvaluator(batch_size=5)), run(fitness, pool),
+                   run(asynchronous, AsyncioEvaluator(batch_size=5))]
+    for result in results:
+        assert np.allclose(result['best_chromosome'], expected['best_chromosome'])
+        assert np.allclose(result['average_fitness_history'], expected['average_fitness_history'])
+    assert expected['best_fitness'] == fitness(np.array(expected['best_chromosome']))
+def test_real_genome_bounds_and_sbx():
+    rng = np.random.default_rng(0)
+    low, high = np.array([-1.0, 0.0, 10.0]), np.array([1.0, 5.0, 10.5])
+    genome = RealGenome(low, high)
+    population = genome.initialize(rng, 500, 3)
+    assert ((population >= low) & (population <= high)).all()
+    # Unclipped SBX children keep the parents' mean
+    wide = RealGenome(-1e9, 1e9)
+    parents1, parents2 = rng.random((200, 4)), rng.random((200, 4))
+    child1, child2 = wide.crossover(rng, parents1, parents2, 1.0)
+    assert np.allclose(child1 + child2, parents1 + parents2)
+    assert not np.allclose(child1, parents1)
+    child1, child2 = genome.crossover(rng, population[:250], population[250:], 1.0)
+    mutated = genome.mutate(rng, population, 1.0)
+    for children in (child1, child2, mutated):
+        assert ((children >= low) & (children <= high)).all()
+    with pytest.raises(ValueError):
+        RealGenome(1, 0)
+@pytest.mark.parametrize('crossover', PermutationGenome.CROSSOVERS)
+@pytest.mark.parametrize('mutation', PermutationGenome.MUTATIONS)
+def test_permutation_operators_keep_permutations(crossover, mutation):
+    rng = np.random.default_rng(1)
+    genome = PermutationGenome(crossover, mutation)
+    for length in (2, 3, 10, 31):
+        population = genome.initialize(rng, 200, length)
+        assert is_permutation(population)
+        child1, child2 = genome.crossover(rng, population[:100], population[100:], 1.0)
+        assert is_permutation(child1) and is_permutation(child2)
+        mutated = genome.mutate(rng, population, 1.0)
+        assert is_permutation(mutated)
+        assert (mutated != population).any(axis=1).all()
+def test_order_crossover_textbook_example():
+    genome = PermutationGenome('ox')
+    donor = np.array([[0, 1, 2, 3, 4, 5, 6, 7, 8]])
+    other = np.array([[8, 2, 6, 7, 1, 5, 4, 0, 3]])
+    child = genome._order_crossover(donor, other, np.array([3]), np.array([7]))
+    # donor[3:7] stays; the rest is filled from position 7 with other's genes from position 7 onwards
+    assert child.tolist() == [[2, 7, 1, 3, 4, 5, 6, 0, 8]]
+def test_partially_mapped_crossover_textbook_example():
+    genome = PermutationGenome('pmx')
+    donor = np.array([[0, 1, 2, 3, 4, 5, 6, 7, 8]])
+    other = np.array([[8, 2, 6, 7, 1, 5, 4, 0, 3]])
+    child = genome._partially_mapped_crossover(donor, other, np.array([3]), np.array([7]))
+    # 7 -> 3, 1 -> 4 -> 6 are mapped through the segment; 8, 2, 0 keep their places
+    assert child.tolist() == [[8, 2, 1, 3, 4, 5, 6, 0, 7]]
+def test_mutation_and_crossover_rates_of_zero_copy():
+    rng = np.random.default_rng(2)
+    for genome in (BinaryGenome(), RealGenome(), PermutationGenome()):
+        population = genome.initialize(rng, 20, 8)
+        child1, child2 = genome.crossover(rng, population[:10], population[10:], 0.0)
+        assert (child1 == population[:10]).all() and (child2 == population[10:]).all()
+        assert (genome.mutate(rng, population, 0.0) == population).all()
+def test_genome_subclasses_must_implement_operators():
+    class NoMutation(Genome):
+        def initialize(self, rng, size, length):
+            return np.zeros((size, length))
+        def crossover(self, rng, parents1, parents2, rate):
+            return parents1.copy(), parents2.copy()
+    with pytest.raises(TypeError):
+        Genome()
+    with pytest.raises(TypeError):
+        NoMutation()
+def test_steady_state_permutation_run_and_get_genome():
+    result = SteadyStateGA(displacement, 8, population_size=10, max_generations=10, seed=3, genome='permutation').run()
+    assert sorted(result['best_chromosome']) == list(range(8))
+    assert isinstance(get_genome('real'), RealGenome)
+    with pytest.raises(ValueError):
+        get_genome('tree')
+    with pytest.raises(ValueError):
+        PermutationGenome('cx')
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from early_stopping import EarlyStopping
+from checkpointing import Checkpoint
+from genetic_algorithms import ElitistGA, ClassicGA
+from island_model import IslandModel, migration_targets, _epochs, _padded
+
+def onemax(x):
+    return bin(x).count('1')
+def value(x):
+    return x
+def rows(population):
+    return {tuple(row) for row in population.tolist()}
+def test_migration_targets():
+    assert migration_targets(4, 'ring') == [[1], [2], [3], [0]]
+    assert migration_targets(3, 'fully_connected') == [[1, 2], [0, 2], [0, 1]]
+    assert migration_targets(1, 'ring') == [[]]
+    assert migration_targets(1, 'fully_connected') == [[]]
+    with pytest.raises(ValueError):
+        migration_targets(4, 'star')
+def test_epochs_and_padding():
+    assert _epochs(25, 10) == [10, 10, 5]
+    assert _epochs(20, 10) == [10, 10]
+    assert _epochs(3, 10) == [3]
+    assert _padded([[1, 2, 3], [4]]).tolist() == [[1, 2, 3], [4, 4, 4]]
+def test_rejects_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        IslandModel(onemax, 8, generations=0)
+    with pytest.raises(ValueError):
+        IslandModel(onemax, 8, migration_interval=0)
+    with pytest.raises(ValueError):
+        IslandModel(onemax, 8, topology='star')
+    with pytest.raises(ValueError):
+        IslandModel(onemax, 8, checkpoint=Checkpoint(tmp_path / 'run.npz'))
+@pytest.mark.parametrize('migration_size', [0, 3])
+def test_migrants_reach_the_next_island(migration_size):
+    # Without crossover and mutation an island only holds copies of its own and its immigrants' chromosomes.
+    # Fitness values are distinct, so the best emigrant overall is also the best of its new island and is kept as elite.
+    model = IslandModel(value, 40, islands=3, algorithm_class=ElitistGA, generations=4, migration_interval=2,
+                        migration_size=migration_size, processes=False, seed=1, population_size=10,
+                        crossover_rate=0.0, mutation_rate=0.0)
+    initial = [rows(ElitistGA(seed=seed, **model.kwargs).population) for seed in model.seeds]
+    result = model.run()
+    received = []
+    for index, island in enumerate(result['island_results']):
+        final = rows(island['population'])
+        neighbour = initial[index - 1]
+        assert final <= initial[index] | neighbour
+        received.append(bool(final & neighbour))
+    assert any(received) == bool(migration_size)
+def test_processes_match_in_process_run():
+    def run(processes, seed=3):
+        return IslandModel(onemax, 24, islands=2, algorithm_class=ClassicGA, generations=6, migration_interval=2,
+                           topology='fully_connected', processes=processes, seed=seed, population_size=12).run()
+    in_process = run(False)
+    separate = run(True)
+    for key in ('best_chromosome', 'best_fitness', 'best_island', 'best_fitness_history', 'average_fitness_history'):
+        assert in_process[key] == separate[key]
+    for a, b in zip(in_process['island_results'], separate['island_results']):
+        assert (a['population'] == b['population']).all()
+    assert run(False)['average_fitness_history'] == in_process['average_fitness_history']
+    assert run(False, seed=4)['average_fitness_history'] != in_process['average_fitness_history']
+def test_early_stopping_pads_histories():
+    model = IslandModel(onemax, 16, islands=3, generations=30, migration_interval=5, processes=False, seed=2,
+                        population_size=10, early_stopping=EarlyStopping(patience=2))
+    result = model.run()
+    lengths = [len(island['best_fitness_history']) for island in result['island_results']]
+    assert any(stop is not None for stop in (island['stop_reason'] for island in result['island_results']))
+    assert len(result['best_fitness_history']) == len(result['average_fitness_history']) == max(lengths)
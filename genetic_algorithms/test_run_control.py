@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from checkpointing import Checkpoint
+from early_stopping import EarlyStopping
+from genetic_algorithms import ClassicGA, ElitistGA, SteadyStateGA, AdaptiveMutationGA
+from profiling import GenerationProfiler, PHASES
+
+ALGORITHMS = [ClassicGA, ElitistGA, SteadyStateGA, AdaptiveMutationGA]
+
+def onemax(x):
+    return bin(x).count('1')
+class Crash(Exception):
+    pass
+def crash_at(generation):
+    def callback(record):
+        if record['generation'] == generation:
+            raise Crash
+    return callback
+@pytest.mark.parametrize('algorithm_class', ALGORITHMS)
+def test_resumed_run_matches_uninterrupted_run(algorithm_class, tmp_path):
+    def make(**kwargs):
+        return algorithm_class(onemax, 20, population_size=16, max_generations=25, seed=8, **kwargs)
+    expected = make().run()
+    path = tmp_path / 'run.npz'
+    # The run dies during generation 13, after the checkpoint of generation 10
+    with pytest.raises(Crash):
+        make(checkpoint=Checkpoint(path, interval=5), profiler=GenerationProfiler(crash_at(12))).run()
+    resumed = make(checkpoint=Checkpoint(path, interval=5))
+    assert resumed.checkpoint.restore(resumed) and resumed.generation == 10
+    result = make(checkpoint=Checkpoint(path, interval=5)).run()
+    assert result['best_chromosome'] == expected['best_chromosome']
+    assert result['best_fitness_history'] == expected['best_fitness_history']
+    assert result['average_fitness_history'] == expected['average_fitness_history']
+    assert result['generations'] == 25
+    # The final save makes a further run a no-op
+    assert make(checkpoint=Checkpoint(path))._result()['generations'] == 0
+    assert make(checkpoint=Checkpoint(path)).run()['best_fitness_history'] == expected['best_fitness_history']
+def test_checkpoint_rejects_other_population_shapes(tmp_path):
+    path = tmp_path / 'run.npz'
+    ElitistGA(onemax, 8, population_size=10, max_generations=2, seed=0, checkpoint=Checkpoint(path)).run()
+    with pytest.raises(ValueError):
+        ElitistGA(onemax, 9, population_size=10, seed=0, checkpoint=Checkpoint(path)).run()
+    fresh = ElitistGA(onemax, 9, population_size=10, max_generations=2, seed=0,
+                      checkpoint=Checkpoint(path, resume=False))
+    assert fresh.run()['generations'] == 2
+    with pytest.raises(ValueError):
+        Checkpoint(path, interval=0)
+def test_early_stopping_check():
+    assert EarlyStopping(patience=3).check([]) is None
+    assert EarlyStopping(target_fitness=5).check([1, 4, 5]) == 'target'
+    assert EarlyStopping(target_fitness=5).check([1, 4]) is None
+    stopping = EarlyStopping(patience=3, min_delta=0.5)
+    assert stopping.check([1, 2, 2, 2]) is None
+    assert stopping.check([1, 2, 2, 2, 2]) == 'stagnation'
+    assert stopping.check([1, 2, 2, 2.4, 2.4]) == 'stagnation'
+    assert stopping.check([1, 2, 2, 2.6, 2.6]) is None
+    with pytest.raises(ValueError):
+        EarlyStopping(patience=0)
+def test_runs_stop_early():
+    result = ElitistGA(onemax, 32, population_size=30, max_generations=500, seed=1,
+                       early_stopping=EarlyStopping(target_fitness=28)).run()
+    assert result['stop_reason'] == 'target'
+    assert result['best_fitness_history'][-1] >= 28 and max(result['best_fitness_history'][:-1]) < 28
+    assert result['generations'] == len(result['best_fitness_history']) < 500
+    result = ClassicGA(onemax, 16, population_size=10, max_generations=500, seed=1, mutation_rate=0.0,
+                       early_stopping=EarlyStopping(patience=5)).run()
+    assert result['stop_reason'] == 'stagnation'
+    assert result['generations'] == len(result['best_fitness_history']) < 500
+    assert ElitistGA(onemax, 16, population_size=10, max_generations=5, seed=1).run()['stop_reason'] is None
+@pytest.mark.parametrize('algorithm_class', ALGORITHMS)
+def test_profiler_records_every_generation(algorithm_class):
+    records = []
+    profiler = GenerationProfiler(records.append)
+    result = algorithm_class(onemax, 16, population_size=20, max_generations=6, seed=2, profiler=profiler).run()
+    assert records == profiler.records
+    assert [record['generation'] for record in records] == list(range(6))
+    for record in records:
+        assert all(record[phase] >= 0 for phase in PHASES)
+        assert sum(record[phase] for phase in PHASES) <= record['total'] + 1e-9
+        assert record['evaluation'] > 0
+    summary = profiler.summary()
+    assert summary['generations'] == 6
+    assert np.isclose(summary['totals']['total'], sum(record['total'] for record in records))
+    assert np.isclose(sum(summary['fractions'].values()), 1.0)
+    # Profiling does not change the run
+    assert result['best_fitness_history'] == algorithm_class(onemax, 16, population_size=20, max_generations=6,
+                                                             seed=2).run()['best_fitness_history']
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from selection import (AliasTable, roulette_selection, stochastic_universal_sampling, rank_selection,
+                       tournament_selection, top_k, bottom_k, get_selection_operator)
+
+def table_distribution(table):
+    """Exact probability of each index under an alias table"""
+    n = len(table.prob)
+    return (table.prob + np.bincount(table.alias, weights=1 - table.prob, minlength=n)) / n
+def assert_frequencies(selected, expected, count):
+    # Within five standard deviations of the binomial count for every index
+    observed = np.bincount(selected, minlength=len(expected))
+    tolerance = 5 * np.sqrt(count * expected * (1 - expected)) + 1
+    assert (np.abs(observed - count * expected) <= tolerance).all()
+@pytest.mark.parametrize('weights', [[1, 1, 1, 1], [5, 1, 0, 2, 8], [0, 0, 1], [1e-9, 1, 1e6], np.arange(1, 200)])
+def test_alias_table_is_exact(weights):
+    weights = np.asarray(weights, dtype=float)
+    table = AliasTable(weights)
+    assert np.allclose(table_distribution(table), weights / weights.sum())
+    assert ((table.prob >= 0) & (table.prob <= 1)).all()
+def test_roulette_frequencies_match_weights():
+    rng = np.random.default_rng(0)
+    fitness = np.array([5.0, 1.0, 0.0, 2.0, 8.0])
+    assert_frequencies(roulette_selection(rng, fitness, 50000), fitness / fitness.sum(), 50000)
+def test_negative_fitness_is_shifted():
+    rng = np.random.default_rng(1)
+    fitness = np.array([-3.0, -1.0, 2.0])
+    weights = fitness + 3
+    assert_frequencies(roulette_selection(rng, fitness, 50000), weights / weights.sum(), 50000)
+    selected = roulette_selection(rng, np.zeros(4), 40000)
+    assert_frequencies(selected, np.full(4, 0.25), 40000)
+def test_sus_selects_floor_or_ceil_of_expected_count():
+    rng = np.random.default_rng(2)
+    fitness = rng.random(30) * 10
+    for count in (7, 30, 61):
+        counts = np.bincount(stochastic_universal_sampling(rng, fitness, count), minlength=30)
+        expected = fitness / fitness.sum() * count
+        assert counts.sum() == count
+        assert ((counts >= np.floor(expected)) & (counts <= np.ceil(expected))).all()
+def test_rank_selection_depends_only_on_order():
+    rng = np.random.default_rng(3)
+    fitness = np.array([100.0, -5.0, 1e6, 0.5])
+    ranks = np.array([3, 1, 4, 2], dtype=float)
+    assert_frequencies(rank_selection(rng, fitness, 50000), ranks / ranks.sum(), 50000)
+def test_tournament_picks_the_best_contestant():
+    rng = np.random.default_rng(4)
+    n = 6
+    fitness = np.array([4.0, 0.0, 5.0, 1.0, 3.0, 2.0])
+    # With two contestants drawn with replacement, rank r (1 = worst) wins with probability (r^2 - (r-1)^2) / n^2
+    ranks = np.argsort(np.argsort(fitness)) + 1
+    expected = (ranks ** 2 - (ranks - 1) ** 2) / n ** 2
+    assert_frequencies(tournament_selection(rng, fitness, 60000), expected, 60000)
+    assert (tournament_selection(rng, fitness, 100, tournament_size=200) == 2).all()
+@pytest.mark.parametrize('k', [-1, 0, 1, 5, 19, 20, 25])
+def test_top_k_and_bottom_k_match_argsort(k):
+    fitness = np.random.default_rng(k + 10).permutation(20).astype(float)
+    order = np.argsort(fitness)
+    expected = min(max(k, 0), 20)
+    assert sorted(top_k(fitness, k).tolist()) == sorted(order[20 - expected:].tolist())
+    assert sorted(bottom_k(fitness, k).tolist()) == sorted(order[:expected].tolist())
+def test_get_selection_operator():
+    assert get_selection_operator('sus') is stochastic_universal_sampling
+    custom = lambda rng, fitness, count: np.zeros(count, dtype=int)
+    assert get_selection_operator(custom) is custom
+    with pytest.raises(ValueError):
+        get_selection_operator('boltzmann')
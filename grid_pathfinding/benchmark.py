@@ -0,0 +1,340 @@
+"""
+网格寻路算法基准测试
+
+生成可复现的测试地图（随机障碍物、递归分割迷宫、元胞自动机洞穴），
+对每个算法执行预热和多次重复计时，用tracemalloc测量真实的峰值内存，
+并输出CSV/JSON结果，便于比较不同版本的算法实现。
+
+使用方法：
+    python benchmark.py --sizes 64 256 1024 --repeats 5 --json results.json --csv results.csv
+    python benchmark.py --sizes 64 256 --compare baseline.json
+"""
+
+import argparse
+import csv
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+from pathfinding import GridPathfinder
+
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None
+
+ALGORITHMS = ['bfs', 'dfs', 'dijkstra', 'a_star', 'dijkstra_bucket', 'a_star_bucket']
+# 桶队列版本只支持4方向、整数代价的网格
+BUCKET_ALGORITHMS = {'dijkstra_bucket', 'a_star_bucket'}
+DEFAULT_SIZES = [64, 128, 256, 512]
+DEFAULT_DENSITIES = [0.1, 0.2, 0.3]
+
+
+def random_obstacles(size, density, seed):
+    """随机障碍物地图：每个格子以density的概率成为障碍物"""
+    rng = np.random.default_rng(seed)
+    return (rng.random((size, size)) < density).astype(np.uint8)
+
+
+def recursive_division_maze(size, seed):
+    """递归分割迷宫：墙位于奇数行/列，缺口位于偶数行/列，得到一个完美迷宫"""
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size), dtype=np.uint8)
+    last = size - 1 if (size - 1) % 2 == 0 else size - 2
+    # 尺寸为偶数时最后一行/列不属于迷宫，用墙填满
+    grid[last + 1:, :] = 1
+    grid[:, last + 1:] = 1
+
+    # 用显式栈代替递归，避免大地图超出递归深度
+    stack = [(0, last, 0, last)]
+    while stack:
+        top, bottom, left, right = stack.pop()
+        height = bottom - top
+        width = right - left
+        if height < 2 or width < 2:
+            continue
+
+        horizontal = height > width or (height == width and rng.random() < 0.5)
+        if horizontal:
+            wall = top + 1 + 2 * int(rng.integers(height // 2))
+            gap = left + 2 * int(rng.integers(width // 2 + 1))
+            grid[wall, left:right + 1] = 1
+            grid[wall, gap] = 0
+            stack.append((top, wall - 1, left, right))
+            stack.append((wall + 1, bottom, left, right))
+        else:
+            wall = left + 1 + 2 * int(rng.integers(width // 2))
+            gap = top + 2 * int(rng.integers(height // 2 + 1))
+            grid[top:bottom + 1, wall] = 1
+            grid[gap, wall] = 0
+            stack.append((top, bottom, left, wall - 1))
+            stack.append((top, bottom, wall + 1, right))
+    return grid
+
+
+def cellular_automaton_cave(size, seed, fill=0.45, steps=5):
+    """元胞自动机洞穴：随机填充后反复平滑（4-5规则），边界外视为墙"""
+    rng = np.random.default_rng(seed)
+    walls = rng.random((size, size)) < fill
+    for _ in range(steps):
+        padded = np.pad(walls, 1, constant_values=True).astype(np.uint8)
+        neighbours = sum(
+            padded[1 + dx:size + 1 + dx, 1 + dy:size + 1 + dy]
+            for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+        )
+        # 墙在8邻域中有>=4面墙时保留，空地在8邻域中有>=5面墙时变为墙
+        walls = np.where(walls, neighbours >= 4, neighbours >= 5)
+    return walls.astype(np.uint8)
+
+
+def _largest_component(open_cells):
+    """返回最大4连通可通行区域的布尔掩码"""
+    if ndimage is not None:
+        labels, count = ndimage.label(open_cells)
+        if count == 0:
+            return np.zeros_like(open_cells, dtype=bool)
+        sizes = np.bincount(labels.ravel())
+        sizes[0] = 0
+        return labels == sizes.argmax()
+
+    # 没有scipy时在一维数组上做洪水填充
+    rows, cols = open_cells.shape
+    flat = open_cells.ravel().tolist()
+    labels = [0] * len(flat)
+    best_label, best_size, label = 0, 0, 0
+    for seed_index, is_open in enumerate(flat):
+        if not is_open or labels[seed_index]:
+            continue
+        label += 1
+        labels[seed_index] = label
+        queue = deque([seed_index])
+        component_size = 0
+        while queue:
+            index = queue.popleft()
+            component_size += 1
+            row, col = divmod(index, cols)
+            for neighbour, inside in ((index - cols, row > 0), (index + cols, row < rows - 1),
+                                      (index - 1, col > 0), (index + 1, col < cols - 1)):
+                if inside and flat[neighbour] and not labels[neighbour]:
+                    labels[neighbour] = label
+                    queue.append(neighbour)
+        if component_size > best_size:
+            best_label, best_size = label, component_size
+    return np.array(labels, dtype=np.int64).reshape(rows, cols) == best_label
+
+
+def _pick_endpoints(grid):
+    """在最大连通区域中选取最靠近左上角和右下角的格子作为起点和终点"""
+    component = _largest_component(grid == 0)
+    rows, cols = np.nonzero(component)
+    if rows.size == 0:
+        raise ValueError("地图中没有可通行的格子")
+    diagonal = rows + cols
+    start = (int(rows[diagonal.argmin()]), int(cols[diagonal.argmin()]))
+    end = (int(rows[diagonal.argmax()]), int(cols[diagonal.argmax()]))
+    return start, end
+
+
+def generate_workloads(sizes=DEFAULT_SIZES, densities=DEFAULT_DENSITIES, seed=0, weighted=False):
+    """生成所有测试地图，每个地图的随机种子由seed、类型和尺寸确定，保证可复现"""
+    workloads = []
+    for size in sizes:
+        specs = [(f'random-{density:g}', lambda s, d=density: random_obstacles(size, d, s)) for density in densities]
+        specs.append(('maze', lambda s: recursive_division_maze(size, s)))
+        specs.append(('cave', lambda s: cellular_automaton_cave(size, s)))
+
+        for kind_index, (kind, generate) in enumerate(specs):
+            workload_seed = seed * 1_000_003 + size * 101 + kind_index
+            generate_start = time.perf_counter()
+            grid = generate(workload_seed)
+            start, end = _pick_endpoints(grid)
+            costs = None
+            if weighted:
+                rng = np.random.default_rng(workload_seed + 1)
+                costs = rng.integers(1, 10, size=grid.shape).astype(np.float64)
+            workloads.append({
+                'name': f'{kind}-{size}',
+                'kind': kind,
+                'size': size,
+                'seed': workload_seed,
+                'obstacle_ratio': float(grid.mean()),
+                'grid': grid,
+                'costs': costs,
+                'start': start,
+                'end': end,
+                'generate_time': time.perf_counter() - generate_start,
+            })
+    return workloads
+
+
+def measure(pathfinder, algorithm, warmup=1, repeats=5):
+    """对单个算法计时：先预热，再重复执行；最后在tracemalloc下单独运行一次测峰值内存"""
+    run = getattr(pathfinder, algorithm)
+    for _ in range(warmup):
+        run()
+
+    times = []
+    result = None
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - begin)
+
+    # tracemalloc会明显拖慢执行，因此不与计时混在一起
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'algorithm': result['algorithm'],
+        'time_min': min(times),
+        'time_median': statistics.median(times),
+        'time_mean': statistics.mean(times),
+        'time_stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'peak_memory_bytes': peak - baseline,
+        'max_memory_proxy': result['max_memory'],
+        'nodes_visited': result['nodes_visited'],
+        'path_length': len(result['path']) if result['path'] else 0,
+        'path_cost': result.get('cost'),
+        'found': result['path'] is not None,
+    }
+
+
+def run_benchmark(workloads, algorithms=ALGORITHMS, warmup=1, repeats=5, diagonal=False, label='', verbose=True):
+    """在所有地图上运行所有算法，返回结果行列表"""
+    rows = []
+    for workload in workloads:
+        grid = workload['grid'].tolist()
+        setup_start = time.perf_counter()
+        pathfinder = GridPathfinder(grid, workload['start'], workload['end'],
+                                    costs=workload['costs'], diagonal=diagonal)
+        setup_time = time.perf_counter() - setup_start
+
+        for algorithm in algorithms:
+            if diagonal and algorithm in BUCKET_ALGORITHMS:
+                continue
+            stats = measure(pathfinder, algorithm, warmup=warmup, repeats=repeats)
+            row = {
+                'label': label,
+                'workload': workload['name'],
+                'kind': workload['kind'],
+                'size': workload['size'],
+                'cells': workload['size'] ** 2,
+                'seed': workload['seed'],
+                'obstacle_ratio': round(workload['obstacle_ratio'], 4),
+                'weighted': workload['costs'] is not None,
+                'diagonal': diagonal,
+                'generate_time': workload['generate_time'],
+                'setup_time': setup_time,
+                'repeats': repeats,
+                **stats,
+            }
+            rows.append(row)
+            if verbose:
+                print(f"{row['workload']:<18} {row['algorithm']:<16} "
+                      f"median {row['time_median'] * 1000:>10.2f} ms  "
+                      f"peak {row['peak_memory_bytes'] / 1024:>10.1f} KB  "
+                      f"nodes {row['nodes_visited']:>9}  found {'是' if row['found'] else '否'}")
+    return rows
+
+
+def environment_info():
+    """记录运行环境，便于比较不同机器/版本的结果"""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def write_csv(rows, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, path, config=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment_info(), 'config': config or {}, 'results': rows},
+                  f, ensure_ascii=False, indent=2)
+
+
+def compare(baseline_rows, candidate_rows):
+    """按(地图, 算法)比较两组结果，返回中位时间和峰值内存的比值"""
+    baseline = {(row['workload'], row['algorithm']): row for row in baseline_rows}
+    comparison = []
+    for row in candidate_rows:
+        key = (row['workload'], row['algorithm'])
+        if key not in baseline:
+            continue
+        old = baseline[key]
+        comparison.append({
+            'workload': row['workload'],
+            'algorithm': row['algorithm'],
+            'speedup': old['time_median'] / row['time_median'] if row['time_median'] else float('inf'),
+            'memory_ratio': row['peak_memory_bytes'] / old['peak_memory_bytes'] if old['peak_memory_bytes'] else float('inf'),
+            'same_cost': old['path_cost'] == row['path_cost'],
+        })
+    return comparison
+
+
+def print_comparison(comparison):
+    print("=" * 80)
+    print(f"{'地图':<18} {'算法':<16} {'加速比':>10} {'内存比':>10} {'代价一致':>10}")
+    print("-" * 80)
+    for item in comparison:
+        print(f"{item['workload']:<18} {item['algorithm']:<16} {item['speedup']:>10.2f} "
+              f"{item['memory_ratio']:>10.2f} {'是' if item['same_cost'] else '否':>10}")
+    print("=" * 80)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="网格寻路算法基准测试")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="地图边长，例如 64 256 1024 4096")
+    parser.add_argument('--densities', type=float, nargs='+', default=DEFAULT_DENSITIES, help="随机障碍物密度")
+    parser.add_argument('--algorithms', nargs='+', default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--weighted', action='store_true', help="为每个格子生成1-9的随机地形代价")
+    parser.add_argument('--diagonal', action='store_true', help="8方向移动")
+    parser.add_argument('--label', default='', help="写入每行结果的版本标签")
+    parser.add_argument('--csv', help="CSV输出路径")
+    parser.add_argument('--json', help="JSON输出路径")
+    parser.add_argument('--compare', help="与之前保存的JSON结果比较")
+    args = parser.parse_args(argv)
+
+    if 'bfs' in args.algorithms or 'dfs' in args.algorithms:
+        if max(args.sizes) > 512:
+            print("注意: BFS/DFS 在队列中为每个节点复制完整路径，大地图上内存为平方级", file=sys.stderr)
+
+    workloads = generate_workloads(args.sizes, args.densities, args.seed, args.weighted)
+    rows = run_benchmark(workloads, args.algorithms, args.warmup, args.repeats, args.diagonal, args.label)
+
+    config = {key: value for key, value in vars(args).items() if key not in ('csv', 'json', 'compare')}
+    if args.csv:
+        write_csv(rows, args.csv)
+        print(f"CSV结果已保存到 {args.csv}")
+    if args.json:
+        write_json(rows, args.json, config)
+        print(f"JSON结果已保存到 {args.json}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline_rows = json.load(f)['results']
+        print_comparison(compare(baseline_rows, rows))
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,123 @@
 import heapq
 from collections import deque
+import math
 import time
 import sys
 
+import numpy as np
+
+SQRT2 = math.sqrt(2)
+
+
 class GridPathfinder:
-    def __init__(self, grid, start, end):
+    def __init__(self, grid, start, end, costs=None, diagonal=False, corner_cutting=False):
         self.grid = grid
         self.start = start
         self.end = end
         self.rows = len(grid)
         self.cols = len(grid[0]) if self.rows > 0 else 0
+        self.diagonal = diagonal
+        self.corner_cutting = corner_cutting
         self.directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # 右、下、左、上
-        
+        if diagonal:
+            self.directions += [(1, 1), (1, -1), (-1, 1), (-1, -1)]  # 右下、左下、右上、左上
+
+        # Per-cell cost of entering a cell; None means unit cost everywhere
+        if costs is None:
+            self.costs = None
+            self.min_cost = 1.0
+        else:
+            self.costs = np.asarray(costs, dtype=np.float64)
+            if self.costs.shape != (self.rows, self.cols):
+                raise ValueError(f"costs shape {self.costs.shape} does not match grid shape {(self.rows, self.cols)}")
+            passable = np.asarray(grid) == 0
+            if np.any(self.costs[passable] <= 0):
+                raise ValueError("costs must be positive on passable cells")
+            self.min_cost = float(self.costs[passable].min()) if passable.any() else 1.0
+
+        self._build_flat_grid()
+
+    def _build_flat_grid(self):
+        # Flatten the grid into a padded 1-D layout: a one-cell border of obstacles
+        # removes bounds checks, and neighbours become fixed index offsets.
+        width = self.cols + 2
+        passable = np.zeros((self.rows + 2, width), dtype=np.uint8)
+        if self.rows > 0:
+            passable[1:-1, 1:-1] = np.asarray(self.grid) == 0
+        cost = np.ones((self.rows + 2, width), dtype=np.float64)
+        if self.costs is not None:
+            cost[1:-1, 1:-1] = self.costs
+        self._width = width
+        self._passable = passable.ravel().tolist()
+        self._cost = cost.ravel().tolist()
+        self._int_cost = None  # built on first use by the bucket-queue searches
+
+        # (offset, step length, orthogonal offsets that a diagonal move squeezes past)
+        self._moves = []
+        for dx, dy in self.directions:
+            if dx and dy:
+                self._moves.append((dx * width + dy, SQRT2, dx * width, dy))
+            else:
+                self._moves.append((dx * width + dy, 1.0, 0, 0))
+
+        # Per-row / per-column distances to the goal, computed once with numpy so the
+        # heuristic of a neighbour is two list lookups instead of coordinate arithmetic.
+        end_x, end_y = self.end
+        self._h_rows = (np.abs(np.arange(self.rows + 2) - (end_x + 1)) * self.min_cost).tolist()
+        self._h_cols = (np.abs(np.arange(width) - (end_y + 1)) * self.min_cost).tolist()
+
+    def _to_index(self, pos):
+        return (pos[0] + 1) * self._width + pos[1] + 1
+
+    def _to_pos(self, index):
+        x, y = divmod(index, self._width)
+        return (x - 1, y - 1)
+
     def is_valid(self, x, y):
         return 0 <= x < self.rows and 0 <= y < self.cols and self.grid[x][y] == 0
-    
+
+    def can_move(self, x, y, dx, dy):
+        # 对角移动时检查拐角：不允许切角时两侧正交格都必须可通行，允许时至少一侧可通行
+        if not self.is_valid(x + dx, y + dy):
+            return False
+        if dx and dy:
+            open_sides = self.is_valid(x + dx, y) + self.is_valid(x, y + dy)
+            return open_sides >= (1 if self.corner_cutting else 2)
+        return True
+
+    def move_cost(self, a, b):
+        # Cost of stepping from a to b: step length times the cost of entering b
+        step = SQRT2 if a[0] != b[0] and a[1] != b[1] else 1.0
+        if self.costs is None:
+            return step
+        return step * float(self.costs[b[0]][b[1]])
+
+    def path_cost(self, path):
+        if not path:
+            return None
+        return sum(self.move_cost(a, b) for a, b in zip(path, path[1:]))
+
     def heuristic(self, a, b):
-        # Manhattan distance for grid
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-    
+        dx = abs(a[0] - b[0])
+        dy = abs(a[1] - b[1])
+        if self.diagonal:
+            # Octile distance for 8-connected grid
+            return self.min_cost * (dx + dy + (SQRT2 - 2) * min(dx, dy))
+        # Manhattan distance for 4-connected grid
+        return self.min_cost * (dx + dy)
+
     def bfs(self):
         start_time = time.time()
         visited = set()
         queue = deque([(self.start, [self.start])])
         visited.add(self.start)
-        
+
         max_memory = 0
-        
+
         while queue:
             max_memory = max(max_memory, len(queue) + len(visited))
             current, path = queue.popleft()
-            
+
             if current == self.end:
                 end_time = time.time()
                 return {
@@ -38,38 +125,40 @@ class GridPathfinder:
                     'time': end_time - start_time,
                     'nodes_visited': len(visited),
                     'max_memory': max_memory,
+                    'cost': self.path_cost(path),
                     'algorithm': 'BFS'
                 }
-            
+
             for dx, dy in self.directions:
                 next_x, next_y = current[0] + dx, current[1] + dy
                 next_pos = (next_x, next_y)
-                
-                if self.is_valid(next_x, next_y) and next_pos not in visited:
+
+                if self.can_move(current[0], current[1], dx, dy) and next_pos not in visited:
                     visited.add(next_pos)
                     queue.append((next_pos, path + [next_pos]))
-        
+
         end_time = time.time()
         return {
             'path': None,
             'time': end_time - start_time,
             'nodes_visited': len(visited),
             'max_memory': max_memory,
+            'cost': None,
             'algorithm': 'BFS'
         }
-    
+
     def dfs(self):
         start_time = time.time()
         visited = set()
         stack = [(self.start, [self.start])]
         visited.add(self.start)
-        
+
         max_memory = 0
-        
+
         while stack:
             max_memory = max(max_memory, len(stack) + len(visited))
             current, path = stack.pop()
-            
+
             if current == self.end:
                 end_time = time.time()
                 return {
@@ -77,174 +166,260 @@ class GridPathfinder:
                     'time': end_time - start_time,
                     'nodes_visited': len(visited),
                     'max_memory': max_memory,
+                    'cost': self.path_cost(path),
                     'algorithm': 'DFS'
                 }
-            
+
             for dx, dy in self.directions:
                 next_x, next_y = current[0] + dx, current[1] + dy
                 next_pos = (next_x, next_y)
-                
-                if self.is_valid(next_x, next_y) and next_pos not in visited:
+
+                if self.can_move(current[0], current[1], dx, dy) and next_pos not in visited:
                     visited.add(next_pos)
                     stack.append((next_pos, path + [next_pos]))
-        
+
         end_time = time.time()
         return {
             'path': None,
             'time': end_time - start_time,
             'nodes_visited': len(visited),
             'max_memory': max_memory,
+            'cost': None,
             'algorithm': 'DFS'
         }
-    
-    def dijkstra(self):
+
+    def _best_first_search(self, algorithm, weight):
+        # Shared Dijkstra / A* core on flat indices. weight == 0 disables the heuristic.
         start_time = time.time()
-        
-        # Priority queue: (distance, current_pos)
-        pq = [(0, self.start)]
-        
-        # Distance from start to each node
-        distances = {}
-        for i in range(self.rows):
-            for j in range(self.cols):
-                distances[(i, j)] = float('inf')
-        distances[self.start] = 0
-        
-        # To reconstruct the path
-        came_from = {}
-        
-        visited = set()
-        max_memory = 0
-        
+
+        passable = self._passable
+        cost = self._cost
+        width = self._width
+        moves = self._moves
+        h_rows = self._h_rows
+        h_cols = self._h_cols
+        use_heuristic = weight > 0
+        octile = self.diagonal
+        diag_factor = SQRT2 - 2
+        corner_need = 1 if self.corner_cutting else 2
+
+        start = self._to_index(self.start)
+        end = self._to_index(self.end)
+        size = len(passable)
+
+        # g_score: distance from start to each node; came_from for path reconstruction
+        g_score = [math.inf] * size
+        came_from = [-1] * size
+        closed = bytearray(size)
+        g_score[start] = 0.0
+
+        # Priority queue: (f_score, index)
+        pq = [(0.0, start)]
+        nodes_visited = 0
+        max_queue = 1
+
+        if not (self.is_valid(*self.start) and self.is_valid(*self.end)):
+            pq = []
+
         while pq:
-            max_memory = max(max_memory, len(pq) + len(visited) + len(distances))
-            current_dist, current = heapq.heappop(pq)
-            
-            if current in visited:
+            if len(pq) > max_queue:
+                max_queue = len(pq)
+            _, current = heapq.heappop(pq)
+
+            if closed[current]:
                 continue
-            
-            visited.add(current)
-            
-            if current == self.end:
+
+            closed[current] = 1
+            nodes_visited += 1
+
+            if current == end:
                 # Reconstruct path
                 path = []
-                while current in came_from:
-                    path.append(current)
+                while current != -1:
+                    path.append(self._to_pos(current))
                     current = came_from[current]
-                path.append(self.start)
                 path.reverse()
-                
+
                 end_time = time.time()
                 return {
                     'path': path,
                     'time': end_time - start_time,
-                    'nodes_visited': len(visited),
-                    'max_memory': max_memory,
-                    'algorithm': 'Dijkstra'
+                    'nodes_visited': nodes_visited,
+                    'max_memory': max_queue + nodes_visited + self.rows * self.cols,
+                    'cost': g_score[end],
+                    'algorithm': algorithm
                 }
-            
-            for dx, dy in self.directions:
-                next_x, next_y = current[0] + dx, current[1] + dy
-                next_pos = (next_x, next_y)
-                
-                if self.is_valid(next_x, next_y):
-                    new_dist = current_dist + 1  # Grid movement cost is 1
-                    
-                    if new_dist < distances[next_pos]:
-                        distances[next_pos] = new_dist
-                        came_from[next_pos] = current
-                        heapq.heappush(pq, (new_dist, next_pos))
-        
+
+            current_g = g_score[current]
+            for offset, step, side_a, side_b in moves:
+                neighbor = current + offset
+                if not passable[neighbor] or closed[neighbor]:
+                    continue
+                if side_a and passable[current + side_a] + passable[current + side_b] < corner_need:
+                    continue
+
+                tentative_g = current_g + step * cost[neighbor]
+                if tentative_g < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g
+                    came_from[neighbor] = current
+                    if use_heuristic:
+                        row, col = divmod(neighbor, width)
+                        dx = h_rows[row]
+                        dy = h_cols[col]
+                        if octile:
+                            h = dx + dy + diag_factor * (dx if dx < dy else dy)
+                        else:
+                            h = dx + dy
+                        heapq.heappush(pq, (tentative_g + weight * h, neighbor))
+                    else:
+                        heapq.heappush(pq, (tentative_g, neighbor))
+
         end_time = time.time()
         return {
             'path': None,
             'time': end_time - start_time,
-            'nodes_visited': len(visited),
-            'max_memory': max_memory,
-            'algorithm': 'Dijkstra'
+            'nodes_visited': nodes_visited,
+            'max_memory': max_queue + nodes_visited + self.rows * self.cols,
+            'cost': None,
+            'algorithm': algorithm
         }
-    
-    def a_star(self):
+
+    def _bucket_search(self, algorithm, use_heuristic):
+        # Dial's algorithm: with integer step costs in [1, C] every key pushed while
+        # expanding key f lies in [f, f + span), so a circular array of `span` buckets
+        # replaces the heap and both push and pop are O(1).
+        if self.diagonal:
+            raise ValueError("bucket queue requires a 4-connected grid (diagonal steps cost sqrt(2))")
+        # Only passable cells are ever entered, so walls may carry any cost (inf, 1e7, ...)
+        passable_costs = self.costs[np.asarray(self.grid) == 0] if self.costs is not None else None
+        if passable_costs is not None and not np.isfinite(passable_costs).all():
+            raise ValueError("bucket queue requires finite costs on passable cells")
+        if passable_costs is not None and not np.array_equal(passable_costs, np.round(passable_costs)):
+            raise ValueError("bucket queue requires integer cell costs")
+
+        if self._int_cost is None:
+            cost = np.where(np.asarray(self._passable, dtype=bool), self._cost, 0)
+            self._int_cost = cost.astype(np.int64).tolist()
+            self._max_int_cost = int(passable_costs.max()) if passable_costs is not None and passable_costs.size else 1
+
         start_time = time.time()
-        
-        # Priority queue: (f_score, current_pos)
-        pq = [(0, self.start)]
-        
-        # g_score: distance from start to current node
-        g_score = {}
-        for i in range(self.rows):
-            for j in range(self.cols):
-                g_score[(i, j)] = float('inf')
-        g_score[self.start] = 0
-        
-        # f_score: g_score + heuristic
-        f_score = {}
-        for i in range(self.rows):
-            for j in range(self.cols):
-                f_score[(i, j)] = float('inf')
-        f_score[self.start] = self.heuristic(self.start, self.end)
-        
-        # To reconstruct the path
-        came_from = {}
-        
-        visited = set()
-        max_memory = 0
-        
-        while pq:
-            max_memory = max(max_memory, len(pq) + len(visited) + len(g_score))
-            current_f, current = heapq.heappop(pq)
-            
-            if current in visited:
+
+        passable = self._passable
+        cost = self._int_cost
+        width = self._width
+        moves = [offset for offset, _, _, _ in self._moves]
+        h_rows = [int(h) for h in self._h_rows]
+        h_cols = [int(h) for h in self._h_cols]
+        max_cost = self._max_int_cost
+        # A consistent heuristic can raise f by at most one extra min_cost per step
+        span = max_cost + 1 + (int(self.min_cost) if use_heuristic else 0)
+
+        start = self._to_index(self.start)
+        end = self._to_index(self.end)
+        size = len(passable)
+
+        g_score = [-1] * size
+        came_from = [-1] * size
+        closed = bytearray(size)
+        g_score[start] = 0
+
+        buckets = [[] for _ in range(span)]
+        current_key = 0
+        if use_heuristic:
+            row, col = divmod(start, width)
+            current_key = h_rows[row] + h_cols[col]
+        pending = 0
+        if self.is_valid(*self.start) and self.is_valid(*self.end):
+            buckets[current_key % span].append(start)
+            pending = 1
+
+        nodes_visited = 0
+        max_queue = pending
+
+        while pending:
+            bucket = buckets[current_key % span]
+            if not bucket:
+                current_key += 1
                 continue
-            
-            visited.add(current)
-            
-            if current == self.end:
+            # LIFO within a bucket favours the most recently reached (deepest) nodes
+            current = bucket.pop()
+            pending -= 1
+
+            if closed[current]:
+                continue
+
+            closed[current] = 1
+            nodes_visited += 1
+
+            if current == end:
                 # Reconstruct path
                 path = []
-                while current in came_from:
-                    path.append(current)
+                while current != -1:
+                    path.append(self._to_pos(current))
                     current = came_from[current]
-                path.append(self.start)
                 path.reverse()
-                
+
                 end_time = time.time()
                 return {
                     'path': path,
                     'time': end_time - start_time,
-                    'nodes_visited': len(visited),
-                    'max_memory': max_memory,
-                    'algorithm': 'A*'
+                    'nodes_visited': nodes_visited,
+                    'max_memory': max_queue + nodes_visited + self.rows * self.cols,
+                    'cost': float(g_score[end]),
+                    'algorithm': algorithm
                 }
-            
-            for dx, dy in self.directions:
-                next_x, next_y = current[0] + dx, current[1] + dy
-                next_pos = (next_x, next_y)
-                
-                if self.is_valid(next_x, next_y):
-                    tentative_g = g_score[current] + 1  # Grid movement cost is 1
-                    
-                    if tentative_g < g_score[next_pos]:
-                        came_from[next_pos] = current
-                        g_score[next_pos] = tentative_g
-                        f_score[next_pos] = tentative_g + self.heuristic(next_pos, self.end)
-                        heapq.heappush(pq, (f_score[next_pos], next_pos))
-        
+
+            current_g = g_score[current]
+            for offset in moves:
+                neighbor = current + offset
+                if not passable[neighbor] or closed[neighbor]:
+                    continue
+
+                tentative_g = current_g + cost[neighbor]
+                if g_score[neighbor] < 0 or tentative_g < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g
+                    came_from[neighbor] = current
+                    if use_heuristic:
+                        row, col = divmod(neighbor, width)
+                        buckets[(tentative_g + h_rows[row] + h_cols[col]) % span].append(neighbor)
+                    else:
+                        buckets[tentative_g % span].append(neighbor)
+                    pending += 1
+                    if pending > max_queue:
+                        max_queue = pending
+
         end_time = time.time()
         return {
             'path': None,
             'time': end_time - start_time,
-            'nodes_visited': len(visited),
-            'max_memory': max_memory,
-            'algorithm': 'A*'
+            'nodes_visited': nodes_visited,
+            'max_memory': max_queue + nodes_visited + self.rows * self.cols,
+            'cost': None,
+            'algorithm': algorithm
         }
-    
+
+    def dijkstra(self):
+        return self._best_first_search('Dijkstra', 0)
+
+    def dijkstra_bucket(self):
+        return self._bucket_search('Dijkstra (Dial)', False)
+
+    def a_star_bucket(self):
+        return self._bucket_search('A* (bucket)', True)
+
+    def a_star(self, weight=1.0):
+        # weight > 1 gives weighted A*: faster, but the path may be up to weight times optimal
+        if weight < 1:
+            raise ValueError(f"A* weight must be at least 1, got {weight} (use dijkstra() for a search without heuristic)")
+        algorithm = 'A*' if weight == 1 else f'Weighted A* (w={weight:g})'
+        return self._best_first_search(algorithm, weight)
+
     def run_all_algorithms(self):
         results = []
         algorithms = [self.bfs, self.dfs, self.dijkstra, self.a_star]
-        
+
         for algo in algorithms:
             result = algo()
             results.append(result)
-        
+
         return results
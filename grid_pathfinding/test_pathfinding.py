@@ -1,3 +1,5 @@
+import time
+
 from pathfinding import GridPathfinder
 
 # 示例网格：0表示可通行，1表示障碍物
@@ -81,6 +83,129 @@ def print_results(results):
             print(f"路径: {fastest['path']}")
             print_grid(EXAMPLE_GRID, fastest['path'])
 
+# 带地形代价的示例：0表示可通行，1表示障碍物；TERRAIN_COSTS为进入每个格子的代价
+WEIGHTED_GRID = [
+    [0, 0, 0, 0, 0, 0],
+    [0, 1, 1, 0, 1, 0],
+    [0, 0, 0, 0, 1, 0],
+    [0, 1, 0, 0, 0, 0],
+    [0, 1, 0, 1, 1, 0],
+    [0, 0, 0, 0, 0, 0]
+]
+
+TERRAIN_COSTS = [
+    [1, 1, 5, 5, 5, 1],
+    [1, 1, 1, 5, 1, 1],
+    [1, 1, 1, 1, 1, 1],
+    [1, 1, 1, 9, 9, 1],
+    [1, 1, 1, 1, 1, 1],
+    [1, 1, 1, 1, 1, 1]
+]
+
+def test_weighted_and_diagonal():
+    """测试带权网格与8方向移动"""
+    start, end = (0, 0), (5, 5)
+
+    # 4方向带权：Dijkstra与A*必须找到相同的最小代价
+    pathfinder = GridPathfinder(WEIGHTED_GRID, start, end, costs=TERRAIN_COSTS)
+    dijkstra = pathfinder.dijkstra()
+    a_star = pathfinder.a_star()
+    assert dijkstra['cost'] == a_star['cost'] == 10, (dijkstra['cost'], a_star['cost'])
+    assert a_star['nodes_visited'] <= dijkstra['nodes_visited']
+    assert pathfinder.path_cost(a_star['path']) == a_star['cost']
+
+    # 8方向：八分距离启发函数下A*仍然最优，且不穿过障碍物拐角
+    pathfinder = GridPathfinder(WEIGHTED_GRID, start, end, costs=TERRAIN_COSTS, diagonal=True)
+    dijkstra = pathfinder.dijkstra()
+    a_star = pathfinder.a_star()
+    assert abs(dijkstra['cost'] - a_star['cost']) < 1e-9
+    assert a_star['cost'] == 10
+    for (x, y), (next_x, next_y) in zip(a_star['path'], a_star['path'][1:]):
+        assert pathfinder.can_move(x, y, next_x - x, next_y - y)
+
+    # 允许切角时可以贴着障碍物斜穿，代价更低
+    cutting = GridPathfinder(WEIGHTED_GRID, start, end, costs=TERRAIN_COSTS, diagonal=True, corner_cutting=True).a_star()
+    assert abs(cutting['cost'] - (4 + 3 * 2 ** 0.5)) < 1e-9
+
+    # 加权A*的代价不超过最优代价的weight倍
+    weighted = pathfinder.a_star(weight=2.0)
+    assert weighted['cost'] <= 2.0 * a_star['cost'] + 1e-9
+
+    # 权重小于1不再是加权A*（weight=0即Dijkstra），应当拒绝
+    for weight in (0, 0.5):
+        try:
+            pathfinder.a_star(weight=weight)
+            assert False, "weight < 1 应该被拒绝"
+        except ValueError:
+            pass
+
+    # 不允许切角时，对角线不能从两个障碍物之间挤过
+    squeeze = [[0, 1], [1, 0]]
+    assert GridPathfinder(squeeze, (0, 0), (1, 1), diagonal=True).a_star()['path'] is None
+    assert GridPathfinder(squeeze, (0, 0), (1, 1), diagonal=True, corner_cutting=True).a_star()['path'] is None
+    half_open = [[0, 1], [0, 0]]
+    assert len(GridPathfinder(half_open, (0, 0), (1, 1), diagonal=True).a_star()['path']) == 3
+    assert len(GridPathfinder(half_open, (0, 0), (1, 1), diagonal=True, corner_cutting=True).a_star()['path']) == 2
+
+    print(f"带权8方向网格(允许切角): 最小代价 {cutting['cost']:.3f}, 路径 {cutting['path']}")
+
+def test_bucket_queue():
+    """测试桶队列Dijkstra/A*与堆实现得到相同的最小代价"""
+    pathfinder = GridPathfinder(WEIGHTED_GRID, (0, 0), (5, 5), costs=TERRAIN_COSTS)
+    expected = pathfinder.dijkstra()['cost']
+    for result in (pathfinder.dijkstra_bucket(), pathfinder.a_star_bucket()):
+        assert result['cost'] == expected, (result['algorithm'], result['cost'])
+        assert pathfinder.path_cost(result['path']) == expected
+
+    pathfinder = GridPathfinder(EXAMPLE_GRID, START, END)
+    assert len(pathfinder.a_star_bucket()['path']) == len(pathfinder.bfs()['path'])
+
+    # 障碍物上的代价不参与计算：用inf或很大的有限值标记墙都不影响桶队列
+    wall_grid = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    for wall_cost in (float('inf'), 1e7):
+        costs = [[1, 1, 1], [wall_cost, wall_cost, 1], [1, 1, 1]]
+        pathfinder = GridPathfinder(wall_grid, (0, 0), (2, 0), costs=costs)
+        expected = pathfinder.dijkstra()['cost']
+        assert expected == 6
+        start_time = time.time()
+        for result in (pathfinder.dijkstra_bucket(), pathfinder.a_star_bucket()):
+            assert result['cost'] == expected, (wall_cost, result['algorithm'], result['cost'])
+        assert time.time() - start_time < 1.0
+
+    # 可通行格子上的代价必须是有限值，inf会破坏桶数量的计算
+    for passable_cost in (float('inf'), 2.5):
+        costs = [[1, passable_cost, 1], [1, 1, 1], [1, 1, 1]]
+        pathfinder = GridPathfinder(wall_grid, (0, 0), (2, 0), costs=costs)
+        for search in (pathfinder.dijkstra_bucket, pathfinder.a_star_bucket):
+            try:
+                search()
+                assert False, f"可通行格子代价为{passable_cost}时应该拒绝桶队列"
+            except ValueError:
+                pass
+
+    # 对角线步长为√2，不能使用桶队列
+    try:
+        GridPathfinder(WEIGHTED_GRID, (0, 0), (5, 5), diagonal=True).dijkstra_bucket()
+        assert False, "8方向网格应该拒绝桶队列"
+    except ValueError:
+        pass
+
+def test_benchmark_workloads():
+    """测试基准地图生成器可复现，且起点和终点连通"""
+    from benchmark import generate_workloads, run_benchmark
+
+    first = generate_workloads(sizes=[32], densities=[0.3], seed=7)
+    second = generate_workloads(sizes=[32], densities=[0.3], seed=7)
+    assert [w['name'] for w in first] == ['random-0.3-32', 'maze-32', 'cave-32']
+    for a, b in zip(first, second):
+        assert (a['grid'] == b['grid']).all() and a['start'] == b['start'] and a['end'] == b['end']
+
+    algorithms = ['dijkstra', 'a_star', 'dijkstra_bucket', 'a_star_bucket']
+    rows = run_benchmark(first, algorithms=algorithms, warmup=0, repeats=2, verbose=False)
+    assert all(row['found'] and row['peak_memory_bytes'] > 0 for row in rows)
+    for index in range(0, len(rows), len(algorithms)):
+        assert len({row['path_cost'] for row in rows[index:index + len(algorithms)]}) == 1
+
 def main():
     print("初始网格:")
     print_grid(EXAMPLE_GRID)
@@ -95,5 +220,7 @@ def main():
     # 打印结果
     print_results(results)
 
+    test_weighted_and_diagonal()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,386 @@
+import heapq
+import time
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+# Edges scanned per batch by the pure-Python Kruskal loop; bounds the size of
+# the temporary Python lists built from the sorted numpy arrays.
+SCAN_CHUNK = 1 << 20
+
+
+# On-disk record layout of a binary edge-list file
+EDGE_DTYPE = np.dtype([('u', '<i4'), ('v', '<i4'), ('w', '<f8')])
+
+
+def _as_index_array(values, vertices):
+    values = np.asanyarray(values)
+    if values.dtype.kind in 'iu' and values.ndim == 1:
+        return values
+    return np.asarray(values, dtype=np.int32 if vertices < 2 ** 31 else np.int64)
+
+
+class EdgeArrayGraph:
+    """Undirected weighted graph stored as three parallel NumPy arrays (u, v, w)."""
+
+    def __init__(self, vertices, u, v, w):
+        self.V = int(vertices)
+        self.u = _as_index_array(u, self.V)
+        self.v = _as_index_array(v, self.V)
+        # Arrays that are already numeric (e.g. memory-mapped columns) are used as-is
+        self.w = np.asanyarray(w)
+        if not (self.u.ndim == self.v.ndim == self.w.ndim == 1):
+            raise ValueError("u, v and w must be one-dimensional arrays")
+        if not (len(self.u) == len(self.v) == len(self.w)):
+            raise ValueError(f"u, v and w must have the same length, got {len(self.u)}, {len(self.v)}, {len(self.w)}")
+        if self.w.dtype.kind not in 'iuf':
+            raise ValueError(f"edge weights must be numeric, got dtype {self.w.dtype}")
+        if len(self.u) and (min(self.u.min(), self.v.min()) < 0 or max(self.u.max(), self.v.max()) >= self.V):
+            raise ValueError(f"edge endpoints must be in [0, {self.V})")
+
+    @property
+    def E(self):
+        return len(self.w)
+
+    @classmethod
+    def from_edges(cls, vertices, edges):
+        edges = list(edges)
+        if not edges:
+            return cls(vertices, [], [], [])
+        u, v, w = zip(*edges)
+        return cls(vertices, u, v, np.asarray(w))
+
+    @classmethod
+    def from_graph(cls, graph):
+        # Convert a list-based mst_algorithms.Graph
+        return cls.from_edges(graph.V, graph.graph)
+
+    def nbytes(self):
+        return self.u.nbytes + self.v.nbytes + self.w.nbytes
+
+
+def save_edge_list(graph, path):
+    """Write an EdgeArrayGraph as a .npy structured array or a raw EDGE_DTYPE binary file."""
+    records = np.empty(graph.E, dtype=EDGE_DTYPE)
+    records['u'] = graph.u
+    records['v'] = graph.v
+    records['w'] = graph.w
+    if str(path).endswith('.npy'):
+        np.save(path, records)
+    else:
+        records.tofile(path)
+
+
+def load_edge_list(path, vertices=None):
+    """Memory-map an edge-list file written by save_edge_list (or any .npy of shape (E, 3)).
+
+    The returned graph's u, v and w are views into the mapping, so nothing is read
+    until an algorithm touches the data.
+    """
+    if str(path).endswith('.npy'):
+        records = np.load(path, mmap_mode='r')
+    else:
+        records = np.memmap(path, dtype=EDGE_DTYPE, mode='r')
+
+    if records.dtype.names:
+        u, v, w = records['u'], records['v'], records['w']
+    elif records.ndim == 2 and records.shape[1] == 3:
+        u, v, w = records[:, 0], records[:, 1], records[:, 2]
+    else:
+        raise ValueError(f"unsupported edge-list layout: dtype {records.dtype}, shape {records.shape}")
+
+    if vertices is None:
+        vertices = int(max(u.max(), v.max())) + 1 if len(u) else 0
+    return EdgeArrayGraph(vertices, u, v, w)
+
+
+class CSRGraph:
+    """Compressed-sparse-row adjacency: the neighbours of vertex i are
+    neighbors[offsets[i]:offsets[i + 1]] with matching weights.
+
+    Every undirected edge is stored once in each direction, so with int32
+    neighbours and 4-byte weights an edge costs 16 bytes.
+    """
+
+    def __init__(self, vertices, offsets, neighbors, weights):
+        self.V = int(vertices)
+        self.offsets = np.asanyarray(offsets)
+        self.neighbors = np.asanyarray(neighbors)
+        self.weights = np.asanyarray(weights)
+        if len(self.offsets) != self.V + 1:
+            raise ValueError(f"offsets must have V + 1 = {self.V + 1} entries, got {len(self.offsets)}")
+        if len(self.neighbors) != len(self.weights) or self.offsets[-1] != len(self.neighbors):
+            raise ValueError("neighbors and weights must both have offsets[-1] entries")
+
+    @property
+    def E(self):
+        return len(self.neighbors) // 2
+
+    @classmethod
+    def from_edge_array(cls, graph, weight_dtype=None):
+        # Build once: stable argsort of both edge directions by source vertex (O(m log m));
+        # bincount + cumsum of the source counts gives the row offsets
+        index_dtype = np.int32 if graph.V < 2 ** 31 else np.int64
+        sources = np.concatenate([graph.u, graph.v]).astype(index_dtype, copy=False)
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=graph.V)
+        del sources
+
+        offsets = np.zeros(graph.V + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        neighbors = np.concatenate([graph.v, graph.u]).astype(index_dtype, copy=False)[order]
+        weights = np.concatenate([graph.w, graph.w])[order]
+        if weight_dtype is not None:
+            weights = weights.astype(weight_dtype)
+        return cls(graph.V, offsets, neighbors, weights)
+
+    @classmethod
+    def from_graph(cls, graph, weight_dtype=None):
+        return cls.from_edge_array(EdgeArrayGraph.from_graph(graph), weight_dtype)
+
+    @classmethod
+    def from_edge_file(cls, path, vertices=None, weight_dtype=None):
+        return cls.from_edge_array(load_edge_list(path, vertices), weight_dtype)
+
+    def save(self, prefix):
+        np.save(f'{prefix}.offsets.npy', self.offsets)
+        np.save(f'{prefix}.neighbors.npy', self.neighbors)
+        np.save(f'{prefix}.weights.npy', self.weights)
+
+    @classmethod
+    def load(cls, prefix, mmap_mode='r'):
+        # Memory-mapped by default: opening a saved CSR graph costs no reads
+        offsets = np.load(f'{prefix}.offsets.npy', mmap_mode=mmap_mode)
+        neighbors = np.load(f'{prefix}.neighbors.npy', mmap_mode=mmap_mode)
+        weights = np.load(f'{prefix}.weights.npy', mmap_mode=mmap_mode)
+        return cls(len(offsets) - 1, offsets, neighbors, weights)
+
+    def to_edge_array(self):
+        # Each undirected edge once (the copy with source < neighbour); self-loops are dropped
+        sources = np.repeat(np.arange(self.V, dtype=self.neighbors.dtype), np.diff(self.offsets))
+        keep = sources < self.neighbors
+        return EdgeArrayGraph(self.V, sources[keep], self.neighbors[keep], self.weights[keep])
+
+    def nbytes(self):
+        return self.offsets.nbytes + self.neighbors.nbytes + self.weights.nbytes
+
+    def bytes_per_edge(self):
+        return self.nbytes() / max(self.E, 1)
+
+
+def find_root(parent, i):
+    # Iterative find with path halving: every visited node skips to its grandparent
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _kruskal_scan(u, v, parent, rank, selected, count, offset):
+    # Scan edges already sorted by weight, recording the positions of the edges that
+    # join two components. Written so it runs both on Python lists and, compiled by
+    # numba, on NumPy arrays.
+    target = len(parent) - 1
+    for i in range(len(u)):
+        if count >= target:
+            break
+        x = u[i]
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        y = v[i]
+        while parent[y] != y:
+            parent[y] = parent[parent[y]]
+            y = parent[y]
+        if x == y:
+            continue
+        # Union by rank
+        if rank[x] < rank[y]:
+            parent[x] = y
+        elif rank[x] > rank[y]:
+            parent[y] = x
+        else:
+            parent[y] = x
+            rank[x] += 1
+        selected[count] = offset + i
+        count += 1
+    return count
+
+
+_kruskal_scan_jit = njit(cache=True)(_kruskal_scan) if NUMBA_AVAILABLE else None
+
+
+def _select_mst_edges(graph, order, use_numba):
+    # Returns indices into `order` of the edges Kruskal accepts, in acceptance order
+    n = graph.V
+    if n <= 1:
+        return np.empty(0, dtype=np.int64)
+    sorted_u = graph.u[order]
+    sorted_v = graph.v[order]
+
+    if use_numba:
+        parent = np.arange(n, dtype=graph.u.dtype)
+        rank = np.zeros(n, dtype=np.int8)
+        selected = np.empty(n - 1, dtype=np.int64)
+        count = _kruskal_scan_jit(sorted_u, sorted_v, parent, rank, selected, 0, 0)
+        return selected[:count]
+
+    parent = list(range(n))
+    rank = [0] * n
+    selected = [0] * (n - 1)
+    count = 0
+    for offset in range(0, len(sorted_u), SCAN_CHUNK):
+        count = _kruskal_scan(sorted_u[offset:offset + SCAN_CHUNK].tolist(),
+                              sorted_v[offset:offset + SCAN_CHUNK].tolist(),
+                              parent, rank, selected, count, offset)
+        if count >= n - 1:
+            break
+    return np.asarray(selected[:count], dtype=np.int64)
+
+
+def mst_result(graph, edge_ids, start_time, end_time):
+    # Build the {'mst', 'total_weight', 'time'} dict shared with mst_algorithms
+    u = graph.u[edge_ids].tolist()
+    v = graph.v[edge_ids].tolist()
+    w = graph.w[edge_ids]
+    return {
+        'mst': list(zip(u, v, w.tolist())),
+        'total_weight': w.sum().item() if len(w) else 0,
+        'time': end_time - start_time
+    }
+
+
+# Kruskal's Algorithm on edge arrays
+def kruskal_array(graph, use_numba=None):
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    elif use_numba and not NUMBA_AVAILABLE:
+        raise ImportError("numba is not installed")
+
+    start_time = time.time()
+
+    # A stable argsort keeps equal-weight edges in input order, like sorted() in kruskal()
+    order = np.argsort(graph.w, kind='stable')
+    selected = _select_mst_edges(graph, order, use_numba)
+    edge_ids = order[selected]
+
+    end_time = time.time()
+
+    return mst_result(graph, edge_ids, start_time, end_time)
+
+
+# Kruskal's Algorithm on a CSR graph
+def kruskal_csr(graph, use_numba=None):
+    start_time = time.time()
+    edges = graph.to_edge_array()
+    result = kruskal_array(edges, use_numba)
+    result['time'] = time.time() - start_time
+    return result
+
+
+# Heap-based Prim's Algorithm on a CSR graph
+def prim_heap_csr(graph):
+    start_time = time.time()
+
+    V = graph.V
+    offsets = graph.offsets.tolist()
+    neighbors = graph.neighbors
+    weights = graph.weights
+    key = [float('inf')] * V
+    parent = [None] * V
+    mst_set = bytearray(V)
+
+    heap = [(0, 0)] if V else []
+    if V:
+        key[0] = 0
+    max_heap_size = len(heap)
+
+    while heap:
+        max_heap_size = max(max_heap_size, len(heap))
+        current_key, u = heapq.heappop(heap)
+
+        if mst_set[u]:
+            continue
+
+        mst_set[u] = 1
+
+        begin, end = offsets[u], offsets[u + 1]
+        for v, w in zip(neighbors[begin:end].tolist(), weights[begin:end].tolist()):
+            if not mst_set[v] and w < key[v]:
+                key[v] = w
+                parent[v] = u
+                heapq.heappush(heap, (w, v))
+
+    end_time = time.time()
+
+    mst = []
+    total_weight = 0
+    for i in range(1, V):
+        mst.append((parent[i], i, key[i]))
+        total_weight += key[i]
+
+    return {
+        'mst': mst,
+        'total_weight': total_weight,
+        'time': end_time - start_time,
+        'max_heap_size': max_heap_size
+    }
+
+
+# Borůvka's Algorithm on a CSR graph
+def boruvka_csr(graph):
+    start_time = time.time()
+
+    V = graph.V
+    offsets = graph.offsets.tolist()
+    parent = list(range(V))
+    rank = [0] * V
+    mst = []
+    num_trees = V
+
+    while num_trees > 1:
+        # cheapest[root] = (w, u, v) of the lightest edge leaving that component
+        cheapest = {}
+        for u in range(V):
+            begin, end = offsets[u], offsets[u + 1]
+            if begin == end:
+                continue
+            root_u = find_root(parent, u)
+            best = cheapest.get(root_u)
+            for v, w in zip(graph.neighbors[begin:end].tolist(), graph.weights[begin:end].tolist()):
+                if (best is None or w < best[0]) and find_root(parent, v) != root_u:
+                    best = (w, u, v)
+            if best is not None:
+                cheapest[root_u] = best
+
+        if not cheapest:
+            break  # disconnected: the remaining components have no edges between them
+
+        for w, u, v in cheapest.values():
+            x = find_root(parent, u)
+            y = find_root(parent, v)
+            if x == y:
+                continue
+            mst.append((u, v, w))
+            if rank[x] < rank[y]:
+                x, y = y, x
+            parent[y] = x
+            if rank[x] == rank[y]:
+                rank[x] += 1
+            num_trees -= 1
+
+    end_time = time.time()
+
+    total_weight = sum(edge[2] for edge in mst)
+
+    return {
+        'mst': mst,
+        'total_weight': total_weight,
+        'time': end_time - start_time
+    }
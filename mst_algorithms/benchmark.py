@@ -0,0 +1,513 @@
+"""
+最小生成树算法基准测试
+
+完整测试（full）在五类生成图（随机稀疏、随机稠密、网格、几何k近邻、幂律）上，
+以10^3到10^7条边的规模运行所有算法：先预热再重复计时，校验所有算法的总权重一致，
+输出时间、每秒处理边数和tracemalloc峰值内存，结果可保存为JSON。
+
+使用方法：
+    python benchmark.py                                   # 默认规模 1e3 1e4 1e5
+    python benchmark.py full --scales 1e5 1e6 1e7 --kinds sparse grid --json results.json
+    python benchmark.py prim --repeats 3
+    python benchmark.py dynamic                           # 动态MST各类更新的代价
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from mst_algorithms import Graph, prim, prim_heap, prim_indexed_heap, kruskal, boruvka
+from array_graph import CSRGraph, EdgeArrayGraph, NUMBA_AVAILABLE, kruskal_array, save_edge_list
+from parallel_boruvka import boruvka_parallel
+from external_mst import external_filter_kruskal
+from dynamic_mst import DynamicMST
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+
+def random_graph(vertices, edges, seed=0, max_weight=1000):
+    """随机连通图：先生成一棵随机树保证连通，再补充随机边（无自环、无重边）"""
+    rng = random.Random(seed)
+    g = Graph(vertices)
+    seen = set()
+    for v in range(1, vertices):
+        u = rng.randrange(v)
+        seen.add((u, v))
+        g.add_edge(u, v, rng.randint(1, max_weight))
+    max_edges = vertices * (vertices - 1) // 2
+    edges = min(edges, max_edges)
+    while len(seen) < edges:
+        u, v = rng.randrange(vertices), rng.randrange(vertices)
+        if u == v:
+            continue
+        if u > v:
+            u, v = v, u
+        if (u, v) in seen:
+            continue
+        seen.add((u, v))
+        g.add_edge(u, v, rng.randint(1, max_weight))
+    return g
+
+
+def time_algorithm(algorithm, graph, repeats=3):
+    """重复运行，返回最短时间和最后一次的结果"""
+    best = float('inf')
+    result = None
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        result = algorithm(graph)
+        best = min(best, time.perf_counter() - begin)
+    return best, result
+
+
+PRIM_VARIANTS = [
+    ('Prim (Array)', prim),
+    ('Prim (Heap)', prim_heap),
+    ('Prim (Indexed 2-ary)', lambda g: prim_indexed_heap(g, arity=2)),
+    ('Prim (Indexed 4-ary)', lambda g: prim_indexed_heap(g, arity=4)),
+]
+
+PRIM_WORKLOADS = [
+    # (名称, 顶点数, 边数)
+    ('sparse', 5000, 25000),
+    ('dense', 1500, 1500 * 1499 // 4),
+]
+
+
+def benchmark_prim(workloads=PRIM_WORKLOADS, repeats=3, seed=0):
+    """在稠密图和稀疏图上比较三种Prim实现：时间与堆的最大长度"""
+    rows = []
+    for name, vertices, edges in workloads:
+        graph = random_graph(vertices, edges, seed)
+        expected = None
+        for label, algorithm in PRIM_VARIANTS:
+            seconds, result = time_algorithm(algorithm, graph, repeats)
+            if expected is None:
+                expected = result['total_weight']
+            assert result['total_weight'] == expected, f"{label} 在 {name} 图上的总权重不一致"
+            rows.append({
+                'workload': name,
+                'vertices': vertices,
+                'edges': len(graph.graph),
+                'algorithm': label,
+                'time': seconds,
+                'max_heap_size': result.get('max_heap_size'),
+            })
+    return rows
+
+
+def print_rows(rows):
+    print(f"{'Workload':<10} {'V':>8} {'E':>10} {'Algorithm':<22} {'Time (s)':>10} {'Max heap':>10}")
+    print("-" * 76)
+    for row in rows:
+        heap = row['max_heap_size'] if row['max_heap_size'] is not None else '-'
+        print(f"{row['workload']:<10} {row['vertices']:>8} {row['edges']:>10} {row['algorithm']:<22} "
+              f"{row['time']:>10.4f} {heap:>10}")
+
+
+# ---------------------------------------------------------------------------
+# 动态MST：各类更新的实际代价
+# ---------------------------------------------------------------------------
+
+def barbell_graph(vertices, edges, seed=0, bridges=201, max_weight=1000):
+    """两个相同规模的随机连通图，由bridges条比其他边都重的桥边相连。
+    MST中恰好有一条桥边，删除它时两侧各有V/2个顶点，是删除树边的最坏情况"""
+    half = vertices // 2
+    rng = random.Random(seed)
+    g = Graph(2 * half)
+    for offset, part_seed in ((0, seed), (half, seed + 1)):
+        for u, v, w in random_graph(half, (edges - bridges) // 2, part_seed, max_weight).graph:
+            g.add_edge(u + offset, v + offset, w)
+    for i in range(bridges):
+        g.add_edge(rng.randrange(half), half + rng.randrange(half), max_weight + 1 + i)
+    return g
+
+
+DYNAMIC_WORKLOADS = [
+    # (名称, 图生成函数, 顶点数, 边数, 更新类型)
+    ('random', random_graph, 20000, 60000, ('insert', 'delete_non_tree', 'delete_tree')),
+    ('barbell', barbell_graph, 20000, 60000, ('delete_bridge',)),
+]
+
+
+def benchmark_dynamic(workloads=DYNAMIC_WORKLOADS, updates=200, seed=0):
+    """每类更新的平均时间、删除树边时扫描的顶点数和非树边数，与每次更新后重新运行Kruskal比较。
+    delete_bridge每次删除barbell图中当前的桥树边，替代边是下一条桥边"""
+    rows = []
+    for name, generate, vertices, edges, operations in workloads:
+        graph = generate(vertices, edges, seed)
+        rng = random.Random(seed)
+        recompute_time, _ = time_algorithm(kruskal, graph, 1)
+        begin = time.perf_counter()
+        dynamic = DynamicMST(graph.V, [tuple(edge) for edge in graph.graph])
+        build_time = time.perf_counter() - begin
+        bridges = [edge_id for edge_id, (u, v, _) in dynamic.edges.items() if (u < graph.V // 2) != (v < graph.V // 2)]
+
+        for operation in operations:
+            if operation == 'delete_non_tree':
+                targets = rng.sample([edge_id for edge_id in dynamic.edges if not dynamic.is_tree_edge(edge_id)], updates)
+            elif operation == 'delete_tree':
+                targets = rng.sample(sorted(dynamic.edge_node), updates)
+            before = dict(dynamic.stats)
+            elapsed = 0.0
+            for i in range(updates):
+                if operation == 'insert':
+                    edge = (rng.randrange(graph.V), rng.randrange(graph.V), rng.randint(1, 1000))
+                    begin = time.perf_counter()
+                    dynamic.insert_edge(*edge)
+                else:
+                    if operation == 'delete_bridge':
+                        edge_id = next(bridge for bridge in bridges if dynamic.is_tree_edge(bridge))
+                        bridges.remove(edge_id)
+                    else:
+                        edge_id = targets[i]
+                    begin = time.perf_counter()
+                    dynamic.delete_edge(edge_id)
+                elapsed += time.perf_counter() - begin
+
+            live = EdgeArrayGraph.from_edges(graph.V, list(dynamic.edges.values()))
+            assert dynamic.total_weight == kruskal_array(live)['total_weight'], f"{name} 图上 {operation} 后总权重错误"
+            time_per_update = elapsed / updates
+            rows.append({
+                'workload': name,
+                'vertices': graph.V,
+                'edges': len(graph.graph),
+                'operation': operation,
+                'updates': updates,
+                'build_time': build_time,
+                'time_per_update': time_per_update,
+                'vertices_scanned': (dynamic.stats['vertices_scanned'] - before['vertices_scanned']) / updates,
+                'edges_scanned': (dynamic.stats['edges_scanned'] - before['edges_scanned']) / updates,
+                'recompute_time': recompute_time,
+                'speedup': recompute_time / time_per_update if time_per_update else float('inf'),
+            })
+    return rows
+
+
+def print_dynamic_rows(rows):
+    print(f"{'Workload':<10} {'V':>7} {'E':>7} {'Operation':<16} {'ms/update':>10} {'Vertices':>9} "
+          f"{'Edges':>9} {'Kruskal ms':>11} {'Speedup':>9}")
+    print("-" * 96)
+    for row in rows:
+        print(f"{row['workload']:<10} {row['vertices']:>7} {row['edges']:>7} {row['operation']:<16} "
+              f"{row['time_per_update'] * 1000:>10.3f} {row['vertices_scanned']:>9.1f} {row['edges_scanned']:>9.1f} "
+              f"{row['recompute_time'] * 1000:>11.1f} {row['speedup']:>8.0f}x")
+
+
+# ---------------------------------------------------------------------------
+# 完整测试：图生成器
+# ---------------------------------------------------------------------------
+
+MAX_WEIGHT = 1000000
+
+
+def _spanning_tree(vertices, rng):
+    # 每个顶点连向一个编号更小的随机顶点，保证图连通
+    v = np.arange(1, vertices, dtype=np.int64)
+    u = (rng.random(vertices - 1) * v).astype(np.int64)
+    return u, v
+
+
+def _build(vertices, u, v, w, limit=None):
+    """去掉自环和重复的顶点对（保留第一次出现），最多保留limit条边"""
+    low, high = np.minimum(u, v), np.maximum(u, v)
+    candidates = np.nonzero(low != high)[0]
+    _, first = np.unique(low[candidates] * vertices + high[candidates], return_index=True)
+    keep = candidates[np.sort(first)][:limit]
+    return EdgeArrayGraph(vertices, u[keep], v[keep], w[keep])
+
+
+def sparse_graph(edges, seed=0, degree=10):
+    """随机稀疏图：平均度数约为degree的随机生成树加随机边，整数权重"""
+    rng = np.random.default_rng(seed)
+    vertices = max(2, 2 * edges // degree)
+    tree_u, tree_v = _spanning_tree(vertices, rng)
+    extra = max(0, edges - (vertices - 1))
+    u = np.concatenate([tree_u, rng.integers(0, vertices, extra)])
+    v = np.concatenate([tree_v, rng.integers(0, vertices, extra)])
+    return _build(vertices, u, v, rng.integers(1, MAX_WEIGHT, len(u)))
+
+
+def dense_graph(edges, seed=0, density=0.5):
+    """随机稠密图：约一半的顶点对之间有边"""
+    rng = np.random.default_rng(seed)
+    vertices = max(2, int(math.sqrt(2 * edges / density)) + 1)
+    tree_u, tree_v = _spanning_tree(vertices, rng)
+    # 随机抽样会重复，多抽约40%以补足去重后的数量
+    extra = int(max(0, edges - (vertices - 1)) * 1.4)
+    u = np.concatenate([tree_u, rng.integers(0, vertices, extra)])
+    v = np.concatenate([tree_v, rng.integers(0, vertices, extra)])
+    return _build(vertices, u, v, rng.integers(1, MAX_WEIGHT, len(u)), limit=edges)
+
+
+def grid_graph(edges, seed=0):
+    """side × side 的四邻接网格，边数约为 2·side·(side-1)"""
+    rng = np.random.default_rng(seed)
+    side = max(2, int(math.sqrt(edges / 2)) + 1)
+    ids = np.arange(side * side, dtype=np.int64).reshape(side, side)
+    u = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    v = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return EdgeArrayGraph(side * side, u, v, rng.integers(1, MAX_WEIGHT, len(u)))
+
+
+def _nearest_neighbors(points, k):
+    if cKDTree is not None:
+        _, neighbors = cKDTree(points).query(points, k + 1)
+        return neighbors[:, 1:]
+    # 没有scipy时分块暴力计算，O(V²)，只适合较小的规模
+    neighbors = np.empty((len(points), k), dtype=np.int64)
+    for start in range(0, len(points), 1024):
+        block = points[start:start + 1024]
+        distance = ((block[:, None, :] - points[None, :, :]) ** 2).sum(axis=2)
+        distance[np.arange(len(block)), np.arange(start, start + len(block))] = np.inf
+        nearest = np.argpartition(distance, k, axis=1)[:, :k]
+        neighbors[start:start + len(block)] = nearest
+    return neighbors
+
+
+def geometric_graph(edges, seed=0, k=8):
+    """单位正方形内随机点的欧氏k近邻图，权重为距离；另按x坐标把相邻点连成链以保证连通"""
+    rng = np.random.default_rng(seed)
+    # 对称化去重后每个点约贡献0.6k条边
+    vertices = max(k + 1, int(edges / (0.6 * k)))
+    points = rng.random((vertices, 2))
+    neighbors = _nearest_neighbors(points, k)
+    chain = np.argsort(points[:, 0])
+    u = np.concatenate([chain[:-1], np.repeat(np.arange(vertices), k)])
+    v = np.concatenate([chain[1:], neighbors.ravel()])
+    w = np.sqrt(((points[u] - points[v]) ** 2).sum(axis=1))
+    return _build(vertices, u, v, w)
+
+
+def powerlaw_graph(edges, seed=0, exponent=2.5):
+    """Chung-Lu幂律图：顶点i被选为端点的概率正比于 (i+1)^(-1/(exponent-1))"""
+    rng = np.random.default_rng(seed)
+    vertices = max(2, edges // 5)
+    tree_u, tree_v = _spanning_tree(vertices, rng)
+    probability = np.arange(1, vertices + 1) ** (-1.0 / (exponent - 1))
+    probability /= probability.sum()
+    # 度数大的顶点之间重边很多，多抽一些再截断
+    extra = int(max(0, edges - (vertices - 1)) * 1.5)
+    u = np.concatenate([tree_u, rng.choice(vertices, extra, p=probability)])
+    v = np.concatenate([tree_v, rng.choice(vertices, extra, p=probability)])
+    return _build(vertices, u, v, rng.integers(1, MAX_WEIGHT, len(u)), limit=edges)
+
+
+GENERATORS = {
+    'sparse': sparse_graph,
+    'dense': dense_graph,
+    'grid': grid_graph,
+    'geometric': geometric_graph,
+    'powerlaw': powerlaw_graph,
+}
+
+DEFAULT_SCALES = [1e3, 1e4, 1e5]
+
+
+# ---------------------------------------------------------------------------
+# 完整测试：算法与计时
+# ---------------------------------------------------------------------------
+
+# 列表版Graph每条边约占用250字节，超过此边数时跳过需要Graph的算法
+MAX_PYTHON_EDGES = 2000000
+
+# 名称 -> (函数, 输入表示, 最大顶点数)。输入表示：graph为mst_algorithms.Graph，
+# csr为CSRGraph，edges为EdgeArrayGraph，file为save_edge_list写出的边文件
+SUITE_ALGORITHMS = {
+    'prim': (prim, 'graph', 5000),
+    'prim_heap': (prim_heap, 'graph', None),
+    'prim_indexed_heap': (prim_indexed_heap, 'graph', None),
+    'kruskal': (kruskal, 'graph', None),
+    'boruvka': (boruvka, 'graph', None),
+    'prim_heap_csr': (prim_heap, 'csr', None),
+    'kruskal_array': (kruskal_array, 'edges', None),
+    'boruvka_parallel': (boruvka_parallel, 'edges', None),
+    'external_filter_kruskal': (external_filter_kruskal, 'file', None),
+}
+
+
+def to_graph(edges):
+    g = Graph(edges.V)
+    for u, v, w in zip(edges.u.tolist(), edges.v.tolist(), edges.w.tolist()):
+        g.add_edge(u, v, w)
+    return g
+
+
+def measure(algorithm, data, warmup=1, repeats=3, memory=True):
+    """先预热，再重复计时；最后在tracemalloc下单独运行一次测峰值内存。
+    tracemalloc能看到Python对象和NumPy数组，看不到numba运行时内部的分配。"""
+    for _ in range(warmup):
+        algorithm(data)
+
+    times = []
+    result = None
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        result = algorithm(data)
+        times.append(time.perf_counter() - begin)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        algorithm(data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak -= baseline
+
+    return {
+        'time_min': min(times),
+        'time_median': statistics.median(times),
+        'time_mean': statistics.mean(times),
+        'time_stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'peak_memory_bytes': peak,
+        'total_weight': result['total_weight'],
+        'mst_edges': len(result['mst']),
+    }
+
+
+def _skip_reason(name, edges, max_python_edges):
+    _, representation, max_vertices = SUITE_ALGORITHMS[name]
+    if max_vertices is not None and edges.V > max_vertices:
+        return f"V > {max_vertices}"
+    if representation == 'graph' and edges.E > max_python_edges:
+        return f"E > {max_python_edges}"
+    return None
+
+
+def run_suite(scales=DEFAULT_SCALES, kinds=tuple(GENERATORS), algorithms=tuple(SUITE_ALGORITHMS),
+              warmup=1, repeats=3, seed=0, memory=True, max_python_edges=MAX_PYTHON_EDGES, verbose=True):
+    """在每种图、每个规模上运行所有算法，返回结果行；agrees表示总权重与第一个算法一致"""
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for kind in kinds:
+            for scale in scales:
+                generate_start = time.perf_counter()
+                edges = GENERATORS[kind](int(scale), seed)
+                generate_time = time.perf_counter() - generate_start
+                inputs = {'edges': edges}
+                reference = None
+
+                for name in algorithms:
+                    algorithm, representation, _ = SUITE_ALGORITHMS[name]
+                    skip = _skip_reason(name, edges, max_python_edges)
+                    if skip:
+                        if verbose:
+                            print(f"{kind:<10} {edges.E:>10} {name:<24} 跳过 ({skip})")
+                        continue
+
+                    setup_start = time.perf_counter()
+                    if representation not in inputs:
+                        if representation == 'graph':
+                            inputs['graph'] = to_graph(edges)
+                        elif representation == 'csr':
+                            inputs['csr'] = CSRGraph.from_edge_array(edges)
+                        else:
+                            inputs['file'] = os.path.join(directory, f"{kind}_{int(scale)}.bin")
+                            save_edge_list(edges, inputs['file'])
+                    setup_time = time.perf_counter() - setup_start
+
+                    stats = measure(algorithm, inputs[representation], warmup, repeats, memory)
+                    if reference is None:
+                        reference = stats['total_weight']
+                    row = {
+                        'kind': kind,
+                        'scale': int(scale),
+                        'vertices': edges.V,
+                        'edges': edges.E,
+                        'algorithm': name,
+                        'input': representation,
+                        'generate_time': generate_time,
+                        'setup_time': setup_time,
+                        'repeats': repeats,
+                        **stats,
+                        'edges_per_sec': edges.E / stats['time_median'] if stats['time_median'] else float('inf'),
+                        'agrees': math.isclose(stats['total_weight'], reference, rel_tol=1e-9, abs_tol=1e-9),
+                    }
+                    rows.append(row)
+                    if verbose:
+                        peak = row['peak_memory_bytes']
+                        peak_text = f"{peak / 2 ** 20:>9.1f} MB" if peak is not None else f"{'-':>12}"
+                        print(f"{kind:<10} {edges.E:>10} {name:<24} median {row['time_median']:>9.4f} s  "
+                              f"{row['edges_per_sec']:>12.0f} E/s  peak {peak_text}  "
+                              f"{'一致' if row['agrees'] else '不一致!'}")
+
+                if inputs.get('file'):
+                    os.remove(inputs['file'])
+    return rows
+
+
+def environment_info():
+    """记录运行环境，便于比较不同机器/版本的结果"""
+    def version(module):
+        try:
+            return __import__(module).__version__
+        except ImportError:
+            return None
+
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'numba': version('numba') if NUMBA_AVAILABLE else None,
+        'scipy': version('scipy'),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def write_json(rows, path, config=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment_info(), 'config': config or {}, 'results': rows},
+                  f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="最小生成树算法基准测试")
+    parser.add_argument('suite', nargs='?', default='full', choices=['full', 'prim', 'dynamic'], help="要运行的基准测试")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES, help="目标边数，例如 1e3 1e5 1e7")
+    parser.add_argument('--kinds', nargs='+', default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument('--algorithms', nargs='+', default=list(SUITE_ALGORITHMS), choices=list(SUITE_ALGORITHMS))
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="不运行tracemalloc峰值内存测量")
+    parser.add_argument('--max-python-edges', type=int, default=MAX_PYTHON_EDGES,
+                        help="超过此边数时跳过基于列表Graph的算法")
+    parser.add_argument('--json', help="JSON输出路径")
+    args = parser.parse_args(argv)
+
+    if args.suite == 'prim':
+        print_rows(benchmark_prim(repeats=args.repeats, seed=args.seed))
+        return
+    if args.suite == 'dynamic':
+        print_dynamic_rows(benchmark_dynamic(seed=args.seed))
+        return
+
+    rows = run_suite(args.scales, args.kinds, args.algorithms, args.warmup, args.repeats, args.seed,
+                     not args.no_memory, args.max_python_edges)
+    if args.json:
+        write_json(rows, args.json, {key: value for key, value in vars(args).items() if key != 'json'})
+        print(f"JSON结果已保存到 {args.json}")
+
+    disagreeing = [row for row in rows if not row['agrees']]
+    if disagreeing:
+        raise SystemExit(f"{len(disagreeing)} 个结果的总权重与其他算法不一致")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+import time
+
+from array_graph import find_root
+
+NEG_INF = float('-inf')
+
+
+class LinkCutTree:
+    """Array-backed link-cut tree (splay trees over preferred paths) with path-max.
+
+    Nodes are integer ids; `value[node]` is the node's weight and every path query
+    returns the node with the largest value. All operations are O(log n) amortized.
+    """
+
+    def __init__(self, size=0):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []
+        self.value = []
+        self.best = []  # node with the largest value in the splay subtree
+        for _ in range(size):
+            self.add_node(NEG_INF)
+
+    def add_node(self, value):
+        node = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(node)
+        return node
+
+    def reset_node(self, node, value):
+        self.left[node] = self.right[node] = self.parent[node] = -1
+        self.flip[node] = False
+        self.value[node] = value
+        self.best[node] = node
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left != -1:
+                self.flip[left] = not self.flip[left]
+            if right != -1:
+                self.flip[right] = not self.flip[right]
+            self.flip[x] = False
+
+    def _pull(self, x):
+        value, best = self.value, self.best
+        top = x
+        child = self.left[x]
+        if child != -1 and value[best[child]] > value[top]:
+            top = best[child]
+        child = self.right[x]
+        if child != -1 and value[best[child]] > value[top]:
+            top = best[child]
+        best[x] = top
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_splay_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child != -1:
+            parent[child] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # Push pending reversals from the splay root down to x first
+        path = [x]
+        y = x
+        while not self._is_splay_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for node in reversed(path):
+            self._push(node)
+
+        parent = self.parent
+        while not self._is_splay_root(x):
+            p = parent[x]
+            if not self._is_splay_root(p):
+                g = parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+        self._push(x)
+
+    def find_root(self, x):
+        self._access(x)
+        self._push(x)
+        while self.left[x] != -1:
+            x = self.left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        # x and y must be in different trees
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        # x and y must be adjacent
+        self.make_root(x)
+        self._access(y)
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def path_max(self, x, y):
+        # Node with the largest value on the tree path x..y
+        self.make_root(x)
+        self._access(y)
+        return self.best[y]
+
+
+class DynamicMST:
+    """Minimum spanning forest maintained under edge insertions and deletions.
+
+    Each tree edge is a node of a link-cut tree placed between its two endpoints, so a
+    path-max query returns the heaviest edge on the cycle an inserted edge would close:
+
+    - insert: O(log n) amortized. If the endpoints are already connected and the new
+      edge is lighter than the heaviest edge on their path, that edge is swapped out.
+    - delete of a non-tree edge: O(1).
+    - delete of a tree edge: the tree is cut and both halves are searched in lockstep
+      until the smaller one, S, is fully enumerated; the lightest non-tree edge leaving
+      it reconnects the forest. This costs O(|S| + deg(S)), up to O(n + m) when the
+      deleted edge splits a tree evenly.
+
+    Only insertions and non-tree deletions are polylog. The structure suits workloads of
+    mostly insertions, or deletions that split off small subtrees; a tree deletion that
+    halves a component costs about as much as a recompute. `stats` counts the vertices
+    and non-tree edges scanned by tree deletions, and `python benchmark.py dynamic`
+    reports the cost of each kind of update.
+    """
+
+    def __init__(self, vertices, edges=()):
+        self.V = vertices
+        self.forest = LinkCutTree(vertices)
+        self.edges = {}            # edge id -> (u, v, w)
+        self.edge_node = {}        # tree edge id -> link-cut node
+        self.node_edge = {}        # link-cut node -> tree edge id
+        self.free_nodes = []
+        self.tree_adj = [set() for _ in range(vertices)]
+        self.non_tree_adj = [set() for _ in range(vertices)]
+        self.next_id = 0
+        self.total_weight = 0
+        self.stats = {'insertions': 0, 'deletions': 0, 'replacements': 0, 'vertices_scanned': 0,
+                      'edges_scanned': 0}
+        self._build(edges)
+
+    def _build(self, edges):
+        # Initial forest from a static Kruskal pass, so only its V-1 edges touch the
+        # link-cut tree; everything else goes straight to the non-tree adjacency.
+        # Ids follow the input order, so edge i of `edges` has id i.
+        edge_ids = [self._new_edge(u, v, w) for u, v, w in edges]
+        parent = list(range(self.V))
+        for edge_id in sorted(edge_ids, key=lambda edge_id: self.edges[edge_id][2]):
+            u, v, _ = self.edges[edge_id]
+            root_u, root_v = find_root(parent, u), find_root(parent, v)
+            if root_u != root_v:
+                parent[root_u] = root_v
+                self._link_tree_edge(edge_id)
+            else:
+                self._add_non_tree_edge(edge_id)
+
+    def _new_edge(self, u, v, w):
+        if not (0 <= u < self.V and 0 <= v < self.V):
+            raise ValueError(f"edge endpoints must be in [0, {self.V})")
+        edge_id = self.next_id
+        self.next_id += 1
+        self.edges[edge_id] = (u, v, w)
+        return edge_id
+
+    def _add_non_tree_edge(self, edge_id):
+        u, v, _ = self.edges[edge_id]
+        self.non_tree_adj[u].add(edge_id)
+        self.non_tree_adj[v].add(edge_id)
+
+    def _remove_non_tree_edge(self, edge_id):
+        u, v, _ = self.edges[edge_id]
+        self.non_tree_adj[u].discard(edge_id)
+        self.non_tree_adj[v].discard(edge_id)
+
+    def _link_tree_edge(self, edge_id):
+        u, v, w = self.edges[edge_id]
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            self.forest.reset_node(node, w)
+        else:
+            node = self.forest.add_node(w)
+        self.edge_node[edge_id] = node
+        self.node_edge[node] = edge_id
+        self.forest.link(u, node)
+        self.forest.link(node, v)
+        self.tree_adj[u].add(edge_id)
+        self.tree_adj[v].add(edge_id)
+        self.total_weight += w
+
+    def _cut_tree_edge(self, edge_id):
+        u, v, w = self.edges[edge_id]
+        node = self.edge_node.pop(edge_id)
+        del self.node_edge[node]
+        self.forest.cut(u, node)
+        self.forest.cut(node, v)
+        self.free_nodes.append(node)
+        self.tree_adj[u].discard(edge_id)
+        self.tree_adj[v].discard(edge_id)
+        self.total_weight -= w
+
+    def _smaller_side(self, a, b):
+        # Grow both trees one vertex at a time; the first to run out is the smaller
+        seen = ({a}, {b})
+        stacks = ([a], [b])
+        while True:
+            for side in (0, 1):
+                stack = stacks[side]
+                if not stack:
+                    return seen[side]
+                x = stack.pop()
+                for edge_id in self.tree_adj[x]:
+                    p, q, _ = self.edges[edge_id]
+                    y = q if p == x else p
+                    if y not in seen[side]:
+                        seen[side].add(y)
+                        stack.append(y)
+
+    def insert_edge(self, u, v, w):
+        edge_id = self._new_edge(u, v, w)
+        self.stats['insertions'] += 1
+
+        if u != v and not self.forest.connected(u, v):
+            self._link_tree_edge(edge_id)
+        elif u == v:
+            self._add_non_tree_edge(edge_id)
+        else:
+            # Cycle property: the heaviest edge on the u..v path leaves if it is heavier
+            heaviest = self.node_edge[self.forest.path_max(u, v)]
+            if w < self.edges[heaviest][2]:
+                self._cut_tree_edge(heaviest)
+                self._add_non_tree_edge(heaviest)
+                self._link_tree_edge(edge_id)
+                self.stats['replacements'] += 1
+            else:
+                self._add_non_tree_edge(edge_id)
+        return edge_id
+
+    def delete_edge(self, edge_id):
+        if edge_id not in self.edges:
+            raise KeyError(f"unknown edge id {edge_id}")
+        self.stats['deletions'] += 1
+
+        if edge_id not in self.edge_node:
+            self._remove_non_tree_edge(edge_id)
+            del self.edges[edge_id]
+            return
+
+        u, v, _ = self.edges[edge_id]
+        self._cut_tree_edge(edge_id)
+        del self.edges[edge_id]
+
+        # Cut property: the lightest edge leaving one side is the replacement
+        side = self._smaller_side(u, v)
+        self.stats['vertices_scanned'] += len(side)
+        best = None
+        for x in side:
+            self.stats['edges_scanned'] += len(self.non_tree_adj[x])
+            for candidate in self.non_tree_adj[x]:
+                a, b, w = self.edges[candidate]
+                if (b if a == x else a) not in side and (best is None or (w, candidate) < best):
+                    best = (w, candidate)
+        if best is not None:
+            self._remove_non_tree_edge(best[1])
+            self._link_tree_edge(best[1])
+            self.stats['replacements'] += 1
+
+    def find_edges(self, u, v):
+        # Ids of all current edges between u and v
+        return [edge_id for edge_id in self.tree_adj[u] | self.non_tree_adj[u]
+                if set(self.edges[edge_id][:2]) == {u, v}]
+
+    def is_tree_edge(self, edge_id):
+        return edge_id in self.edge_node
+
+    def connected(self, u, v):
+        return self.forest.connected(u, v)
+
+    def mst(self):
+        return [self.edges[edge_id] for edge_id in sorted(self.edge_node)]
+
+    def result(self):
+        start_time = time.time()
+        mst = self.mst()
+        end_time = time.time()
+        return {
+            'mst': mst,
+            'total_weight': self.total_weight,
+            'time': end_time - start_time
+        }
@@ -0,0 +1,297 @@
+import time
+
+import numpy as np
+
+from array_graph import EdgeArrayGraph, NUMBA_AVAILABLE, njit, kruskal_array, mst_result
+from parallel_boruvka import _contract
+
+try:
+    from scipy.spatial import Delaunay, cKDTree
+    from scipy.spatial import QhullError
+    SCIPY_AVAILABLE = True
+except ImportError:
+    Delaunay = cKDTree = None
+    QhullError = RuntimeError
+    SCIPY_AVAILABLE = False
+
+# Points per k-d tree leaf
+LEAF_SIZE = 16
+
+METHODS = ('auto', 'delaunay', 'knn', 'boruvka')
+
+
+def _as_points(points):
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    if points.ndim != 2:
+        raise ValueError(f"points must be an (n, d) array, got shape {points.shape}")
+    if points.shape[1] == 0:
+        raise ValueError("points need at least one coordinate")
+    if not np.isfinite(points).all():
+        raise ValueError("points must be finite")
+    return points
+
+
+def _require_scipy(method):
+    if not SCIPY_AVAILABLE:
+        raise ImportError(f"method '{method}' needs scipy")
+
+
+def _unique_pairs(u, v, n):
+    # Undirected pairs with u < v, no self-loops, each pair once
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    low, high = np.minimum(u, v), np.maximum(u, v)
+    keep = low != high
+    keys = np.unique(low[keep] * n + high[keep])
+    return keys // n, keys % n
+
+
+def _edge_graph(points, u, v):
+    weights = np.sqrt(((points[u] - points[v]) ** 2).sum(axis=1))
+    return EdgeArrayGraph(len(points), u, v, weights)
+
+
+def delaunay_edges(points):
+    """Edges of the Delaunay triangulation, which contains every Euclidean MST edge.
+
+    Duplicate points that Qhull leaves out of the triangulation are attached to the
+    vertex they coincide with by a zero-length edge.
+    """
+    _require_scipy('delaunay')
+    points = _as_points(points)
+    triangulation = Delaunay(points)
+    simplices = triangulation.simplices
+    corners = simplices.shape[1]
+    u = np.concatenate([simplices[:, i] for i in range(corners) for j in range(i + 1, corners)])
+    v = np.concatenate([simplices[:, j] for i in range(corners) for j in range(i + 1, corners)])
+    if len(triangulation.coplanar):
+        u = np.concatenate([u, triangulation.coplanar[:, 0]])
+        v = np.concatenate([v, triangulation.coplanar[:, 2]])
+    return _edge_graph(points, *_unique_pairs(u, v, len(points)))
+
+
+def knn_edges(points, k=10):
+    """Symmetrized k-nearest-neighbour graph. Usually, but not always, contains the MST."""
+    _require_scipy('knn')
+    points = _as_points(points)
+    k = min(k, len(points) - 1)
+    if k < 1:
+        return EdgeArrayGraph(len(points), [], [], [])
+    _, neighbors = cKDTree(points).query(points, k + 1)
+    u = np.repeat(np.arange(len(points)), k + 1)
+    return _edge_graph(points, *_unique_pairs(u, neighbors.ravel(), len(points)))
+
+
+class KDTree:
+    """Array-backed k-d tree: node i covers perm[start[i]:end[i]] inside the box
+    lo[i]..hi[i]. Children always come after their parent; leaves have left == -1."""
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        n, dims = points.shape
+        self.perm = np.arange(n, dtype=np.int64)
+        start, end, left, right, split_dim, split_value = [], [], [], [], [], []
+        lo, hi = [], []
+
+        def add(begin, finish):
+            block = points[self.perm[begin:finish]]
+            start.append(begin)
+            end.append(finish)
+            left.append(-1)
+            right.append(-1)
+            split_dim.append(0)
+            split_value.append(0.0)
+            lo.append(block.min(axis=0) if len(block) else np.zeros(dims))
+            hi.append(block.max(axis=0) if len(block) else np.zeros(dims))
+            return len(start) - 1
+
+        stack = [add(0, n)]
+        while stack:
+            node = stack.pop()
+            begin, finish = start[node], end[node]
+            if finish - begin <= leaf_size:
+                continue
+            # Split the widest dimension at the median
+            dim = int(np.argmax(hi[node] - lo[node]))
+            if hi[node][dim] == lo[node][dim]:
+                continue
+            middle = (begin + finish) // 2
+            segment = self.perm[begin:finish]
+            order = np.argpartition(points[segment, dim], middle - begin)
+            self.perm[begin:finish] = segment[order]
+            split_dim[node] = dim
+            split_value[node] = points[self.perm[middle], dim]
+            left[node] = add(begin, middle)
+            right[node] = add(middle, finish)
+            stack.append(left[node])
+            stack.append(right[node])
+
+        self.start = np.array(start, dtype=np.int64)
+        self.end = np.array(end, dtype=np.int64)
+        self.left = np.array(left, dtype=np.int64)
+        self.right = np.array(right, dtype=np.int64)
+        self.split_dim = np.array(split_dim, dtype=np.int64)
+        self.split_value = np.array(split_value, dtype=np.float64)
+        self.lo = np.array(lo, dtype=np.float64).reshape(-1, dims)
+        self.hi = np.array(hi, dtype=np.float64).reshape(-1, dims)
+
+
+def _node_components(left, right, start, end, perm, component, node_component):
+    # A node gets a component id when all of its points share it, otherwise -1.
+    # Children are numbered after their parent, so a reverse scan is bottom-up.
+    for node in range(len(left) - 1, -1, -1):
+        if left[node] == -1:
+            c = component[perm[start[node]]]
+            for i in range(start[node] + 1, end[node]):
+                if component[perm[i]] != c:
+                    c = -1
+                    break
+            node_component[node] = c
+        elif node_component[left[node]] == node_component[right[node]]:
+            node_component[node] = node_component[left[node]]
+        else:
+            node_component[node] = -1
+
+
+def _nearest_outside(points, perm, start, end, left, right, split_dim, split_value, lo, hi,
+                     component, node_component, best_dist, best_from, best_to, stack):
+    """For every component, the shortest edge to a point of another component.
+
+    Edges are ordered by (squared length, smaller endpoint, larger endpoint), a strict
+    order, so two components never pick different edges between them. Each query
+    point searches the tree with its component's best distance so far as the bound
+    and skips every node that lies entirely inside its own component.
+    """
+    dims = points.shape[1]
+    for index in range(len(perm)):
+        q = perm[index]
+        cq = component[q]
+        top = 0
+        stack[0] = 0
+        while top >= 0:
+            node = stack[top]
+            top -= 1
+            if node_component[node] == cq:
+                continue
+            box = 0.0
+            for j in range(dims):
+                x = points[q, j]
+                if x < lo[node, j]:
+                    box += (lo[node, j] - x) ** 2
+                elif x > hi[node, j]:
+                    box += (x - hi[node, j]) ** 2
+            if box > best_dist[cq]:
+                continue
+            if left[node] == -1:
+                for i in range(start[node], end[node]):
+                    p = perm[i]
+                    if component[p] == cq:
+                        continue
+                    distance = 0.0
+                    for j in range(dims):
+                        distance += (points[q, j] - points[p, j]) ** 2
+                    a, b = min(p, q), max(p, q)
+                    current = best_dist[cq]
+                    if distance < current or (distance == current and (
+                            a < min(best_from[cq], best_to[cq]) or
+                            (a == min(best_from[cq], best_to[cq]) and b < max(best_from[cq], best_to[cq])))):
+                        best_dist[cq] = distance
+                        best_from[cq] = q
+                        best_to[cq] = p
+            else:
+                # Visit the child on q's side of the split first
+                if points[q, split_dim[node]] < split_value[node]:
+                    near, far = left[node], right[node]
+                else:
+                    near, far = right[node], left[node]
+                stack[top + 1] = far
+                stack[top + 2] = near
+                top += 2
+
+
+if NUMBA_AVAILABLE:
+    _node_components_jit = njit(cache=True)(_node_components)
+    _nearest_outside_jit = njit(cache=True)(_nearest_outside)
+
+
+def boruvka_kdtree(points, use_numba=None, leaf_size=LEAF_SIZE):
+    """Exact Euclidean MST in any dimension: Borůvka rounds whose cheapest-edge step is
+    a component-aware nearest-neighbour search in a k-d tree. Returns (u, v, rounds)."""
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    elif use_numba and not NUMBA_AVAILABLE:
+        raise ImportError("numba is not installed")
+    node_components = _node_components_jit if use_numba else _node_components
+    nearest_outside = _nearest_outside_jit if use_numba else _nearest_outside
+
+    points = _as_points(points)
+    n = len(points)
+    tree = KDTree(points, leaf_size)
+    node_component = np.empty(len(tree.left), dtype=np.int64)
+    # Depth-first with both children pushed: at most two pending nodes per level
+    stack = np.empty(2 * len(tree.left).bit_length() + 64, dtype=np.int64)
+
+    component = np.arange(n, dtype=np.int64)
+    components = n
+    selected_u, selected_v = [], []
+    rounds = 0
+    while components > 1:
+        rounds += 1
+        node_components(tree.left, tree.right, tree.start, tree.end, tree.perm, component, node_component)
+        best_dist = np.full(components, np.inf)
+        best_from = np.full(components, -1, dtype=np.int64)
+        best_to = np.full(components, -1, dtype=np.int64)
+        nearest_outside(points, tree.perm, tree.start, tree.end, tree.left, tree.right,
+                        tree.split_dim, tree.split_value, tree.lo, tree.hi,
+                        component, node_component, best_dist, best_from, best_to, stack)
+
+        # Mutual choices are the same edge; keep each edge once
+        u, v = _unique_pairs(best_from, best_to, n)
+        selected_u.append(u)
+        selected_v.append(v)
+
+        # Contract with the same pointer-jumping step as the edge-array Borůvka
+        index = np.arange(components, dtype=np.int64)
+        labels, components = _contract(index, index, component[best_to], components)
+        component = labels[component]
+
+    if not selected_u:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), rounds
+    return np.concatenate(selected_u), np.concatenate(selected_v), rounds
+
+
+# Euclidean MST of a point set without building the complete graph
+def euclidean_mst(points, method='auto', k=10, use_numba=None):
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    points = _as_points(points)
+    if method == 'auto':
+        # Both are exact; the compiled k-d tree search beats Qhull, the pure-Python one does not
+        method = 'delaunay' if SCIPY_AVAILABLE and points.shape[1] == 2 and not use_numba else 'boruvka'
+
+    start_time = time.time()
+
+    if method == 'delaunay' and (len(points) < 2 or points.shape[1] < 2):
+        # Fewer than two points or 1-D points: Qhull rejects them with a plain ValueError
+        method = 'boruvka'
+    if method == 'delaunay':
+        try:
+            graph = delaunay_edges(points)
+        except QhullError:
+            # Too few or degenerate points (e.g. all collinear) have no triangulation
+            method = 'boruvka'
+
+    if method == 'boruvka':
+        u, v, rounds = boruvka_kdtree(points, use_numba)
+        graph = _edge_graph(points, u, v)
+        result = mst_result(graph, np.arange(graph.E), start_time, time.time())
+        result['rounds'] = rounds
+    else:
+        if method == 'knn':
+            graph = knn_edges(points, k)
+        result = kruskal_array(graph, use_numba)
+        result['time'] = time.time() - start_time
+        result['candidate_edges'] = graph.E
+    result['method'] = method
+    return result
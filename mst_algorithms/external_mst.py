@@ -0,0 +1,344 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from array_graph import EDGE_DTYPE, NUMBA_AVAILABLE, _kruskal_scan, _kruskal_scan_jit
+
+# Edges held in memory at once: one sorted run, one in-memory partition, or the sum
+# of all merge buffers. 4M EDGE_DTYPE records are 64 MB.
+DEFAULT_CHUNK_EDGES = 1 << 22
+
+# Runs merged together in one pass; more runs than this need an extra merge pass
+DEFAULT_FAN_IN = 64
+
+# Weights sampled to pick the pivot of a filter-Kruskal partition
+PIVOT_SAMPLE = 1 << 16
+
+
+def print_progress(phase, done, total):
+    """Progress callback that prints one line per phase, updated in place."""
+    end = '\n' if done >= total else ''
+    print(f"\r{phase}: {done}/{total} ({100.0 * done / max(total, 1):.1f}%)", end=end, flush=True)
+
+
+def open_edge_records(path):
+    """Memory-map an EDGE_DTYPE edge file (.npy or raw binary) written by save_edge_list."""
+    if str(path).endswith('.npy'):
+        records = np.load(path, mmap_mode='r')
+    elif os.path.getsize(path) == 0:
+        records = np.empty(0, dtype=EDGE_DTYPE)
+    else:
+        records = np.memmap(path, dtype=EDGE_DTYPE, mode='r')
+    if records.dtype != EDGE_DTYPE:
+        raise ValueError(f"expected records of dtype {EDGE_DTYPE}, got {records.dtype}")
+    return records
+
+
+def _new_stats(edges):
+    return {
+        'edges': edges,
+        'edges_scanned': 0,
+        'edges_filtered': 0,
+        'runs': 0,
+        'merge_passes': 0,
+        'partitions': 0,
+        'bytes_read': 0,
+        'bytes_written': 0,
+    }
+
+
+def _read_chunks(records, chunk_edges, stats):
+    # Copy consecutive slices of a (memory-mapped) record array into memory
+    for start in range(0, len(records), chunk_edges):
+        chunk = np.array(records[start:start + chunk_edges])
+        stats['bytes_read'] += chunk.nbytes
+        yield chunk
+
+
+def _read_block(handle, count, stats):
+    block = np.fromfile(handle, dtype=EDGE_DTYPE, count=count)
+    stats['bytes_read'] += block.nbytes
+    return block
+
+
+def _write_block(handle, block, stats):
+    block.tofile(handle)
+    stats['bytes_written'] += block.nbytes
+
+
+def _count_vertices(records, chunk_edges, stats):
+    highest = -1
+    for chunk in _read_chunks(records, chunk_edges, stats):
+        if len(chunk):
+            highest = max(highest, int(chunk['u'].max()), int(chunk['v'].max()))
+    return highest + 1
+
+
+class _UnionFind:
+    """The only per-vertex state kept in memory, plus the accepted MST edges."""
+
+    def __init__(self, vertices, use_numba):
+        self.use_numba = use_numba
+        self.target = max(vertices - 1, 0)
+        if use_numba:
+            self.parent = np.arange(vertices, dtype=EDGE_DTYPE['u'])
+            self.rank = np.zeros(vertices, dtype=np.int8)
+            self.selected = np.empty(self.target, dtype=np.int64)
+        else:
+            self.parent = list(range(vertices))
+            self.rank = [0] * vertices
+            self.selected = [0] * self.target
+        self.count = 0
+        self.mst = []
+
+    @property
+    def done(self):
+        return self.count >= self.target
+
+    def scan(self, block):
+        # Feed a block of edges sorted by weight through Kruskal's scan
+        before = self.count
+        if self.use_numba:
+            u = np.ascontiguousarray(block['u'])
+            v = np.ascontiguousarray(block['v'])
+            self.count = _kruskal_scan_jit(u, v, self.parent, self.rank, self.selected, before, 0)
+        else:
+            self.count = _kruskal_scan(block['u'].tolist(), block['v'].tolist(),
+                                       self.parent, self.rank, self.selected, before, 0)
+        accepted = block[np.asarray(self.selected[before:self.count], dtype=np.int64)]
+        self.mst.extend(zip(accepted['u'].tolist(), accepted['v'].tolist(), accepted['w'].tolist()))
+
+    def labels(self):
+        # Root of every vertex, by pointer jumping on a copy of the parent array
+        labels = np.asarray(self.parent, dtype=np.int64)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                return labels
+            labels = jumped
+
+
+def _write_runs(chunks, directory, stats):
+    # Sort each in-memory chunk by weight and write it out as one run. A stable sort
+    # keeps equal weights in input order, and runs are numbered in input order.
+    paths = []
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        path = os.path.join(directory, f"run_{stats['runs']:06d}.bin")
+        with open(path, 'wb') as handle:
+            _write_block(handle, chunk[np.argsort(chunk['w'], kind='stable')], stats)
+        paths.append(path)
+        stats['runs'] += 1
+    return paths
+
+
+def _merge_blocks(paths, block_edges, stats):
+    """k-way merge of sorted run files, yielding sorted blocks.
+
+    Each run keeps one buffered block. Every step finds the run whose last buffered
+    record is smallest in (weight, run) order; everything buffered at or below that
+    record cannot be preceded by anything still on disk, so it is merged with one
+    vectorized stable sort. Concatenating in run order makes ties come out in input
+    order, as with a single stable sort.
+    """
+    handles = [open(path, 'rb') for path in paths]
+    try:
+        buffers = [_read_block(handle, block_edges, stats) for handle in handles]
+        while True:
+            live = [i for i, buffer in enumerate(buffers) if len(buffer)]
+            if not live:
+                return
+            bound_run = min(live, key=lambda i: (buffers[i]['w'][-1], i))
+            bound = buffers[bound_run]['w'][-1]
+            parts = []
+            for i in live:
+                side = 'right' if i <= bound_run else 'left'
+                take = np.searchsorted(buffers[i]['w'], bound, side=side)
+                parts.append(buffers[i][:take])
+                buffers[i] = buffers[i][take:]
+                if not len(buffers[i]):
+                    buffers[i] = _read_block(handles[i], block_edges, stats)
+            merged = np.concatenate(parts)
+            yield merged[np.argsort(merged['w'], kind='stable')]
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _external_sort(chunks, directory, chunk_edges, fan_in, stats):
+    """Sorted runs plus k-way merge; yields the edges in weight order, block by block."""
+    runs = _write_runs(chunks, directory, stats)
+    while len(runs) > fan_in:
+        stats['merge_passes'] += 1
+        merged_runs = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start:start + fan_in]
+            if len(group) == 1:
+                merged_runs.append(group[0])
+                continue
+            path = os.path.join(directory, f"run_{stats['runs']:06d}.bin")
+            stats['runs'] += 1
+            with open(path, 'wb') as handle:
+                for block in _merge_blocks(group, max(1, chunk_edges // len(group)), stats):
+                    _write_block(handle, block, stats)
+            for old in group:
+                os.remove(old)
+            merged_runs.append(path)
+        runs = merged_runs
+
+    if runs:
+        stats['merge_passes'] += 1
+        yield from _merge_blocks(runs, max(1, chunk_edges // len(runs)), stats)
+
+
+def _scan_blocks(blocks, union_find, stats, progress):
+    for block in blocks:
+        union_find.scan(block)
+        stats['edges_scanned'] += len(block)
+        if progress:
+            progress('scan', stats['edges_scanned'], stats['edges'])
+        if union_find.done:
+            break
+
+
+def _external_result(union_find, stats, start_time, end_time):
+    weights = np.array([w for _, _, w in union_find.mst])
+    return {
+        'mst': union_find.mst,
+        'total_weight': weights.sum().item() if len(weights) else 0,
+        'time': end_time - start_time,
+        'io': stats
+    }
+
+
+def _prepare(path, vertices, chunk_edges, use_numba):
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    elif use_numba and not NUMBA_AVAILABLE:
+        raise ImportError("numba is not installed")
+    if chunk_edges < 1:
+        raise ValueError("chunk_edges must be positive")
+    records = open_edge_records(path)
+    stats = _new_stats(len(records))
+    if vertices is None:
+        vertices = _count_vertices(records, chunk_edges, stats)
+    return records, stats, _UnionFind(vertices, use_numba)
+
+
+# Out-of-core Kruskal's Algorithm: external merge sort, then one streaming scan
+def external_kruskal(path, vertices=None, chunk_edges=DEFAULT_CHUNK_EDGES, temp_dir=None,
+                     fan_in=DEFAULT_FAN_IN, use_numba=None, progress=None):
+    start_time = time.time()
+    records, stats, union_find = _prepare(path, vertices, chunk_edges, use_numba)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        blocks = _external_sort(_read_chunks(records, chunk_edges, stats), directory,
+                                chunk_edges, fan_in, stats)
+        _scan_blocks(blocks, union_find, stats, progress)
+        blocks.close()
+
+    end_time = time.time()
+
+    return _external_result(union_find, stats, start_time, end_time)
+
+
+def _partition(chunks, pivot, labels, light_path, heavy_path, stats):
+    # Split into w <= pivot and w > pivot, both in input order. Heavy edges whose
+    # endpoints are already connected can never join the MST and are dropped.
+    light_count = heavy_count = 0
+    with open(light_path, 'wb') as light, open(heavy_path, 'wb') as heavy:
+        for chunk in chunks:
+            if labels is not None:
+                chunk = chunk[labels[chunk['u']] != labels[chunk['v']]]
+            is_light = chunk['w'] <= pivot
+            _write_block(light, chunk[is_light], stats)
+            _write_block(heavy, chunk[~is_light], stats)
+            light_count += int(is_light.sum())
+            heavy_count += len(is_light) - int(is_light.sum())
+    return light_count, heavy_count
+
+
+# Out-of-core Filter-Kruskal: process the lightest edges in memory-sized partitions and
+# drop heavier edges that are already spanned before they are ever sorted
+def external_filter_kruskal(path, vertices=None, chunk_edges=DEFAULT_CHUNK_EDGES, temp_dir=None,
+                            fan_in=DEFAULT_FAN_IN, use_numba=None, progress=None):
+    start_time = time.time()
+    records, stats, union_find = _prepare(path, vertices, chunk_edges, use_numba)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        current = records
+        while len(current) and not union_find.done:
+            chunks = _read_chunks(current, chunk_edges, stats)
+            labels = union_find.labels() if union_find.count else None
+
+            if len(current) <= chunk_edges:
+                # Fits in memory: filter, sort and scan directly
+                part = np.concatenate(list(chunks))
+                if labels is not None:
+                    before = len(part)
+                    part = part[labels[part['u']] != labels[part['v']]]
+                    stats['edges_filtered'] += before - len(part)
+                stats['partitions'] += 1
+                _scan_blocks([part[np.argsort(part['w'], kind='stable')]], union_find, stats, progress)
+                break
+
+            # Pivot so that roughly one chunk of edges lands on the light side
+            sample = np.asarray(current['w'][::max(1, len(current) // PIVOT_SAMPLE)])
+            pivot = np.quantile(sample, min(1.0, chunk_edges / len(current)), method='lower')
+            stats['partitions'] += 1
+            light_path = os.path.join(directory, f"light_{stats['partitions']:06d}.bin")
+            heavy_path = os.path.join(directory, f"heavy_{stats['partitions']:06d}.bin")
+            light_count, heavy_count = _partition(chunks, pivot, labels, light_path, heavy_path, stats)
+            stats['edges_filtered'] += len(current) - light_count - heavy_count
+
+            light = open_edge_records(light_path)
+            if light_count <= chunk_edges:
+                part = np.array(light)
+                stats['bytes_read'] += part.nbytes
+                _scan_blocks([part[np.argsort(part['w'], kind='stable')]], union_find, stats, progress)
+            else:
+                # Too many ties at the pivot to fit in memory: sort this partition externally
+                blocks = _external_sort(_read_chunks(light, chunk_edges, stats), directory,
+                                        chunk_edges, fan_in, stats)
+                _scan_blocks(blocks, union_find, stats, progress)
+                blocks.close()
+            del light
+            os.remove(light_path)
+
+            if current is not records:
+                old_path = current.filename
+                del current
+                os.remove(old_path)
+            current = open_edge_records(heavy_path)
+        del current
+
+    end_time = time.time()
+
+    return _external_result(union_find, stats, start_time, end_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Out-of-core MST of an EDGE_DTYPE edge-list file")
+    parser.add_argument('path', help="edge file written by array_graph.save_edge_list (.npy or raw .bin)")
+    parser.add_argument('--vertices', type=int, help="vertex count (default: scan the file)")
+    parser.add_argument('--chunk-edges', type=int, default=DEFAULT_CHUNK_EDGES)
+    parser.add_argument('--temp-dir', help="directory for sorted runs (default: system temp)")
+    parser.add_argument('--method', choices=['sort', 'filter'], default='filter')
+    args = parser.parse_args()
+
+    algorithm = external_filter_kruskal if args.method == 'filter' else external_kruskal
+    result = algorithm(args.path, args.vertices, args.chunk_edges, args.temp_dir, progress=print_progress)
+
+    print(f"MST edges:    {len(result['mst'])}")
+    print(f"Total weight: {result['total_weight']}")
+    print(f"Time:         {result['time']:.3f} s")
+    for key, value in result['io'].items():
+        print(f"{key + ':':<15}{value}")
+
+
+if __name__ == "__main__":
+    main()
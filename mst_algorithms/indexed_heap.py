@@ -0,0 +1,109 @@
+class IndexedDaryHeap:
+    """Array-backed d-ary min-heap over the items 0..capacity-1 with decrease-key.
+
+    `heap` holds item ids in heap order, `keys[item]` is the item's current key and
+    `pos[item]` its index in `heap` (-1 when the item is not queued). Each item is in
+    the heap at most once, so the heap never grows past `capacity` entries.
+    """
+
+    def __init__(self, capacity, arity=4):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.heap = []
+        self.keys = [None] * capacity
+        self.pos = [-1] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.pos[item] >= 0
+
+    def key(self, item):
+        return self.keys[item]
+
+    def push(self, item, key):
+        if self.pos[item] >= 0:
+            raise KeyError(f"item {item} is already in the heap")
+        self.keys[item] = key
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, key):
+        if self.pos[item] < 0:
+            raise KeyError(f"item {item} is not in the heap")
+        if key > self.keys[item]:
+            raise ValueError(f"new key {key} is larger than current key {self.keys[item]}")
+        self.keys[item] = key
+        self._sift_up(self.pos[item])
+
+    def push_or_decrease(self, item, key):
+        # Insert the item, or lower its key if it is queued with a larger one.
+        # Returns True when the heap changed.
+        index = self.pos[item]
+        if index < 0:
+            self.keys[item] = key
+            self.heap.append(item)
+            self._sift_up(len(self.heap) - 1)
+            return True
+        if key < self.keys[item]:
+            self.keys[item] = key
+            self._sift_up(index)
+            return True
+        return False
+
+    def peek(self):
+        item = self.heap[0]
+        return self.keys[item], item
+
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return self.keys[top], top
+
+    def _sift_up(self, index):
+        heap, keys, pos, arity = self.heap, self.keys, self.pos, self.arity
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_item = heap[parent]
+            if keys[parent_item] <= key:
+                break
+            heap[index] = parent_item
+            pos[parent_item] = index
+            index = parent
+        heap[index] = item
+        pos[item] = index
+
+    def _sift_down(self, index):
+        heap, keys, pos, arity = self.heap, self.keys, self.pos, self.arity
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            first = index * arity + 1
+            if first >= size:
+                break
+            # Smallest of up to `arity` children
+            best = first
+            best_key = keys[heap[first]]
+            for child in range(first + 1, min(first + arity, size)):
+                child_key = keys[heap[child]]
+                if child_key < best_key:
+                    best = child
+                    best_key = child_key
+            if key <= best_key:
+                break
+            child_item = heap[best]
+            heap[index] = child_item
+            pos[child_item] = index
+            index = best
+        heap[index] = item
+        pos[item] = index
@@ -3,6 +3,9 @@ import time
 import sys
 from collections import defaultdict
 
+from array_graph import CSRGraph, kruskal_csr, prim_heap_csr, boruvka_csr
+from indexed_heap import IndexedDaryHeap
+
 class Graph:
     def __init__(self, vertices):
         self.V = vertices
@@ -55,6 +58,9 @@ def prim(graph):
 
 # Kruskal's Algorithm
 def kruskal(graph):
+    if isinstance(graph, CSRGraph):
+        return kruskal_csr(graph)
+
     start_time = time.time()
     
     result = []
@@ -93,9 +99,11 @@ def kruskal(graph):
 
 # Helper functions for Kruskal's Algorithm
 def find(parent, i):
-    if parent[i] != i:
-        parent[i] = find(parent, parent[i])
-    return parent[i]
+    # Iterative path halving; the recursive version hit the recursion limit on long chains
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
 
 def union(parent, rank, x, y):
     x_root = find(parent, x)
@@ -111,9 +119,13 @@ def union(parent, rank, x, y):
 
 # Borůvka's Algorithm
 def boruvka(graph):
+    if isinstance(graph, CSRGraph):
+        return boruvka_csr(graph)
+
     start_time = time.time()
     
     parent = list(range(graph.V))
+    rank = [0] * graph.V
     mst = []
     num_trees = graph.V
     
@@ -138,7 +150,7 @@ def boruvka(graph):
                 
                 if set1 != set2:
                     mst.append((u, v, w))
-                    union(parent, [0]*graph.V, set1, set2)
+                    union(parent, rank, set1, set2)
                     num_trees -= 1
     
     end_time = time.time()
@@ -153,6 +165,9 @@ def boruvka(graph):
 
 # Heap-based Prim's Algorithm for comparison
 def prim_heap(graph):
+    if isinstance(graph, CSRGraph):
+        return prim_heap_csr(graph)
+
     start_time = time.time()
     
     V = graph.V
@@ -163,8 +178,10 @@ def prim_heap(graph):
     heap = []
     heapq.heappush(heap, (0, 0))
     key[0] = 0
+    max_heap_size = 1
     
     while heap:
+        max_heap_size = max(max_heap_size, len(heap))
         current_key, u = heapq.heappop(heap)
         
         if mst_set[u]:
@@ -189,80 +206,71 @@ def prim_heap(graph):
     return {
         'mst': mst,
         'total_weight': total_weight,
-        'time': end_time - start_time
+        'time': end_time - start_time,
+        'max_heap_size': max_heap_size
+    }
+
+# Prim's Algorithm with an indexed d-ary heap: decrease-key keeps one entry per vertex
+def prim_indexed_heap(graph, arity=4):
+    start_time = time.time()
+    
+    V = graph.V
+    key = [sys.maxsize] * V
+    parent = [None] * V
+    mst_set = [False] * V
+    
+    heap = IndexedDaryHeap(V, arity)
+    max_heap_size = 0
+    
+    csr = isinstance(graph, CSRGraph)
+    if csr:
+        offsets = graph.offsets.tolist()
+    
+    # A disconnected graph gets a minimum spanning forest, one tree per component, like kruskal
+    for root in range(V):
+        if mst_set[root]:
+            continue
+        heap.push(root, 0)
+        key[root] = 0
+        while heap:
+            max_heap_size = max(max_heap_size, len(heap))
+            current_key, u = heap.pop()
+            mst_set[u] = True
+            
+            if csr:
+                begin, end = offsets[u], offsets[u + 1]
+                neighbours = zip(graph.neighbors[begin:end].tolist(), graph.weights[begin:end].tolist())
+            else:
+                neighbours = graph.adj[u]
+            
+            for v, w in neighbours:
+                if not mst_set[v] and w < key[v]:
+                    key[v] = w
+                    parent[v] = u
+                    heap.push_or_decrease(v, w)
+    
+    end_time = time.time()
+    
+    mst = []
+    total_weight = 0
+    for i in range(V):
+        if parent[i] is not None:
+            mst.append((parent[i], i, key[i]))
+            total_weight += key[i]
+    
+    return {
+        'mst': mst,
+        'total_weight': total_weight,
+        'time': end_time - start_time,
+        'max_heap_size': max_heap_size
     }
 
-# Example usage and complexity analysis
-def main():
-    # Create a sample graph
-    g = Graph(5)
-    g.add_edge(0, 1, 2)
-    g.add_edge(0, 3, 6)
-    g.add_edge(1, 2, 3)
-    g.add_edge(1, 3, 8)
-    g.add_edge(1, 4, 5)
-    g.add_edge(2, 4, 7)
-    g.add_edge(3, 4, 9)
-    
-    print("=== Minimum Spanning Tree Algorithms ===")
-    print()
-    
-    # Run Prim's Algorithm
-    prim_result = prim(g)
-    print("1. Prim's Algorithm:")
-    print(f"   MST: {prim_result['mst']}")
-    print(f"   Total Weight: {prim_result['total_weight']}")
-    print(f"   Execution Time: {prim_result['time']:.10f} seconds")
-    print(f"   Time Complexity: O(V^2)")
-    print(f"   Space Complexity: O(V)")
-    print()
-    
-    # Run Heap-based Prim's Algorithm
-    prim_heap_result = prim_heap(g)
-    print("2. Heap-based Prim's Algorithm:")
-    print(f"   MST: {prim_heap_result['mst']}")
-    print(f"   Total Weight: {prim_heap_result['total_weight']}")
-    print(f"   Execution Time: {prim_heap_result['time']:.10f} seconds")
-    print(f"   Time Complexity: O(E log V)")
-    print(f"   Space Complexity: O(V + E)")
-    print()
-    
-    # Run Kruskal's Algorithm
-    kruskal_result = kruskal(g)
-    print("3. Kruskal's Algorithm:")
-    print(f"   MST: {kruskal_result['mst']}")
-    print(f"   Total Weight: {kruskal_result['total_weight']}")
-    print(f"   Execution Time: {kruskal_result['time']:.10f} seconds")
-    print(f"   Time Complexity: O(E log E)")
-    print(f"   Space Complexity: O(E)")
-    print()
-    
-    # Run Borůvka's Algorithm
-    boruvka_result = boruvka(g)
-    print("4. Borůvka's Algorithm:")
-    print(f"   MST: {boruvka_result['mst']}")
-    print(f"   Total Weight: {boruvka_result['total_weight']}")
-    print(f"   Execution Time: {boruvka_result['time']:.10f} seconds")
-    print(f"   Time Complexity: O(E log V)")
-    print(f"   Space Complexity: O(V + E)")
-    print()
-    
-    print("=== Complexity Comparison ===")
-    print("\nAlgorithm | Time Complexity | Space Complexity")
-    print("--------------------------------------------")
-    print("Prim (Array) | O(V²) | O(V)")
-    print("Prim (Heap) | O(E log V) | O(V + E)")
-    print("Kruskal | O(E log E) | O(E)")
-    print("Borůvka | O(E log V) | O(V + E)")
-    print()
-    
-    print("=== Performance Comparison on Sample Graph ===")
-    print("\nAlgorithm | Execution Time (seconds)")
-    print("----------------------------------------")
-    print(f"Prim (Array) | {prim_result['time']:.10f}")
-    print(f"Prim (Heap) | {prim_heap_result['time']:.10f}")
-    print(f"Kruskal | {kruskal_result['time']:.10f}")
-    print(f"Borůvka | {boruvka_result['time']:.10f}")
+# Benchmark entry point
+def main(argv=None):
+    # Timings on a 5-vertex graph only measure interpreter overhead; run the benchmark
+    # suite on generated graphs instead (options as in benchmark.py, e.g. --scales 1e5 --json out.json)
+    from benchmark import main as benchmark_main
+    return benchmark_main(sys.argv[1:] if argv is None else list(argv))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,167 @@
+import time
+
+import numpy as np
+
+from array_graph import CSRGraph, NUMBA_AVAILABLE, mst_result
+
+if NUMBA_AVAILABLE:
+    import numba
+    from numba import njit, prange
+
+
+def _cheapest_edges_numpy(comp_u, comp_v, weights, components):
+    # Segment-min of the weights per component, then among the edges that hit the
+    # minimum the smallest position wins. Edge order is preserved between rounds, so
+    # (weight, position) is a strict total order and equal weights cannot form cycles.
+    count = len(comp_u)
+    best_weight = np.full(components, np.inf)
+    np.minimum.at(best_weight, comp_u, weights)
+    np.minimum.at(best_weight, comp_v, weights)
+
+    positions = np.arange(count, dtype=np.int64)
+    best = np.full(components, count, dtype=np.int64)
+    for comp in (comp_u, comp_v):
+        ties = weights == best_weight[comp]
+        np.minimum.at(best, comp[ties], positions[ties])
+    return best
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _cheapest_edges_numba(comp_u, comp_v, weights, components, chunks):
+        # Each thread scans a contiguous slice of edges into its own (weight, position)
+        # table; the tables are then min-reduced per component, also in parallel.
+        count = len(comp_u)
+        size = (count + chunks - 1) // chunks
+        local_weight = np.full((chunks, components), np.inf)
+        local_best = np.full((chunks, components), count, dtype=np.int64)
+        for t in prange(chunks):
+            row_weight = local_weight[t]
+            row_best = local_best[t]
+            for i in range(t * size, min(count, (t + 1) * size)):
+                w = weights[i]
+                a = comp_u[i]
+                if w < row_weight[a]:
+                    row_weight[a] = w
+                    row_best[a] = i
+                b = comp_v[i]
+                if w < row_weight[b]:
+                    row_weight[b] = w
+                    row_best[b] = i
+        best = np.empty(components, dtype=np.int64)
+        for c in prange(components):
+            m_weight = np.inf
+            m = count
+            for t in range(chunks):
+                if local_weight[t, c] < m_weight or (local_weight[t, c] == m_weight and local_best[t, c] < m):
+                    m_weight = local_weight[t, c]
+                    m = local_best[t, c]
+            best[c] = m
+        return best
+
+
+    @njit(parallel=True, cache=True)
+    def _relabel_numba(comp_u, comp_v, labels):
+        # In-place relabel of the endpoints; returns which edges still join two components
+        keep = np.empty(len(comp_u), dtype=np.bool_)
+        for i in prange(len(comp_u)):
+            a = labels[comp_u[i]]
+            b = labels[comp_v[i]]
+            comp_u[i] = a
+            comp_v[i] = b
+            keep[i] = a != b
+        return keep
+
+
+def _contract(best, comp_u, comp_v, components):
+    # Every component points at the component across its cheapest edge. With a strict
+    # (weight, position) order the pointer graph is a forest whose only cycles are mutual
+    # pairs; the smaller label of each pair becomes the root.
+    index = np.arange(components, dtype=np.int64)
+    successor = index.copy()
+    sources = np.nonzero(best < len(comp_u))[0]
+    chosen = best[sources]
+    successor[sources] = np.where(comp_u[chosen] == sources, comp_v[chosen], comp_u[chosen])
+    root = (successor[successor] == index) & (index < successor)
+    successor[root] = index[root]
+
+    # Pointer jumping until every component points at its root
+    while True:
+        jumped = successor[successor]
+        if np.array_equal(jumped, successor):
+            break
+        successor = jumped
+
+    # Number the roots 0..k-1 in order; every component takes its root's number
+    is_root = successor == index
+    numbering = np.cumsum(is_root) - 1
+    return numbering[successor].astype(comp_u.dtype, copy=False), int(numbering[-1]) + 1
+
+
+# Borůvka's Algorithm on edge arrays with vectorized (optionally multithreaded) rounds
+def boruvka_parallel(graph, use_numba=None, threads=None):
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+    elif use_numba and not NUMBA_AVAILABLE:
+        raise ImportError("numba is not installed")
+    if isinstance(graph, CSRGraph):
+        graph = graph.to_edge_array()
+
+    start_time = time.time()
+
+    # The numba thread count is a global setting; put it back so later kernels are unaffected
+    previous_threads = None
+    if use_numba and threads is not None:
+        previous_threads = numba.get_num_threads()
+        numba.set_num_threads(threads)
+    try:
+        mst_ids, rounds = _boruvka_rounds(graph, use_numba, numba.get_num_threads() if use_numba else 1)
+    finally:
+        if previous_threads is not None:
+            numba.set_num_threads(previous_threads)
+
+    end_time = time.time()
+
+    result = mst_result(graph, mst_ids, start_time, end_time)
+    result['rounds'] = rounds
+    return result
+
+
+def _boruvka_rounds(graph, use_numba, chunks):
+    # No global sort: each round only needs per-component minima. Self-loops are dropped.
+    index_dtype = np.int32 if graph.V < 2 ** 31 else np.int64
+    keep = graph.u != graph.v
+    edge_ids = np.nonzero(keep)[0]
+    comp_u = graph.u[keep].astype(index_dtype, copy=False)
+    comp_v = graph.v[keep].astype(index_dtype, copy=False)
+    weights = graph.w[keep].astype(np.float64, copy=False)
+
+    components = graph.V
+    selected = []
+    rounds = 0
+
+    while len(comp_u):
+        rounds += 1
+        if use_numba:
+            best = _cheapest_edges_numba(comp_u, comp_v, weights, components, chunks)
+        else:
+            best = _cheapest_edges_numpy(comp_u, comp_v, weights, components)
+
+        # Two components may share the same cheapest edge; count it once
+        marked = np.zeros(len(comp_u), dtype=bool)
+        marked[best[best < len(comp_u)]] = True
+        selected.append(edge_ids[marked])
+
+        # Contract: relabel endpoints with the merged component ids and drop edges
+        # that now lie inside a single component
+        labels, components = _contract(best, comp_u, comp_v, components)
+        if use_numba:
+            keep = _relabel_numba(comp_u, comp_v, labels)
+        else:
+            comp_u = labels[comp_u]
+            comp_v = labels[comp_v]
+            keep = comp_u != comp_v
+        edge_ids, comp_u, comp_v, weights = edge_ids[keep], comp_u[keep], comp_v[keep], weights[keep]
+
+    mst_ids = np.concatenate(selected) if selected else np.empty(0, dtype=np.int64)
+    return mst_ids, rounds
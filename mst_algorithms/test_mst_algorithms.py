@@ -0,0 +1,380 @@
+import sys
+import os
+import json
+import random
+import tempfile
+
+# 添加当前目录到路径，以便导入最小生成树模块
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from mst_algorithms import Graph, kruskal, prim, prim_heap, prim_indexed_heap, boruvka, find
+from indexed_heap import IndexedDaryHeap
+from array_graph import (EdgeArrayGraph, CSRGraph, kruskal_array, save_edge_list, load_edge_list,
+                         NUMBA_AVAILABLE)
+from parallel_boruvka import boruvka_parallel
+from dynamic_mst import DynamicMST
+from external_mst import external_kruskal, external_filter_kruskal
+from euclidean_mst import euclidean_mst, SCIPY_AVAILABLE
+import benchmark
+
+def random_connected_graph(vertices, extra_edges, seed, max_weight=20):
+    """生成随机连通图：先生成一棵随机树，再添加随机边"""
+    rng = random.Random(seed)
+    g = Graph(vertices)
+    for i in range(1, vertices):
+        g.add_edge(rng.randrange(i), i, rng.randint(1, max_weight))
+    for _ in range(extra_edges):
+        a, b = rng.randrange(vertices), rng.randrange(vertices)
+        if a != b:
+            g.add_edge(a, b, rng.randint(1, max_weight))
+    return g
+
+def test_kruskal_array_matches_kruskal():
+    """测试边数组Kruskal与列表版Kruskal结果完全一致"""
+    print("测试边数组Kruskal...")
+    for seed in range(50):
+        g = random_connected_graph(random.Random(seed).randint(1, 40), 80, seed)
+        edge_graph = EdgeArrayGraph.from_graph(g)
+        expected = kruskal(g)
+        for use_numba in ([False, True] if NUMBA_AVAILABLE else [False]):
+            result = kruskal_array(edge_graph, use_numba=use_numba)
+            assert result['mst'] == expected['mst'], f"种子 {seed} 的MST不一致"
+            assert result['total_weight'] == expected['total_weight']
+    print("边数组Kruskal测试通过！\n")
+
+def test_long_chain_without_recursion_limit():
+    """测试长链图上的并查集不会超出递归深度"""
+    print("测试长链图...")
+    n = sys.getrecursionlimit() * 3
+    g = Graph(n)
+    for i in range(n - 1):
+        g.add_edge(i, i + 1, 1)
+    # 手动构造一条很长的父指针链
+    parent = list(range(1, n)) + [n - 1]
+    assert find(parent, 0) == n - 1
+    assert kruskal(g)['total_weight'] == n - 1
+    assert kruskal_array(EdgeArrayGraph.from_graph(g))['total_weight'] == n - 1
+    print("长链图测试通过！\n")
+
+def test_edge_array_validation():
+    """测试边数组的输入检查"""
+    print("测试输入检查...")
+    for bad in [([0], [1, 2], [1, 1]), ([0], [5], [1]), ([-1], [0], [1]), ([0], [1], ['a'])]:
+        try:
+            EdgeArrayGraph(3, *bad)
+            assert False, f"应该拒绝 {bad}"
+        except ValueError:
+            pass
+    assert kruskal_array(EdgeArrayGraph(1, [], [], []))['mst'] == []
+    print("输入检查测试通过！\n")
+
+def test_csr_graph():
+    """测试CSR图上的Prim(堆)、Kruskal、Borůvka与列表版结果一致"""
+    print("测试CSR图...")
+    for seed in range(30):
+        g = random_connected_graph(random.Random(seed).randint(1, 40), 80, seed)
+        csr = CSRGraph.from_graph(g)
+        expected = prim(g)['total_weight']
+        for algorithm in (prim_heap, kruskal, boruvka):
+            result = algorithm(csr)
+            assert result['total_weight'] == expected, f"{algorithm.__name__} 在种子 {seed} 上结果错误"
+            assert len(result['mst']) == g.V - 1
+
+    # 顶点编号int32、权重float32时每条无向边约16字节
+    g = random_connected_graph(1000, 9000, 0)
+    csr = CSRGraph.from_graph(g, weight_dtype=np.float32)
+    assert csr.E == len(g.graph)
+    assert csr.bytes_per_edge() < 17
+    print("CSR图测试通过！\n")
+
+def test_memory_mapped_files():
+    """测试边列表文件和CSR文件以内存映射方式加载"""
+    print("测试文件加载...")
+    g = random_connected_graph(200, 1000, 3)
+    expected = kruskal(g)['total_weight']
+    edges = EdgeArrayGraph.from_graph(g)
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ('edges.npy', 'edges.bin'):
+            path = os.path.join(directory, name)
+            save_edge_list(edges, path)
+            loaded = load_edge_list(path)
+            assert loaded.V == g.V and loaded.E == edges.E
+            assert kruskal_array(loaded)['total_weight'] == expected
+            assert kruskal(CSRGraph.from_edge_file(path))['total_weight'] == expected
+
+        prefix = os.path.join(directory, 'graph')
+        CSRGraph.from_edge_array(edges).save(prefix)
+        loaded = CSRGraph.load(prefix)
+        assert isinstance(loaded.neighbors, np.memmap)
+        assert prim_heap(loaded)['total_weight'] == expected
+        del loaded
+    print("文件加载测试通过！\n")
+
+def test_boruvka_parallel():
+    """测试向量化Borůvka，包括大量相同权重的边和非连通图"""
+    print("测试向量化Borůvka...")
+    for seed in range(60):
+        rng = random.Random(seed)
+        # max_weight为1时所有边权重相同，检验平局处理不会产生环
+        g = random_connected_graph(rng.randint(1, 40), rng.randint(0, 80), seed, max_weight=rng.choice([1, 3, 20]))
+        expected = kruskal(g)['total_weight']
+        for use_numba in ([False, True] if NUMBA_AVAILABLE else [False]):
+            result = boruvka_parallel(EdgeArrayGraph.from_graph(g), use_numba=use_numba)
+            assert result['total_weight'] == expected, f"种子 {seed} 的总权重错误"
+            assert len(result['mst']) == g.V - 1
+        assert boruvka_parallel(CSRGraph.from_graph(g))['total_weight'] == expected
+
+    # 非连通图返回最小生成森林
+    g = Graph(6)
+    g.add_edge(0, 1, 1)
+    g.add_edge(2, 3, 2)
+    g.add_edge(3, 4, 1)
+    g.add_edge(2, 2, 0)
+    result = boruvka_parallel(EdgeArrayGraph.from_graph(g))
+    assert sorted(result['mst']) == [(0, 1, 1), (2, 3, 2), (3, 4, 1)]
+
+    # threads只作用于本次调用，之后numba的全局线程数恢复原值
+    if NUMBA_AVAILABLE:
+        import numba
+        before = numba.get_num_threads()
+        boruvka_parallel(EdgeArrayGraph.from_graph(g), use_numba=True, threads=1)
+        assert numba.get_num_threads() == before
+    print("向量化Borůvka测试通过！\n")
+
+def test_indexed_heap():
+    """测试带位置索引的d叉堆：decrease-key后仍按键值顺序弹出"""
+    print("测试索引堆...")
+    for arity in (2, 3, 4, 8):
+        rng = random.Random(arity)
+        keys = [rng.random() for _ in range(300)]
+        heap = IndexedDaryHeap(len(keys), arity)
+        for item, key in enumerate(keys):
+            heap.push(item, key + 1)
+        for item in range(0, len(keys), 3):
+            heap.decrease_key(item, keys[item])
+        assert not heap.push_or_decrease(1, 5)
+        popped = [heap.pop() for _ in range(len(keys))]
+        assert [key for key, _ in popped] == sorted(key for key, _ in popped)
+        assert sorted(item for _, item in popped) == list(range(len(keys)))
+        assert len(heap) == 0 and 0 not in heap
+
+    heap = IndexedDaryHeap(3)
+    heap.push(0, 1)
+    for bad_call in (lambda: heap.push(0, 2), lambda: heap.decrease_key(1, 0), lambda: heap.decrease_key(0, 9)):
+        try:
+            bad_call()
+            assert False, "应该抛出异常"
+        except (KeyError, ValueError):
+            pass
+    print("索引堆测试通过！\n")
+
+def test_prim_indexed_heap():
+    """测试基于索引堆的Prim：结果正确且堆中条目不超过V"""
+    print("测试索引堆Prim...")
+    for seed in range(30):
+        g = random_connected_graph(random.Random(seed).randint(1, 40), 200, seed)
+        expected = prim(g)['total_weight']
+        for arity in (2, 4):
+            for graph in (g, CSRGraph.from_graph(g)):
+                result = prim_indexed_heap(graph, arity)
+                assert result['total_weight'] == expected
+                assert result['max_heap_size'] <= g.V
+
+    # 非连通图：返回最小生成森林（每个连通分量一棵树，顶点6孤立），不包含 (None, v, sys.maxsize) 这样的伪边
+    g = Graph(7)
+    for u, v, w in [(0, 1, 4), (1, 2, 1), (0, 2, 3), (3, 4, 2), (4, 5, 5), (3, 5, 1)]:
+        g.add_edge(u, v, w)
+    for graph in (g, CSRGraph.from_graph(g)):
+        result = prim_indexed_heap(graph)
+        assert result['total_weight'] == 7
+        assert sorted(tuple(sorted((u, v))) + (w,) for u, v, w in result['mst']) == \
+            [(0, 2, 3), (1, 2, 1), (3, 4, 2), (3, 5, 1)]
+    assert prim_indexed_heap(Graph(0))['mst'] == []
+    print("索引堆Prim测试通过！\n")
+
+def test_dynamic_mst():
+    """测试动态MST：随机插入/删除边后，总权重与重新运行Kruskal一致"""
+    print("测试动态MST...")
+    for seed in range(100):
+        rng = random.Random(seed)
+        vertices = rng.randint(1, 25)
+        edges = [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 10))
+                 for _ in range(rng.randint(0, 30))]
+        dynamic = DynamicMST(vertices, edges)
+        live = dict(dynamic.edges)
+        for _ in range(40):
+            if live and rng.random() < 0.45:
+                edge_id = rng.choice(list(live))
+                dynamic.delete_edge(edge_id)
+                del live[edge_id]
+            else:
+                edge = (rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 10))
+                live[dynamic.insert_edge(*edge)] = edge
+            # 图可能不连通，用边数组Kruskal求最小生成森林作为参照
+            expected = kruskal_array(EdgeArrayGraph.from_edges(vertices, list(live.values())))
+            result = dynamic.result()
+            assert result['total_weight'] == expected['total_weight'], f"种子 {seed} 的总权重错误"
+            assert len(result['mst']) == len(expected['mst'])
+
+    # 插入更轻的边会替换环上最重的边，删除树边后找到替代边
+    dynamic = DynamicMST(3, [(0, 1, 5), (1, 2, 5), (0, 2, 9)])
+    assert sorted(dynamic.mst()) == [(0, 1, 5), (1, 2, 5)]
+    light = dynamic.insert_edge(0, 2, 1)
+    assert dynamic.total_weight == 6 and dynamic.is_tree_edge(light)
+    dynamic.delete_edge(light)
+    assert dynamic.total_weight == 10
+    assert dynamic.find_edges(2, 0) == [2]
+    try:
+        dynamic.delete_edge(light)
+        assert False, "应该抛出KeyError"
+    except KeyError:
+        pass
+
+    # 初始边按输入顺序编号：delete_edge(i) 删除的就是传入的第i条边
+    edges = [(0, 1, 9), (1, 2, 1), (0, 2, 4), (2, 3, 2)]
+    dynamic = DynamicMST(4, edges)
+    assert all(dynamic.edges[i] == edge for i, edge in enumerate(edges))
+    dynamic.delete_edge(1)
+    assert (1, 2, 1) not in dynamic.edges.values() and dynamic.total_weight == 15
+
+    # 删除树边的代价取决于较小分量：barbell图中删除桥边时较小分量是整整一半的顶点
+    workloads = [('random', benchmark.random_graph, 200, 600, ('insert', 'delete_non_tree', 'delete_tree')),
+                 ('barbell', benchmark.barbell_graph, 200, 600, ('delete_bridge',))]
+    rows = benchmark.benchmark_dynamic(workloads, updates=20)
+    assert [row['operation'] for row in rows] == ['insert', 'delete_non_tree', 'delete_tree', 'delete_bridge']
+    assert rows[0]['vertices_scanned'] == rows[1]['vertices_scanned'] == 0
+    assert 0 < rows[2]['vertices_scanned'] < 100
+    assert rows[3]['vertices_scanned'] == 100 and rows[3]['edges_scanned'] >= 100
+    print("动态MST测试通过！\n")
+
+def test_external_mst():
+    """测试外存Kruskal：小块大小迫使多路归并、多轮合并和分区，结果与内存版完全一致"""
+    print("测试外存Kruskal...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'edges.bin')
+        for seed in range(20):
+            rng = random.Random(seed)
+            g = random_connected_graph(rng.randint(1, 60), rng.randint(0, 300), seed, max_weight=rng.choice([1, 3, 50]))
+            edges = EdgeArrayGraph.from_graph(g)
+            save_edge_list(edges, path)
+            expected = kruskal_array(edges)
+            for algorithm in (external_kruskal, external_filter_kruskal):
+                for chunk_edges in (5, 40, 10 ** 6):
+                    result = algorithm(path, g.V, chunk_edges=chunk_edges, fan_in=3, temp_dir=directory)
+                    assert result['mst'] == expected['mst'], f"{algorithm.__name__} 在种子 {seed} 上结果错误"
+                    assert result['total_weight'] == expected['total_weight']
+
+        # 统计信息：排序版写出所有边，过滤版丢弃已连通的重边
+        g = random_connected_graph(500, 5000, 1)
+        save_edge_list(EdgeArrayGraph.from_graph(g), path)
+        io = external_kruskal(path, chunk_edges=1000)['io']
+        assert io['runs'] >= 6 and io['bytes_written'] >= io['edges'] * 16
+        io = external_filter_kruskal(path, chunk_edges=1000)['io']
+        assert io['partitions'] >= 2 and io['edges_filtered'] > 0
+        assert sorted(os.listdir(directory)) == ['edges.bin']
+    print("外存Kruskal测试通过！\n")
+
+def test_benchmark_suite():
+    """测试基准测试的图生成器和完整测试流程"""
+    print("测试基准测试...")
+    for kind, generate in benchmark.GENERATORS.items():
+        edges = generate(2000, seed=1)
+        # 生成的图连通、无自环，边数接近目标
+        assert 1500 <= edges.E <= 2500, f"{kind} 图的边数为 {edges.E}"
+        assert not (edges.u == edges.v).any()
+        assert len(kruskal_array(edges)['mst']) == edges.V - 1, f"{kind} 图不连通"
+
+    rows = benchmark.run_suite(scales=[500], repeats=1, verbose=False)
+    assert len(rows) == len(benchmark.GENERATORS) * len(benchmark.SUITE_ALGORITHMS)
+    assert all(row['agrees'] and row['edges_per_sec'] > 0 and row['peak_memory_bytes'] >= 0 for row in rows)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.json')
+        benchmark.write_json(rows, path)
+        with open(path, encoding='utf-8') as f:
+            assert len(json.load(f)['results']) == len(rows)
+    print("基准测试测试通过！\n")
+
+def test_main_arguments():
+    """测试入口参数：原样传给benchmark.main，没有指定基准测试名时由benchmark.main默认运行full"""
+    import mst_algorithms
+    original = benchmark.main
+    benchmark.main = lambda argv: argv
+    try:
+        assert mst_algorithms.main([]) == []
+        assert mst_algorithms.main(['--scales', '1e5']) == ['--scales', '1e5']
+        assert mst_algorithms.main(['prim']) == ['prim']
+        assert mst_algorithms.main(['full', '--json', 'out.json']) == ['full', '--json', 'out.json']
+    finally:
+        benchmark.main = original
+
+def test_euclidean_mst():
+    """测试欧氏MST：与完全图上的Kruskal比较，包括重复点、共线点和大量等长边"""
+    print("测试欧氏MST...")
+    rng = np.random.default_rng(0)
+    methods = ['auto', 'boruvka'] + (['delaunay'] if SCIPY_AVAILABLE else [])
+    for trial in range(24):
+        dims = [2, 3, 5][trial % 3]
+        n = int(rng.integers(1, 80))
+        shape = trial % 4
+        if shape == 0:
+            points = rng.random((n, dims))
+        elif shape == 1:
+            points = rng.integers(0, 4, (n, dims)).astype(float)
+        elif shape == 2:
+            points = np.zeros((n, dims))
+            points[:, 0] = rng.random(n)
+        else:
+            points = np.repeat(rng.random((max(1, n // 3), dims)), 3, axis=0)
+
+        u, v = np.triu_indices(len(points), 1)
+        complete = EdgeArrayGraph(len(points), u, v, np.sqrt(((points[u] - points[v]) ** 2).sum(axis=1)))
+        expected = kruskal_array(complete)['total_weight']
+        for method in methods:
+            for use_numba in ([False, True] if NUMBA_AVAILABLE else [False]):
+                result = euclidean_mst(points, method, use_numba=use_numba)
+                assert abs(result['total_weight'] - expected) < 1e-9 * max(1, expected), \
+                    f"{method} 在第 {trial} 组点上结果错误"
+                assert len(result['mst']) == max(len(points) - 1, 0)
+
+    # 0个点、1个点和一维坐标：所有方法都返回同样的结果，而不是由scipy抛出ValueError
+    for points in (np.zeros((0, 2)), np.zeros((1, 3)), np.array([[3.0], [0.0], [1.0]])):
+        results = [euclidean_mst(points, method) for method in methods + (['knn'] if SCIPY_AVAILABLE else [])]
+        assert all(len(result['mst']) == max(len(points) - 1, 0) for result in results)
+        assert len({result['total_weight'] for result in results}) == 1
+
+    for points in (np.zeros(5), np.zeros((5, 0))):
+        try:
+            euclidean_mst(points)
+            assert False, "应该拒绝形状错误的输入"
+        except ValueError:
+            pass
+    print("欧氏MST测试通过！\n")
+
+def run_all_tests():
+    """运行所有测试"""
+    print("=" * 60)
+    print("最小生成树测试套件")
+    print("=" * 60)
+
+    test_kruskal_array_matches_kruskal()
+    test_long_chain_without_recursion_limit()
+    test_edge_array_validation()
+    test_csr_graph()
+    test_memory_mapped_files()
+    test_boruvka_parallel()
+    test_indexed_heap()
+    test_prim_indexed_heap()
+    test_dynamic_mst()
+    test_external_mst()
+    test_euclidean_mst()
+    test_benchmark_suite()
+    test_main_arguments()
+
+    print("=" * 60)
+    print("所有测试通过！")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,434 @@
+"""
+有序映射结构基准测试
+
+operations：对每种结构分别测量随机顺序插入、查找、删除的吞吐量（每秒操作数），
+支持 from_sorted 的结构另外测量从有序序列批量构建；用tracemalloc测量每个键占用的内存。
+
+snapshots：每次更新后都保留一个时间点快照，比较持久化红黑树（路径复制）与
+“可变红黑树 + copy.deepcopy”的更新吞吐量和每个快照占用的内存。
+
+concurrent：多个线程按给定的读写比例共享一棵树（读操作为查找和短范围扫描），
+比较全局互斥锁、读写锁、读写锁 + 批量写入的总吞吐量和锁争用情况。
+
+使用方法：
+    python benchmark.py                               # operations，默认100万个键
+    python benchmark.py --sizes 100000 1000000 --repeats 3 --json results.json
+    python benchmark.py snapshots --sizes 100000 --updates 10000 --copies 20
+    python benchmark.py concurrent --threads 1 4 8 --read-ratios 0.5 0.9 0.99
+"""
+
+import argparse
+import copy
+import gc
+import json
+import platform
+import random
+import statistics
+import threading
+import time
+import tracemalloc
+
+from red_black_tree import RedBlackTree
+from compact_red_black_tree import CompactRedBlackTree
+from persistent_red_black_tree import PersistentRedBlackTree
+from concurrent_red_black_tree import ConcurrentRedBlackTree
+
+# 名称 -> 构造函数。结构需要提供 insert(key, value)、search(key)、delete(key)，
+# 可选的类方法 from_sorted(items) 用于批量构建
+STRUCTURES = {
+    'RedBlackTree': RedBlackTree,
+    'CompactRedBlackTree': CompactRedBlackTree,
+}
+
+DEFAULT_SIZES = [1000000]
+
+SUITES = ('operations', 'snapshots', 'concurrent')
+DEFAULT_SNAPSHOT_SIZES = [100000]
+DEFAULT_UPDATES = 10000
+DEFAULT_COPIES = 20
+
+DEFAULT_CONCURRENT_SIZES = [100000]
+DEFAULT_THREADS = [1, 4, 8]
+DEFAULT_READ_RATIOS = [0.5, 0.9, 0.99]
+DEFAULT_OPERATIONS_PER_THREAD = 20000
+RANGE_SCAN_FRACTION = 0.1  # 读操作中短范围扫描所占的比例
+RANGE_SCAN_WIDTH = 32
+WRITE_BATCH_SIZE = 64
+
+
+def _time(function, repeats):
+    times = []
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - begin)
+    return statistics.median(times)
+
+
+def build(factory, keys):
+    tree = factory()
+    insert = tree.insert
+    for key in keys:
+        insert(key, key)
+    return tree
+
+
+def measure_memory(factory, keys):
+    """建树过程中新分配的字节数（键和值是预先存在的对象，不计入）"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tree = build(factory, keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return current - baseline
+
+
+def benchmark_structure(name, factory, size, repeats=1, seed=0, memory=True):
+    rng = random.Random(seed)
+    keys = list(range(size))
+    insert_order = keys[:]
+    rng.shuffle(insert_order)
+    search_order = keys[:]
+    rng.shuffle(search_order)
+    delete_order = keys[:]
+    rng.shuffle(delete_order)
+
+    row = {'structure': name, 'size': size, 'repeats': repeats}
+
+    # 插入、查找、删除各自计时；每次重复都从新建树开始
+    insert_times, search_times, delete_times = [], [], []
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        tree = build(factory, insert_order)
+        insert_times.append(time.perf_counter() - begin)
+
+        search = tree.search
+        begin = time.perf_counter()
+        for key in search_order:
+            search(key)
+        search_times.append(time.perf_counter() - begin)
+
+        delete = tree.delete
+        begin = time.perf_counter()
+        for key in delete_order:
+            delete(key)
+        delete_times.append(time.perf_counter() - begin)
+        del tree
+
+    for operation, times in (('insert', insert_times), ('search', search_times), ('delete', delete_times)):
+        median = statistics.median(times)
+        row[f'{operation}_time'] = median
+        row[f'{operation}_ops_per_sec'] = size / median if median else float('inf')
+
+    if hasattr(factory, 'from_sorted'):
+        items = [(key, key) for key in keys]
+        median = _time(lambda: factory.from_sorted(items), repeats)
+        row['bulk_load_time'] = median
+        row['bulk_load_ops_per_sec'] = size / median if median else float('inf')
+
+    if memory:
+        row['bytes_per_key'] = measure_memory(factory, insert_order) / size if size else 0.0
+    return row
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, structures=tuple(STRUCTURES), repeats=1, seed=0, memory=True, verbose=True):
+    rows = []
+    for size in sizes:
+        for name in structures:
+            row = benchmark_structure(name, STRUCTURES[name], size, repeats, seed, memory)
+            rows.append(row)
+            if verbose:
+                print_row(row)
+    return rows
+
+
+def print_row(row):
+    def rate(key):
+        return f"{row[key]:>12,.0f}" if key in row else f"{'-':>12}"
+
+    memory = f"{row['bytes_per_key']:>8.1f}" if 'bytes_per_key' in row else f"{'-':>8}"
+    print(f"{row['structure']:<22} {row['size']:>9}  插入 {rate('insert_ops_per_sec')}/s  "
+          f"查找 {rate('search_ops_per_sec')}/s  删除 {rate('delete_ops_per_sec')}/s  "
+          f"批量构建 {rate('bulk_load_ops_per_sec')}/s  每键 {memory} B")
+
+
+def _snapshot_workload(size, updates, seed):
+    # 基础键为偶数；更新交替插入一个新的奇数键和删除一个已有的偶数键
+    rng = random.Random(seed)
+    base = list(range(0, 2 * size, 2))
+    rng.shuffle(base)
+    inserted = rng.sample(range(1, 2 * size, 2), (updates + 1) // 2)
+    deleted = rng.sample(base, updates // 2)
+    operations = []
+    for i in range(updates):
+        operations.append(('insert', inserted[i // 2]) if i % 2 == 0 else ('delete', deleted[i // 2]))
+    return base, operations
+
+
+def _persistent_updates(tree, operations):
+    versions = [tree]
+    for operation, key in operations:
+        tree = tree.insert(key, key) if operation == 'insert' else tree.delete(key)
+        versions.append(tree)
+    return versions
+
+
+def _deepcopy_updates(tree, operations):
+    snapshots = []
+    for operation, key in operations:
+        snapshots.append(copy.deepcopy(tree))
+        if operation == 'insert':
+            tree.insert(key, key)
+        else:
+            tree.delete(key)
+    return snapshots
+
+
+def _timed_and_traced(function, *args):
+    # 先计时，再在 tracemalloc 下重跑一次测量保留下来的内存
+    begin = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - begin
+    del result
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = function(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, current - baseline
+
+
+def benchmark_snapshots(size, updates=DEFAULT_UPDATES, copies=DEFAULT_COPIES, seed=0, memory=True,
+                        freeze_gc=False):
+    """每次更新前（后）保留快照时，路径复制与深拷贝的吞吐量和内存"""
+    base, operations = _snapshot_workload(size, updates, seed)
+    rows = []
+
+    persistent = PersistentRedBlackTree()
+    for key in base:
+        persistent = persistent.insert(key, key)
+    if freeze_gc:
+        # 持久化节点之间不会形成环，把已建好的基础树移出循环垃圾回收的扫描范围
+        gc.freeze()
+    if memory:
+        elapsed, retained = _timed_and_traced(_persistent_updates, persistent, operations)
+    else:
+        begin = time.perf_counter()
+        _persistent_updates(persistent, operations)
+        elapsed, retained = time.perf_counter() - begin, None
+    if freeze_gc:
+        gc.unfreeze()
+    rows.append({'method': 'persistent', 'size': size, 'updates': updates, 'time': elapsed,
+                 'ops_per_sec': updates / elapsed, 'bytes_per_snapshot': retained / updates if memory else None})
+
+    # 深拷贝每次 O(n)，只做 copies 次；计时和测内存都从同一棵原树的副本开始
+    subset = operations[:copies]
+    mutable = build(RedBlackTree, base)
+    tree = copy.deepcopy(mutable)
+    begin = time.perf_counter()
+    snapshots = _deepcopy_updates(tree, subset)
+    elapsed = time.perf_counter() - begin
+    del snapshots, tree
+    retained = None
+    if memory:
+        tree = copy.deepcopy(mutable)
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        snapshots = _deepcopy_updates(tree, subset)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del snapshots
+        retained = current - baseline
+    rows.append({'method': 'deepcopy', 'size': size, 'updates': copies, 'time': elapsed,
+                 'ops_per_sec': copies / elapsed, 'bytes_per_snapshot': retained / copies if memory else None})
+
+    # 不保留快照的可变红黑树，作为更新吞吐量的参照
+    begin = time.perf_counter()
+    for operation, key in operations:
+        if operation == 'insert':
+            mutable.insert(key, key)
+        else:
+            mutable.delete(key)
+    elapsed = time.perf_counter() - begin
+    rows.append({'method': 'mutable', 'size': size, 'updates': updates, 'time': elapsed,
+                 'ops_per_sec': updates / elapsed, 'bytes_per_snapshot': None})
+    return rows
+
+
+def run_snapshots(sizes=DEFAULT_SNAPSHOT_SIZES, updates=DEFAULT_UPDATES, copies=DEFAULT_COPIES,
+                  seed=0, memory=True, freeze_gc=False, verbose=True):
+    rows = []
+    for size in sizes:
+        for row in benchmark_snapshots(size, updates, copies, seed, memory, freeze_gc):
+            rows.append(row)
+            if verbose:
+                snapshot = f"{row['bytes_per_snapshot']:>14,.0f} B" if row['bytes_per_snapshot'] is not None else f"{'-':>16}"
+                print(f"{row['method']:<12} {row['size']:>9}  更新 {row['ops_per_sec']:>11,.2f}/s  每个快照 {snapshot}")
+    return rows
+
+
+class GlobalLockTree:
+    """对照组：每个调用都包在同一把互斥锁里"""
+
+    def __init__(self, tree):
+        self._tree = tree
+        self._lock = threading.Lock()
+
+    def search(self, key):
+        with self._lock:
+            return self._tree.search(key)
+
+    def range(self, lo, hi):
+        with self._lock:
+            return list(self._tree.range(lo, hi))
+
+    def insert(self, key, value):
+        with self._lock:
+            self._tree.insert(key, value)
+
+    def delete(self, key):
+        with self._lock:
+            return self._tree.delete(key)
+
+
+CONCURRENT_METHODS = ('global-lock', 'rwlock', 'rwlock-batch')
+
+
+def _thread_operations(size, count, read_ratio, seed):
+    # 读操作：查找或 [key, key + RANGE_SCAN_WIDTH] 范围扫描；写操作：插入或删除一个奇数键（基础键为偶数）
+    rng = random.Random(seed)
+    operations = []
+    for _ in range(count):
+        if rng.random() < read_ratio:
+            kind = 'range' if rng.random() < RANGE_SCAN_FRACTION else 'search'
+            operations.append((kind, rng.randrange(2 * size)))
+        else:
+            kind = 'insert' if rng.random() < 0.5 else 'delete'
+            operations.append((kind, rng.randrange(1, 2 * size, 2)))
+    return operations
+
+
+def _run_worker(tree, operations, batched, barrier):
+    search = tree.search
+    scan = tree.range
+    pending = []
+    barrier.wait()
+    for kind, key in operations:
+        if kind == 'search':
+            search(key)
+        elif kind == 'range':
+            scan(key, key + RANGE_SCAN_WIDTH)
+        elif batched:
+            pending.append(('insert', key, key) if kind == 'insert' else ('delete', key))
+            if len(pending) >= WRITE_BATCH_SIZE:
+                tree.apply_batch(pending)
+                pending = []
+        elif kind == 'insert':
+            tree.insert(key, key)
+        else:
+            tree.delete(key)
+    if pending:
+        tree.apply_batch(pending)
+
+
+def benchmark_concurrent(method, size, threads, read_ratio, operations_per_thread=DEFAULT_OPERATIONS_PER_THREAD,
+                         seed=0):
+    """threads 个线程各执行 operations_per_thread 个操作的总吞吐量"""
+    base = list(range(0, 2 * size, 2))
+    random.Random(seed).shuffle(base)
+    tree = build(RedBlackTree, base)
+    shared = GlobalLockTree(tree) if method == 'global-lock' else ConcurrentRedBlackTree(tree)
+    workloads = [_thread_operations(size, operations_per_thread, read_ratio, seed + 1 + i) for i in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=_run_worker, args=(shared, workload, method == 'rwlock-batch', barrier))
+               for workload in workloads]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    begin = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - begin
+
+    total = threads * operations_per_thread
+    row = {'method': method, 'size': size, 'threads': threads, 'read_ratio': read_ratio,
+           'operations': total, 'time': elapsed, 'ops_per_sec': total / elapsed}
+    if method != 'global-lock':
+        row.update(shared.metrics())
+    return row
+
+
+def run_concurrent(sizes=DEFAULT_CONCURRENT_SIZES, threads=DEFAULT_THREADS, read_ratios=DEFAULT_READ_RATIOS,
+                   operations_per_thread=DEFAULT_OPERATIONS_PER_THREAD, seed=0, verbose=True):
+    rows = []
+    for size in sizes:
+        for read_ratio in read_ratios:
+            for count in threads:
+                for method in CONCURRENT_METHODS:
+                    row = benchmark_concurrent(method, size, count, read_ratio, operations_per_thread, seed)
+                    rows.append(row)
+                    if verbose:
+                        print_concurrent_row(row)
+    return rows
+
+
+def print_concurrent_row(row):
+    contention = ""
+    if 'read_acquires' in row:
+        acquires = row['read_acquires'] + row['write_acquires']
+        contended = row['read_contended'] + row['write_contended']
+        wait = row['read_wait_time'] + row['write_wait_time']
+        contention = (f"  等待 {contended / acquires:>6.1%}  总等待 {wait:>7.3f}s"
+                      f"  最多同时读 {row['max_readers']}")
+    print(f"{row['method']:<13} {row['size']:>8}  读 {row['read_ratio']:>4.0%}  线程 {row['threads']:>2}  "
+          f"{row['ops_per_sec']:>10,.0f} 操作/s{contention}")
+
+
+def write_json(rows, path, config=None):
+    environment = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment, 'config': config or {}, 'results': rows},
+                  f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="有序映射结构基准测试")
+    parser.add_argument('suite', nargs='?', default='operations', choices=SUITES)
+    parser.add_argument('--sizes', type=int, nargs='+', help="键的数量")
+    parser.add_argument('--structures', nargs='+', default=list(STRUCTURES), choices=list(STRUCTURES))
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--updates', type=int, default=DEFAULT_UPDATES, help="snapshots：持久化树的更新次数")
+    parser.add_argument('--copies', type=int, default=DEFAULT_COPIES, help="snapshots：深拷贝的次数")
+    parser.add_argument('--freeze-gc', action='store_true', help="snapshots：建好基础树后调用 gc.freeze()")
+    parser.add_argument('--threads', type=int, nargs='+', default=DEFAULT_THREADS, help="concurrent：线程数")
+    parser.add_argument('--read-ratios', type=float, nargs='+', default=DEFAULT_READ_RATIOS,
+                        help="concurrent：读操作所占比例")
+    parser.add_argument('--operations', type=int, default=DEFAULT_OPERATIONS_PER_THREAD,
+                        help="concurrent：每个线程的操作数")
+    parser.add_argument('--no-memory', action='store_true', help="不测量内存")
+    parser.add_argument('--json', help="JSON输出路径")
+    args = parser.parse_args(argv)
+
+    if args.suite == 'snapshots':
+        rows = run_snapshots(args.sizes or DEFAULT_SNAPSHOT_SIZES, args.updates, args.copies,
+                             args.seed, not args.no_memory, args.freeze_gc)
+    elif args.suite == 'concurrent':
+        rows = run_concurrent(args.sizes or DEFAULT_CONCURRENT_SIZES, args.threads, args.read_ratios,
+                              args.operations, args.seed)
+    else:
+        rows = run_benchmark(args.sizes or DEFAULT_SIZES, args.structures, args.repeats, args.seed, not args.no_memory)
+    if args.json:
+        write_json(rows, args.json, {key: value for key, value in vars(args).items() if key != 'json'})
+        print(f"JSON结果已保存到 {args.json}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
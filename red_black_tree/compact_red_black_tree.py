@@ -0,0 +1,354 @@
+import sys
+from array import array
+
+RED = 1
+BLACK = 0
+
+
+class CompactRedBlackTree:
+    """与 RedBlackTree 接口相同的红黑树，节点以“数组结构”（struct of arrays）存储。
+
+    节点是整数编号：keys[i]、values[i] 为键和值，left/right/parent 为 array('i')
+    中的子节点和父节点编号，red 为每个节点一个字节的颜色（1 红 0 黑）。编号 0 是
+    黑色的哨兵 NIL。每个节点约占 30 字节，而 Node 对象约 128 字节。
+
+    删除的节点编号串成空闲链表（借用 right 数组）供之后的插入复用。
+    """
+
+    def __init__(self):
+        self.keys = [None]
+        self.values = [None]
+        self.left = array('i', [0])
+        self.right = array('i', [0])
+        self.parent = array('i', [0])
+        self.red = bytearray(1)
+        self.root = 0
+        self.free = 0  # 空闲链表头，0 表示没有空闲节点
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._search_node(key) != 0
+
+    def __iter__(self):
+        return self.keys_inorder()
+
+    @classmethod
+    def from_sorted(cls, items):
+        # 从按键有序的 (key, value) 序列以 O(n) 时间构建平衡的红黑树
+        items = list(items)
+        keys = [key for key, _ in items]
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            raise ValueError("from_sorted 需要按键升序排列的输入")
+
+        n = len(items)
+        tree = cls()
+        tree.keys = [None] + keys
+        tree.values = [None] + [value for _, value in items]
+        tree.left = array('i', bytes(4 * (n + 1)))
+        tree.right = array('i', bytes(4 * (n + 1)))
+        tree.parent = array('i', bytes(4 * (n + 1)))
+        tree.red = bytearray(n + 1)
+        tree.size = n
+
+        # 第 i 个元素就是节点 i+1，每个区间取中点为子树根。除最深一层外每层都是满的，
+        # 只把最深一层（不满时）染红，所有路径的黑高就相同
+        left, right, parent, red = tree.left, tree.right, tree.parent, tree.red
+        red_depth = (n + 1).bit_length() - 1
+        stack = [(0, n, 0, False, 0)]
+        while stack:
+            lo, hi, up, is_left, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            node = mid + 1
+            parent[node] = up
+            if up == 0:
+                tree.root = node
+            elif is_left:
+                left[up] = node
+            else:
+                right[up] = node
+            if depth == red_depth:
+                red[node] = RED
+            stack.append((lo, mid, node, True, depth + 1))
+            stack.append((mid + 1, hi, node, False, depth + 1))
+        return tree
+
+    def _new_node(self, key, value):
+        node = self.free
+        if node:
+            self.free = self.right[node]
+            self.keys[node] = key
+            self.values[node] = value
+            self.left[node] = 0
+            self.right[node] = 0
+            self.red[node] = RED
+        else:
+            node = len(self.keys)
+            self.keys.append(key)
+            self.values.append(value)
+            self.left.append(0)
+            self.right.append(0)
+            self.parent.append(0)
+            self.red.append(RED)
+        return node
+
+    def _release(self, node):
+        self.keys[node] = None
+        self.values[node] = None
+        self.right[node] = self.free
+        self.free = node
+
+    def left_rotate(self, x):
+        # 左旋转操作
+        left, right, parent = self.left, self.right, self.parent
+        y = right[x]
+        right[x] = left[y]
+        if left[y] != 0:
+            parent[left[y]] = x
+        parent[y] = parent[x]
+        if parent[x] == 0:
+            self.root = y
+        elif x == left[parent[x]]:
+            left[parent[x]] = y
+        else:
+            right[parent[x]] = y
+        left[y] = x
+        parent[x] = y
+
+    def right_rotate(self, y):
+        # 右旋转操作
+        left, right, parent = self.left, self.right, self.parent
+        x = left[y]
+        left[y] = right[x]
+        if right[x] != 0:
+            parent[right[x]] = y
+        parent[x] = parent[y]
+        if parent[y] == 0:
+            self.root = x
+        elif y == right[parent[y]]:
+            right[parent[y]] = x
+        else:
+            left[parent[y]] = x
+        right[x] = y
+        parent[y] = x
+
+    def insert(self, key, value):
+        # 插入操作
+        keys, left, right = self.keys, self.left, self.right
+        y = 0
+        x = self.root
+
+        # 找到插入位置
+        while x != 0:
+            y = x
+            if key < keys[x]:
+                x = left[x]
+            else:
+                x = right[x]
+
+        node = self._new_node(key, value)
+        self.parent[node] = y
+        if y == 0:
+            self.root = node
+        elif key < keys[y]:
+            left[y] = node
+        else:
+            right[y] = node
+        self.size += 1
+
+        # 插入后调整
+        self.insert_fixup(node)
+
+    def insert_fixup(self, z):
+        # 插入后调整颜色和平衡
+        left, parent, red = self.left, self.parent, self.red
+        while red[parent[z]]:
+            p = parent[z]
+            g = parent[p]
+            if p == left[g]:
+                y = self.right[g]
+                if red[y]:
+                    red[p] = BLACK
+                    red[y] = BLACK
+                    red[g] = RED
+                    z = g
+                else:
+                    if z == self.right[p]:
+                        z = p
+                        self.left_rotate(z)
+                    red[parent[z]] = BLACK
+                    red[parent[parent[z]]] = RED
+                    self.right_rotate(parent[parent[z]])
+            else:
+                y = left[g]
+                if red[y]:
+                    red[p] = BLACK
+                    red[y] = BLACK
+                    red[g] = RED
+                    z = g
+                else:
+                    if z == left[p]:
+                        z = p
+                        self.right_rotate(z)
+                    red[parent[z]] = BLACK
+                    red[parent[parent[z]]] = RED
+                    self.left_rotate(parent[parent[z]])
+        red[self.root] = BLACK
+
+    def search(self, key):
+        # 查找操作
+        node = self._search_node(key)
+        if node == 0:
+            return None
+        return self.values[node]
+
+    def _search_node(self, key):
+        keys, left, right = self.keys, self.left, self.right
+        current = self.root
+        while current != 0:
+            current_key = keys[current]
+            if key == current_key:
+                return current
+            current = left[current] if key < current_key else right[current]
+        return 0
+
+    def transplant(self, u, v):
+        # 替换子树
+        parent = self.parent
+        if parent[u] == 0:
+            self.root = v
+        elif u == self.left[parent[u]]:
+            self.left[parent[u]] = v
+        else:
+            self.right[parent[u]] = v
+        parent[v] = parent[u]
+
+    def minimum(self, node):
+        # 查找最小节点
+        left = self.left
+        while left[node] != 0:
+            node = left[node]
+        return node
+
+    def delete(self, key):
+        # 删除操作
+        z = self._search_node(key)
+        if z == 0:
+            return False
+
+        left, right, parent, red = self.left, self.right, self.parent, self.red
+        y = z
+        y_original_red = red[y]
+
+        if left[z] == 0:
+            x = right[z]
+            self.transplant(z, right[z])
+        elif right[z] == 0:
+            x = left[z]
+            self.transplant(z, left[z])
+        else:
+            y = self.minimum(right[z])
+            y_original_red = red[y]
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self.transplant(y, right[y])
+                right[y] = right[z]
+                parent[right[y]] = y
+            self.transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            red[y] = red[z]
+
+        if not y_original_red:
+            self.delete_fixup(x)
+        self._release(z)
+        self.size -= 1
+        return True
+
+    def delete_fixup(self, x):
+        # 删除后调整颜色和平衡
+        left, right, parent, red = self.left, self.right, self.parent, self.red
+        while x != self.root and not red[x]:
+            p = parent[x]
+            if x == left[p]:
+                w = right[p]
+                if red[w]:
+                    red[w] = BLACK
+                    red[p] = RED
+                    self.left_rotate(p)
+                    w = right[parent[x]]
+                if not red[left[w]] and not red[right[w]]:
+                    red[w] = RED
+                    x = parent[x]
+                else:
+                    if not red[right[w]]:
+                        red[left[w]] = BLACK
+                        red[w] = RED
+                        self.right_rotate(w)
+                        w = right[parent[x]]
+                    red[w] = red[parent[x]]
+                    red[parent[x]] = BLACK
+                    red[right[w]] = BLACK
+                    self.left_rotate(parent[x])
+                    x = self.root
+            else:
+                w = left[p]
+                if red[w]:
+                    red[w] = BLACK
+                    red[p] = RED
+                    self.right_rotate(p)
+                    w = left[parent[x]]
+                if not red[right[w]] and not red[left[w]]:
+                    red[w] = RED
+                    x = parent[x]
+                else:
+                    if not red[left[w]]:
+                        red[right[w]] = BLACK
+                        red[w] = RED
+                        self.left_rotate(w)
+                        w = left[parent[x]]
+                    red[w] = red[parent[x]]
+                    red[parent[x]] = BLACK
+                    red[left[w]] = BLACK
+                    self.right_rotate(parent[x])
+                    x = self.root
+        red[x] = BLACK
+
+    def _iter_nodes(self):
+        # 用显式栈的中序遍历，按键顺序逐个产出节点编号
+        left, right = self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield node
+            node = right[node]
+
+    def items(self):
+        keys, values = self.keys, self.values
+        for node in self._iter_nodes():
+            yield keys[node], values[node]
+
+    def keys_inorder(self):
+        keys = self.keys
+        for node in self._iter_nodes():
+            yield keys[node]
+
+    def inorder_traversal(self):
+        # 中序遍历，返回值与 RedBlackTree.inorder_traversal 相同
+        keys, values, red = self.keys, self.values, self.red
+        return [(keys[node], values[node], 'red' if red[node] else 'black') for node in self._iter_nodes()]
+
+    def nbytes(self):
+        # 树结构本身占用的字节数（不含键和值对象）
+        return (sys.getsizeof(self.keys) + sys.getsizeof(self.values) + sys.getsizeof(self.left)
+                + sys.getsizeof(self.right) + sys.getsizeof(self.parent) + sys.getsizeof(self.red))
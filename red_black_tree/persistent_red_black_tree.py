@@ -0,0 +1,220 @@
+"""
+持久化（写时复制）红黑树
+
+每次 insert/delete 都只复制从根到修改位置的路径（O(log n) 个新节点），返回一棵新树，
+其余子树与旧版本共享。旧版本永远不会被修改，所以任何一个版本都可以作为时间点快照，
+读者不加锁就能遍历，写者同时继续产生新版本。
+
+节点没有父指针（否则无法共享子树），平衡逻辑采用 Kahrs 的函数式红黑树
+（"Red-black trees with types"，与 Isabelle 中经过验证的 RBT 实现相同）：
+插入用 Okasaki 的四种情况 balance，删除用 balance_left/balance_right 和 append。
+"""
+
+RED = 'red'
+BLACK = 'black'
+
+
+class PersistentNode:
+    # 创建后不再修改
+    __slots__ = ('color', 'left', 'key', 'value', 'right')
+
+    def __init__(self, color, left, key, value, right):
+        self.color = color
+        self.left = left
+        self.key = key
+        self.value = value
+        self.right = right
+
+
+def _is_red(node):
+    return node is not None and node.color == RED
+
+
+def _is_black(node):
+    # 非空的黑色节点
+    return node is not None and node.color == BLACK
+
+
+def _paint(node, color):
+    return PersistentNode(color, node.left, node.key, node.value, node.right)
+
+
+def _balance(left, key, value, right):
+    # 以 (key, value) 为根、原本是黑色的子树：消除孩子与孙子之间的红-红冲突
+    if _is_red(left) and _is_red(right):
+        return PersistentNode(RED, _paint(left, BLACK), key, value, _paint(right, BLACK))
+    if _is_red(left):
+        if _is_red(left.left):
+            return PersistentNode(RED, _paint(left.left, BLACK), left.key, left.value,
+                                  PersistentNode(BLACK, left.right, key, value, right))
+        if _is_red(left.right):
+            middle = left.right
+            return PersistentNode(RED, PersistentNode(BLACK, left.left, left.key, left.value, middle.left),
+                                  middle.key, middle.value,
+                                  PersistentNode(BLACK, middle.right, key, value, right))
+    if _is_red(right):
+        if _is_red(right.right):
+            return PersistentNode(RED, PersistentNode(BLACK, left, key, value, right.left),
+                                  right.key, right.value, _paint(right.right, BLACK))
+        if _is_red(right.left):
+            middle = right.left
+            return PersistentNode(RED, PersistentNode(BLACK, left, key, value, middle.left),
+                                  middle.key, middle.value,
+                                  PersistentNode(BLACK, middle.right, right.key, right.value, right.right))
+    return PersistentNode(BLACK, left, key, value, right)
+
+
+def _insert(node, key, value):
+    if node is None:
+        return PersistentNode(RED, None, key, value, None)
+    if key < node.key:
+        if node.color == BLACK:
+            return _balance(_insert(node.left, key, value), node.key, node.value, node.right)
+        return PersistentNode(RED, _insert(node.left, key, value), node.key, node.value, node.right)
+    if key > node.key:
+        if node.color == BLACK:
+            return _balance(node.left, node.key, node.value, _insert(node.right, key, value))
+        return PersistentNode(RED, node.left, node.key, node.value, _insert(node.right, key, value))
+    return PersistentNode(node.color, node.left, key, value, node.right)
+
+
+def _balance_left(left, key, value, right):
+    # 左子树的黑高比右子树少 1
+    if _is_red(left):
+        return PersistentNode(RED, _paint(left, BLACK), key, value, right)
+    if _is_black(right):
+        return _balance(left, key, value, _paint(right, RED))
+    middle = right.left
+    return PersistentNode(RED, PersistentNode(BLACK, left, key, value, middle.left), middle.key, middle.value,
+                          _balance(middle.right, right.key, right.value, _paint(right.right, RED)))
+
+
+def _balance_right(left, key, value, right):
+    # 右子树的黑高比左子树少 1
+    if _is_red(right):
+        return PersistentNode(RED, left, key, value, _paint(right, BLACK))
+    if _is_black(left):
+        return _balance(_paint(left, RED), key, value, right)
+    middle = left.right
+    return PersistentNode(RED, _balance(_paint(left.left, RED), left.key, left.value, middle.left),
+                          middle.key, middle.value, PersistentNode(BLACK, middle.right, key, value, right))
+
+
+def _append(left, right):
+    # 合并被删除节点的两棵子树（left 的键都小于 right）
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.color == RED and right.color == RED:
+        middle = _append(left.right, right.left)
+        if _is_red(middle):
+            return PersistentNode(RED, PersistentNode(RED, left.left, left.key, left.value, middle.left),
+                                  middle.key, middle.value,
+                                  PersistentNode(RED, middle.right, right.key, right.value, right.right))
+        return PersistentNode(RED, left.left, left.key, left.value,
+                              PersistentNode(RED, middle, right.key, right.value, right.right))
+    if left.color == BLACK and right.color == BLACK:
+        middle = _append(left.right, right.left)
+        if _is_red(middle):
+            return PersistentNode(RED, PersistentNode(BLACK, left.left, left.key, left.value, middle.left),
+                                  middle.key, middle.value,
+                                  PersistentNode(BLACK, middle.right, right.key, right.value, right.right))
+        return _balance_left(left.left, left.key, left.value,
+                             PersistentNode(BLACK, middle, right.key, right.value, right.right))
+    if right.color == RED:
+        return PersistentNode(RED, _append(left, right.left), right.key, right.value, right.right)
+    return PersistentNode(RED, left.left, left.key, left.value, _append(left.right, right))
+
+
+def _delete(node, key):
+    # 调用前已确认 key 存在
+    if key < node.key:
+        if _is_black(node.left):
+            return _balance_left(_delete(node.left, key), node.key, node.value, node.right)
+        return PersistentNode(RED, _delete(node.left, key), node.key, node.value, node.right)
+    if key > node.key:
+        if _is_black(node.right):
+            return _balance_right(node.left, node.key, node.value, _delete(node.right, key))
+        return PersistentNode(RED, node.left, node.key, node.value, _delete(node.right, key))
+    return _append(node.left, node.right)
+
+
+class PersistentRedBlackTree:
+    """不可变的红黑树版本。insert/delete 返回新版本，原版本保持不变。
+
+    键唯一：插入已存在的键会在新版本中替换它的值。
+    """
+
+    __slots__ = ('root', 'size')
+
+    def __init__(self, root=None, size=0):
+        self.root = root
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._search_node(key) is not None
+
+    def __iter__(self):
+        for key, _ in self.items():
+            yield key
+
+    def insert(self, key, value):
+        # 返回插入后的新版本
+        size = self.size if key in self else self.size + 1
+        root = _insert(self.root, key, value)
+        if root.color == RED:
+            root = _paint(root, BLACK)
+        return PersistentRedBlackTree(root, size)
+
+    def delete(self, key):
+        # 返回删除后的新版本，key 不存在时返回自身
+        if key not in self:
+            return self
+        root = _delete(self.root, key)
+        if _is_red(root):
+            root = _paint(root, BLACK)
+        return PersistentRedBlackTree(root, self.size - 1)
+
+    def search(self, key):
+        node = self._search_node(key)
+        if node is None:
+            return None
+        return node.value
+
+    def _search_node(self, key):
+        current = self.root
+        while current is not None:
+            if key == current.key:
+                return current
+            current = current.left if key < current.key else current.right
+        return None
+
+    def items(self):
+        # 按键顺序逐个产出 (key, value)；版本不可变，遍历期间无需加锁
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key, node.value
+            node = node.right
+
+    def inorder_traversal(self):
+        # 返回值格式与 RedBlackTree.inorder_traversal 相同
+        stack = []
+        result = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append((node.key, node.value, node.color))
+            node = node.right
+        return result
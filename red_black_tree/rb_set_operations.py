@@ -0,0 +1,267 @@
+"""
+基于 join 的红黑树集合运算
+
+join(left, key, value, right) 把所有键都小于 key 的树、key 本身和所有键都大于 key 的树
+合并成一棵红黑树，代价只与两棵树的黑高差有关。split、union、intersection、difference
+都只用 join 表达（Blelloch、Ferizovic、Sun，"Just Join for Parallel Ordered Sets"），
+大小为 m 和 n（m <= n）的两棵树的集合运算是 O(m log(n/m + 1))，比逐个插入的
+O(m log(n + m)) 少得多。
+
+union/intersection/difference 在拆开的左右两半上的两次递归互不依赖，可以分给不同的
+工作者并行执行；CPython 中纯 Python 代码受 GIL 限制，这里按顺序执行。
+
+这些函数直接复用输入树的节点：运算结束后输入树被清空，结果是一棵新的 RedBlackTree。
+集合运算假定每棵树中的键互不相同；键同时出现在两棵树中时，union 和 intersection
+保留第二棵树的值。
+"""
+
+from red_black_tree import Node, RedBlackTree
+
+
+def _attach(nil, node, left, right):
+    # 设置 node 的子节点，并维护父指针和子树大小
+    node.left = left
+    node.right = right
+    if left is not nil:
+        left.parent = node
+    if right is not nil:
+        right.parent = node
+    node.size = left.size + right.size + 1
+    return node
+
+
+def _rotate_left(nil, x):
+    y = x.right
+    _attach(nil, x, x.left, y.left)
+    return _attach(nil, y, x, y.right)
+
+
+def _rotate_right(nil, x):
+    y = x.left
+    _attach(nil, x, y.right, x.right)
+    return _attach(nil, y, y.left, x)
+
+
+def _child_height(node, height):
+    # 黑高包含根节点自身（若为黑色），NIL 的黑高为 0
+    return height - 1 if node.color == 'black' else height
+
+
+def _join_right(nil, left, left_height, node, right, right_height):
+    # left 的黑高大于等于 right：沿 left 的右脊下降到黑高相同的黑色节点处挂上 node
+    if left.color == 'black' and left_height == right_height:
+        node.color = 'red'
+        return _attach(nil, node, left, right)
+    joined = _join_right(nil, left.right, _child_height(left, left_height), node, right, right_height)
+    tree = _attach(nil, left, left.left, joined)
+    if left.color == 'black' and tree.right.color == 'red' and tree.right.right.color == 'red':
+        tree.right.right.color = 'black'
+        return _rotate_left(nil, tree)
+    return tree
+
+
+def _join_left(nil, left, left_height, node, right, right_height):
+    if right.color == 'black' and left_height == right_height:
+        node.color = 'red'
+        return _attach(nil, node, left, right)
+    joined = _join_left(nil, left, left_height, node, right.left, _child_height(right, right_height))
+    tree = _attach(nil, right, joined, right.right)
+    if right.color == 'black' and tree.left.color == 'red' and tree.left.left.color == 'red':
+        tree.left.left.color = 'black'
+        return _rotate_right(nil, tree)
+    return tree
+
+
+def _join(nil, left, left_height, node, right, right_height):
+    """合并 left、node、right，返回 (根, 黑高)。结果的根可能是红色。"""
+    # 两棵输入树的根先染黑，下降过程中就只可能在 node 之上出现红-红冲突
+    if left.color == 'red':
+        left.color = 'black'
+        left_height += 1
+    if right.color == 'red':
+        right.color = 'black'
+        right_height += 1
+
+    if left_height > right_height:
+        tree = _join_right(nil, left, left_height, node, right, right_height)
+        if tree.color == 'red' and tree.right.color == 'red':
+            tree.color = 'black'
+            return tree, left_height + 1
+        return tree, left_height
+    if right_height > left_height:
+        tree = _join_left(nil, left, left_height, node, right, right_height)
+        if tree.color == 'red' and tree.left.color == 'red':
+            tree.color = 'black'
+            return tree, right_height + 1
+        return tree, right_height
+    node.color = 'red'
+    return _attach(nil, node, left, right), left_height
+
+
+def _split(nil, tree, height, key):
+    """按 key 拆分，返回 (左子树, 左黑高, 等于 key 的节点或 None, 右子树, 右黑高)"""
+    if tree is nil:
+        return nil, 0, None, nil, 0
+    child_height = _child_height(tree, height)
+    left, right = tree.left, tree.right
+    if key == tree.key:
+        return left, child_height, tree, right, child_height
+    if key < tree.key:
+        low, low_height, found, high, high_height = _split(nil, left, child_height, key)
+        high, high_height = _join(nil, high, high_height, tree, right, child_height)
+        return low, low_height, found, high, high_height
+    low, low_height, found, high, high_height = _split(nil, right, child_height, key)
+    low, low_height = _join(nil, left, child_height, tree, low, low_height)
+    return low, low_height, found, high, high_height
+
+
+def _split_last(nil, tree, height):
+    # 摘下最大节点，返回 (剩余部分, 黑高, 最大节点)
+    child_height = _child_height(tree, height)
+    left, right = tree.left, tree.right
+    if right is nil:
+        return left, child_height, tree
+    rest, rest_height, last = _split_last(nil, right, child_height)
+    rest, rest_height = _join(nil, left, child_height, tree, rest, rest_height)
+    return rest, rest_height, last
+
+
+def _join2(nil, left, left_height, right, right_height):
+    # 没有中间键的 join
+    if left is nil:
+        return right, right_height
+    left, left_height, last = _split_last(nil, left, left_height)
+    return _join(nil, left, left_height, last, right, right_height)
+
+
+def _union(nil, first, first_height, second, second_height):
+    if first is nil:
+        return second, second_height
+    if second is nil:
+        return first, first_height
+    child_height = _child_height(second, second_height)
+    second_left, second_right = second.left, second.right
+    low, low_height, _, high, high_height = _split(nil, first, first_height, second.key)
+    # 以下两次递归互不依赖
+    left, left_height = _union(nil, low, low_height, second_left, child_height)
+    right, right_height = _union(nil, high, high_height, second_right, child_height)
+    return _join(nil, left, left_height, second, right, right_height)
+
+
+def _intersection(nil, first, first_height, second, second_height):
+    if first is nil or second is nil:
+        return nil, 0
+    child_height = _child_height(second, second_height)
+    second_left, second_right = second.left, second.right
+    low, low_height, found, high, high_height = _split(nil, first, first_height, second.key)
+    left, left_height = _intersection(nil, low, low_height, second_left, child_height)
+    right, right_height = _intersection(nil, high, high_height, second_right, child_height)
+    if found is not None:
+        return _join(nil, left, left_height, second, right, right_height)
+    return _join2(nil, left, left_height, right, right_height)
+
+
+def _difference(nil, first, first_height, second, second_height):
+    if first is nil:
+        return nil, 0
+    if second is nil:
+        return first, first_height
+    child_height = _child_height(second, second_height)
+    low, low_height, _, high, high_height = _split(nil, first, first_height, second.key)
+    left, left_height = _difference(nil, low, low_height, second.left, child_height)
+    right, right_height = _difference(nil, high, high_height, second.right, child_height)
+    return _join2(nil, left, left_height, right, right_height)
+
+
+def _black_height(nil, node):
+    height = 0
+    while node is not nil:
+        if node.color == 'black':
+            height += 1
+        node = node.left
+    return height
+
+
+def _rehome(tree, nil):
+    # 把 tree 中指向它自己 NIL 的子指针改为指向 nil，O(len(tree))
+    old = tree.NIL
+    if old is nil:
+        return
+    stack = [tree.root] if tree.root is not old else []
+    while stack:
+        node = stack.pop()
+        if node.left is old:
+            node.left = nil
+        else:
+            stack.append(node.left)
+        if node.right is old:
+            node.right = nil
+        else:
+            stack.append(node.right)
+
+
+def _take(*trees):
+    """取出输入树的根和黑高，并让它们共用同一个 NIL 哨兵。
+
+    RedBlackTree 用节点身份比较判断 NIL，合并后的树只能有一个哨兵：沿用最大那棵树的，
+    把其余树的叶子指针改过来，代价是较小树的大小，不超过集合运算本身的代价。
+    """
+    largest = max(trees, key=len)
+    nil = largest.NIL
+    taken = []
+    for tree in trees:
+        _rehome(tree, nil)
+        root = tree.root if tree.root is not tree.NIL else nil
+        taken.append((root, _black_height(nil, root)))
+        tree.__init__()  # 清空输入树，换上它自己的新哨兵
+    return nil, taken
+
+
+def _result(nil, root):
+    tree = RedBlackTree()
+    tree.NIL = nil
+    if root is not nil:
+        root.parent = nil
+        root.color = 'black'
+    tree.root = root
+    return tree
+
+
+def join(left, key, value, right):
+    """合并 left、(key, value) 和 right，要求 left 的键都小于 key，right 的键都大于 key"""
+    if len(left) and left.select(len(left) - 1)[0] >= key:
+        raise ValueError("join 要求左树的所有键都小于 key")
+    if len(right) and right.select(0)[0] <= key:
+        raise ValueError("join 要求右树的所有键都大于 key")
+    nil, ((left_root, left_height), (right_root, right_height)) = _take(left, right)
+    root, _ = _join(nil, left_root, left_height, Node(key, value), right_root, right_height)
+    return _result(nil, root)
+
+
+def split(tree, key):
+    """按 key 拆成 (键小于 key 的树, (key, value) 或 None, 键大于 key 的树)"""
+    nil, ((root, height),) = _take(tree)
+    low, _, found, high, _ = _split(nil, root, height, key)
+    item = (found.key, found.value) if found is not None else None
+    return _result(nil, low), item, _result(nil, high)
+
+
+def union(first, second):
+    """两棵树的并集"""
+    nil, ((first_root, first_height), (second_root, second_height)) = _take(first, second)
+    root, _ = _union(nil, first_root, first_height, second_root, second_height)
+    return _result(nil, root)
+
+
+def intersection(first, second):
+    """两棵树的交集"""
+    nil, ((first_root, first_height), (second_root, second_height)) = _take(first, second)
+    root, _ = _intersection(nil, first_root, first_height, second_root, second_height)
+    return _result(nil, root)
+
+
+def difference(first, second):
+    """在 first 中但不在 second 中的键"""
+    nil, ((first_root, first_height), (second_root, second_height)) = _take(first, second)
+    root, _ = _difference(nil, first_root, first_height, second_root, second_height)
+    return _result(nil, root)
@@ -1,4 +1,7 @@
 class Node:
+    # 没有 __dict__，每个节点约省 30%
+    __slots__ = ('key', 'value', 'color', 'left', 'right', 'parent', 'size')
+
     def __init__(self, key, value, color='red'):
         self.key = key
         self.value = value
@@ -6,12 +9,17 @@ class Node:
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1  # 以该节点为根的子树节点数
 
 class RedBlackTree:
     def __init__(self):
         self.NIL = Node(None, None, 'black')  # 哨兵节点
+        self.NIL.size = 0
         self.root = self.NIL
 
+    def __len__(self):
+        return self.root.size
+
     def left_rotate(self, x):
         # 左旋转操作
         y = x.right
@@ -27,6 +35,9 @@ class RedBlackTree:
             x.parent.right = y
         y.left = x
         x.parent = y
+        # 旋转只改变 x 和 y 的子树大小
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
 
     def right_rotate(self, y):
         # 右旋转操作
@@ -43,6 +54,8 @@ class RedBlackTree:
             y.parent.left = x
         x.right = y
         y.parent = x
+        x.size = y.size
+        y.size = y.left.size + y.right.size + 1
 
     def insert(self, key, value):
         # 插入操作
@@ -56,6 +69,7 @@ class RedBlackTree:
         # 找到插入位置
         while x != self.NIL:
             y = x
+            x.size += 1  # 新节点会落在这条路径上
             if new_node.key < x.key:
                 x = x.left
             else:
@@ -162,6 +176,12 @@ class RedBlackTree:
             y.left = z.left
             y.left.parent = y
             y.color = z.color
+
+        # 从实际摘除节点的位置向上重新计算子树大小
+        node = x.parent
+        while node != self.NIL:
+            node.size = node.left.size + node.right.size + 1
+            node = node.parent
         
         if y_original_color == 'black':
             self.delete_fixup(x)
@@ -224,14 +244,80 @@ class RedBlackTree:
                 current = current.right
         return current
 
+    def rank(self, key):
+        # 小于 key 的键的个数，即 key 在有序序列中的位置（从0开始）
+        return self._count_below(key, inclusive=False)
+
+    def select(self, k):
+        # 第 k 小（从0开始）的 (key, value)
+        if not 0 <= k < self.root.size:
+            raise IndexError(f"select 下标 {k} 超出范围 [0, {self.root.size})")
+        node = self.root
+        while True:
+            left_size = node.left.size
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key, node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo, hi):
+        # 满足 lo <= key <= hi 的键的个数
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+    def _count_below(self, key, inclusive):
+        # 小于（inclusive 时为小于等于）key 的节点数
+        count = 0
+        node = self.root
+        while node != self.NIL:
+            if node.key < key or (inclusive and node.key == key):
+                count += node.left.size + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def range(self, lo, hi):
+        # 按键顺序逐个产出满足 lo <= key <= hi 的 (key, value)，不遍历区间外的子树
+        stack = []
+        node = self.root
+        while node != self.NIL:
+            if node.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if hi < node.key:
+                return
+            yield node.key, node.value
+            node = node.right
+            while node != self.NIL:
+                stack.append(node)
+                node = node.left
+
+    def _iter_nodes(self):
+        # 用显式栈的中序遍历，不使用递归
+        stack = []
+        node = self.root
+        while stack or node != self.NIL:
+            while node != self.NIL:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def items(self):
+        # 按键顺序逐个产出 (key, value)
+        for node in self._iter_nodes():
+            yield node.key, node.value
+
     def inorder_traversal(self):
         # 中序遍历
-        result = []
-        self._inorder_traversal(self.root, result)
-        return result
-
-    def _inorder_traversal(self, node, result):
-        if node != self.NIL:
-            self._inorder_traversal(node.left, result)
-            result.append((node.key, node.value, node.color))
-            self._inorder_traversal(node.right, result)
+        return [(node.key, node.value, node.color) for node in self._iter_nodes()]
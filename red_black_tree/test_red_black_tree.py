@@ -4,7 +4,14 @@ import os
 # 添加当前目录到路径，以便导入红黑树模块
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import random
+import threading
+
 from red_black_tree import RedBlackTree
+from compact_red_black_tree import CompactRedBlackTree
+import rb_set_operations
+from persistent_red_black_tree import PersistentRedBlackTree
+from concurrent_red_black_tree import ConcurrentRedBlackTree, ReadWriteLock
 
 def test_insert_and_search():
     """测试插入和查找操作"""
@@ -142,6 +149,352 @@ def test_large_scale():
     
     print("大规模数据测试通过！\n")
 
+def check_compact_tree(tree):
+    """检查数组红黑树的全部性质，返回黑高"""
+    left, right, parent, red, keys = tree.left, tree.right, tree.parent, tree.red, tree.keys
+    assert not red[0], "NIL必须是黑色"
+    assert tree.root == 0 or (not red[tree.root] and parent[tree.root] == 0), "根节点必须是黑色且没有父节点"
+
+    def walk(node, low, high):
+        if node == 0:
+            return 1, 0
+        key = keys[node]
+        assert (low is None or low <= key) and (high is None or key <= high), "违反二叉搜索树性质"
+        for child in (left[node], right[node]):
+            if child:
+                assert parent[child] == node, "父指针错误"
+                assert not (red[node] and red[child]), "红色节点的子节点必须是黑色"
+        left_height, left_count = walk(left[node], low, key)
+        right_height, right_count = walk(right[node], key, high)
+        assert left_height == right_height, "各路径黑高不同"
+        return left_height + (0 if red[node] else 1), left_count + right_count + 1
+
+    height, count = walk(tree.root, None, None)
+    assert count == len(tree), f"节点数 {count} 与 len {len(tree)} 不一致"
+    return height
+
+def test_compact_tree():
+    """测试数组红黑树：随机插入/删除后与RedBlackTree和字典结果一致，并保持红黑树性质"""
+    print("测试数组红黑树...")
+    rng = random.Random(0)
+    for round_number in range(20):
+        compact = CompactRedBlackTree()
+        reference = RedBlackTree()
+        expected = {}
+        for _ in range(300):
+            key = rng.randrange(200)
+            if key in expected and rng.random() < 0.5:
+                assert compact.delete(key) and reference.delete(key)
+                del expected[key]
+            elif key not in expected:
+                compact.insert(key, f'value_{key}')
+                reference.insert(key, f'value_{key}')
+                expected[key] = f'value_{key}'
+            assert not compact.delete(-1)
+        check_compact_tree(compact)
+        assert compact.inorder_traversal() == reference.inorder_traversal()
+        assert list(compact.items()) == sorted(expected.items()) == list(reference.items())
+        assert list(compact) == sorted(expected)
+        for key in range(200):
+            assert compact.search(key) == expected.get(key)
+            assert (key in compact) == (key in expected)
+        # 删除的节点编号被复用，数组不会无限增长
+        assert len(compact.keys) <= 201
+    print("数组红黑树测试通过！\n")
+
+def test_bulk_load():
+    """测试从有序序列O(n)构建：任意大小都满足红黑树性质"""
+    print("测试批量构建...")
+    for n in range(130):
+        tree = CompactRedBlackTree.from_sorted((key, key * 2) for key in range(n))
+        check_compact_tree(tree)
+        assert list(tree.items()) == [(key, key * 2) for key in range(n)]
+        # 构建后仍可正常插入和删除
+        tree.insert(n // 2, 'new')
+        if n:
+            assert tree.delete(0)
+        check_compact_tree(tree)
+    try:
+        CompactRedBlackTree.from_sorted([(2, 'b'), (1, 'a')])
+        assert False, "无序输入应该抛出ValueError"
+    except ValueError:
+        pass
+    print("批量构建测试通过！\n")
+
+def check_sizes(rbt):
+    """检查每个节点的子树大小"""
+    def walk(node):
+        if node == rbt.NIL:
+            return 0
+        size = walk(node.left) + walk(node.right) + 1
+        assert node.size == size, f"节点 {node.key} 的子树大小为 {node.size}，应为 {size}"
+        return size
+
+    assert rbt.NIL.size == 0, "NIL的子树大小必须为0"
+    assert walk(rbt.root) == len(rbt)
+
+def test_order_statistics():
+    """测试 rank/select/count_range/range：随机插入/删除后与有序列表结果一致"""
+    print("测试顺序统计和范围查询...")
+    import bisect
+    rng = random.Random(1)
+    rbt = RedBlackTree()
+    expected = []
+    for step in range(2000):
+        key = rng.randrange(500)
+        index = bisect.bisect_left(expected, key)
+        if index < len(expected) and expected[index] == key:
+            if rng.random() < 0.6:
+                assert rbt.delete(key)
+                expected.pop(index)
+        else:
+            rbt.insert(key, f'value_{key}')
+            expected.insert(index, key)
+        if step % 100 == 0:
+            check_sizes(rbt)
+    check_sizes(rbt)
+
+    assert len(rbt) == len(expected)
+    for k, key in enumerate(expected):
+        assert rbt.select(k) == (key, f'value_{key}'), f"select({k}) 错误"
+    for key in range(-1, 502):
+        assert rbt.rank(key) == bisect.bisect_left(expected, key), f"rank({key}) 错误"
+    for _ in range(300):
+        lo, hi = rng.randrange(-10, 510), rng.randrange(-10, 510)
+        inside = expected[bisect.bisect_left(expected, lo):bisect.bisect_right(expected, hi)]
+        assert rbt.count_range(lo, hi) == len(inside), f"count_range({lo}, {hi}) 错误"
+        assert list(rbt.range(lo, hi)) == [(key, f'value_{key}') for key in inside], f"range({lo}, {hi}) 错误"
+
+    for k in (-1, len(expected)):
+        try:
+            rbt.select(k)
+            assert False, f"select({k}) 应该抛出IndexError"
+        except IndexError:
+            pass
+    empty = RedBlackTree()
+    assert len(empty) == 0 and empty.rank(1) == 0 and empty.count_range(0, 9) == 0
+    assert list(empty.range(0, 9)) == []
+    print("顺序统计和范围查询测试通过！\n")
+
+def check_tree(rbt):
+    """检查 RedBlackTree 的全部性质（含父指针和子树大小），返回节点数"""
+    nil = rbt.NIL
+    assert nil.color == 'black' and nil.size == 0, "NIL必须是黑色且子树大小为0"
+    assert rbt.root == nil or (rbt.root.color == 'black' and rbt.root.parent == nil), "根节点必须是黑色且没有父节点"
+
+    def walk(node, low, high):
+        if node == nil:
+            return 1, 0
+        assert (low is None or low < node.key) and (high is None or node.key < high), "违反二叉搜索树性质"
+        for child in (node.left, node.right):
+            if child != nil:
+                assert child.parent == node, "父指针错误"
+                assert not (node.color == 'red' and child.color == 'red'), "红色节点的子节点必须是黑色"
+        left_height, left_count = walk(node.left, low, node.key)
+        right_height, right_count = walk(node.right, node.key, high)
+        assert left_height == right_height, "各路径黑高不同"
+        assert node.size == left_count + right_count + 1, "子树大小错误"
+        return left_height + (1 if node.color == 'black' else 0), node.size
+
+    return walk(rbt.root, None, None)[1]
+
+def test_set_operations():
+    """测试基于 join 的 union/intersection/difference/split/join"""
+    print("测试集合运算...")
+    rng = random.Random(2)
+
+    def build(keys, tag):
+        rbt = RedBlackTree()
+        for key in keys:
+            rbt.insert(key, (tag, key))
+        return rbt
+
+    for _ in range(150):
+        first = set(rng.sample(range(300), rng.randrange(120)))
+        second = set(rng.sample(range(300), rng.randrange(120)))
+        for operation, expected in ((rb_set_operations.union, first | second),
+                                    (rb_set_operations.intersection, first & second),
+                                    (rb_set_operations.difference, first - second)):
+            left, right = build(first, 1), build(second, 2)
+            result = operation(left, right)
+            assert check_tree(result) == len(expected) == len(result)
+            assert [key for key, _ in result.items()] == sorted(expected), f"{operation.__name__} 结果错误"
+            # 两棵树都有的键保留第二棵树的值
+            for key, value in result.items():
+                assert value == ((2, key) if key in second and operation is not rb_set_operations.difference else (1, key))
+            assert len(left) == 0 and len(right) == 0, "输入树应被清空"
+            # 结果仍是可正常使用的红黑树
+            result.insert(1000, 'new')
+            assert result.delete(1000)
+            check_tree(result)
+
+        key = rng.randrange(300)
+        low, found, high = rb_set_operations.split(build(first, 1), key)
+        check_tree(low)
+        check_tree(high)
+        assert [k for k, _ in low.items()] == sorted(k for k in first if k < key)
+        assert [k for k, _ in high.items()] == sorted(k for k in first if k > key)
+        assert found == ((key, (1, key)) if key in first else None)
+        if found is None:
+            joined = rb_set_operations.join(low, key, 'middle', high)
+            check_tree(joined)
+            assert [k for k, _ in joined.items()] == sorted(first | {key})
+
+    try:
+        rb_set_operations.join(build([1, 5], 1), 3, 'middle', build([7], 2))
+        assert False, "键区间重叠时 join 应该抛出ValueError"
+    except ValueError:
+        pass
+    print("集合运算测试通过！\n")
+
+def check_persistent_tree(tree):
+    """检查持久化红黑树的全部性质，返回节点编号集合（用于检查共享）"""
+    assert tree.root is None or tree.root.color == 'black', "根节点必须是黑色"
+    nodes = set()
+
+    def walk(node, low, high):
+        if node is None:
+            return 1
+        nodes.add(id(node))
+        assert (low is None or low < node.key) and (high is None or node.key < high), "违反二叉搜索树性质"
+        if node.color == 'red':
+            for child in (node.left, node.right):
+                assert child is None or child.color == 'black', "红色节点的子节点必须是黑色"
+        left_height = walk(node.left, low, node.key)
+        right_height = walk(node.right, node.key, high)
+        assert left_height == right_height, "各路径黑高不同"
+        return left_height + (1 if node.color == 'black' else 0)
+
+    walk(tree.root, None, None)
+    assert len(nodes) == len(tree), f"节点数 {len(nodes)} 与 len {len(tree)} 不一致"
+    return nodes
+
+def test_persistent_tree():
+    """测试持久化红黑树：每个旧版本保持不变，每次更新只新建 O(log n) 个节点"""
+    print("测试持久化红黑树...")
+    rng = random.Random(3)
+    for _ in range(5):
+        versions = [(PersistentRedBlackTree(), {})]
+        old_nodes = set()
+        for step in range(400):
+            tree, expected = versions[-1]
+            key = rng.randrange(200)
+            expected = dict(expected)
+            if rng.random() < 0.45:
+                updated = tree.delete(key)
+                expected.pop(key, None)
+            else:
+                updated = tree.insert(key, step)
+                expected[key] = step
+            new_nodes = check_persistent_tree(updated)
+            # 路径复制：新版本中不属于旧版本的节点不超过树高的常数倍
+            assert len(new_nodes - old_nodes) <= 4 * len(tree).bit_length() + 8, "更新复制了过多节点"
+            old_nodes = new_nodes
+            versions.append((updated, expected))
+        # 所有旧版本的内容都没有被后来的更新改变
+        for tree, expected in versions:
+            assert list(tree.items()) == sorted(expected.items())
+            for key in range(0, 200, 7):
+                assert tree.search(key) == expected.get(key)
+                assert (key in tree) == (key in expected)
+    empty = PersistentRedBlackTree()
+    assert empty.delete(1) is empty and empty.search(1) is None and list(empty) == []
+    print("持久化红黑树测试通过！\n")
+
+def test_concurrent_tree():
+    """测试并发包装：读写锁的互斥关系、批量写入与逐个执行结果一致、多线程读写后结构正确"""
+    print("测试并发红黑树...")
+    # 读者之间可以同时持有锁，写者要等所有读者释放
+    lock = ReadWriteLock()
+    lock.acquire_read()
+    second_reader = threading.Thread(target=lambda: (lock.acquire_read(), lock.release_read()))
+    second_reader.start()
+    second_reader.join(5)
+    assert not second_reader.is_alive(), "读者之间不应该互斥"
+    acquired = threading.Event()
+    def writer():
+        with lock.write_locked():
+            acquired.set()
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    assert not acquired.wait(0.05), "写者在读者持有锁时获得了锁"
+    lock.release_read()
+    assert acquired.wait(5), "读者释放后写者没有获得锁"
+    writer_thread.join()
+    stats = lock.stats()
+    assert stats['read_acquires'] == 2 and stats['max_readers'] == 2
+    assert stats['write_acquires'] == 1 and stats['write_contended'] == 1
+
+    # 批量写入：结果与逐个执行相同（RedBlackTree 允许重复键，这里只插入不存在的键）
+    rng = random.Random(4)
+    shared = ConcurrentRedBlackTree()
+    reference = RedBlackTree()
+    present = set()
+    for _ in range(20):
+        operations = []
+        for _ in range(rng.randrange(1, 60)):
+            key = rng.randrange(100)
+            if key in present or rng.random() < 0.3:
+                operations.append(('delete', key))
+                present.discard(key)
+            else:
+                operations.append(('insert', key, key))
+                present.add(key)
+        expected = [reference.insert(key, key) if kind == 'insert' else reference.delete(key)
+                    for kind, key, *_ in operations]
+        assert shared.apply_batch(operations) == expected, "批量写入的返回值与逐个执行不同"
+        assert shared.items() == list(reference.items())
+        check_tree(shared._tree)
+    try:
+        shared.apply_batch([('insert', 1, 1), ('update', 1)])
+        assert False, "未知的写操作应该抛出ValueError"
+    except ValueError:
+        pass
+    assert shared.metrics()['batches'] == 20
+
+    # 多线程：写者各自负责互不相交的键（偶数号写者批量写入），读者同时做范围扫描
+    shared = ConcurrentRedBlackTree()
+    expected = {}
+    errors = []
+    def write_worker(index):
+        worker_rng = random.Random(index)
+        present = set()
+        pending = []
+        for _ in range(300):
+            key = index * 1000 + worker_rng.randrange(100)
+            operation = ('delete', key) if key in present else ('insert', key, key)
+            present ^= {key}
+            if index % 2:
+                shared.delete(key) if operation[0] == 'delete' else shared.insert(key, key)
+                continue
+            pending.append(operation)
+            if len(pending) == 8:
+                shared.apply_batch(pending)
+                pending = []
+        shared.apply_batch(pending)
+        expected.update((key, key) for key in present)
+    def read_worker():
+        for _ in range(200):
+            result = shared.range(0, 5000)
+            if any(result[i][0] >= result[i + 1][0] for i in range(len(result) - 1)):
+                errors.append("范围扫描结果无序")
+            shared.search(1000)
+    threads = [threading.Thread(target=write_worker, args=(index,)) for index in range(4)]
+    threads += [threading.Thread(target=read_worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors[0]
+    assert shared.items() == sorted(expected.items())
+    assert len(shared) == len(expected) and all(key in shared for key in expected)
+    check_tree(shared._tree)
+    metrics = shared.metrics()
+    assert metrics['read_acquires'] > 0 and metrics['write_acquires'] > 0
+    shared.reset_metrics()
+    assert shared.metrics()['read_acquires'] == 0
+    print("并发红黑树测试通过！\n")
+
 def run_all_tests():
     """运行所有测试"""
     print("=" * 60)
@@ -153,6 +506,12 @@ def run_all_tests():
     test_delete()
     test_edge_cases()
     test_large_scale()
+    test_compact_tree()
+    test_bulk_load()
+    test_order_statistics()
+    test_set_operations()
+    test_persistent_tree()
+    test_concurrent_tree()
     
     print("=" * 60)
     print("所有测试通过！红黑树实现正确。")
@@ -0,0 +1,186 @@
+"""
+有序映射共享基准测试：红黑树、AVL树与有序块映射
+
+对每种结构和每种负载测量插入、查找、按序遍历、删除的吞吐量（每秒操作数），
+并检查遍历结果是否有序完整。负载：
+    random      随机顺序插入、查找、删除
+    sequential  升序插入、查找、删除
+
+使用方法：
+    python benchmark.py                                  # 10^5 和 10^6 个键
+    python benchmark.py --sizes 10000000 --structures SortedBlockMap RedBlackTree
+    python benchmark.py --workloads sequential --memory --json results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+# 红黑树和AVL树在相邻的目录中
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ('red_black_tree', 'balanced_binary_tree'):
+    sys.path.append(os.path.join(ROOT, directory))
+
+from red_black_tree import RedBlackTree
+from compact_red_black_tree import CompactRedBlackTree
+from avl_tree import AVLTree
+from iterative_avl_tree import IterativeAVLTree
+from sorted_block_map import SortedBlockMap, SortedBlockSet
+
+# 名称 -> (构造函数, insert 是否接收 value, 按序遍历的方法名)
+STRUCTURES = {
+    'RedBlackTree': (RedBlackTree, True, 'items'),
+    'CompactRedBlackTree': (CompactRedBlackTree, True, 'keys_inorder'),
+    'AVLTree': (AVLTree, False, 'inorder'),
+    'IterativeAVLTree': (IterativeAVLTree, False, 'iter_inorder'),
+    'SortedBlockMap': (SortedBlockMap, True, 'items'),
+    'SortedBlockSet': (SortedBlockSet, False, 'inorder'),
+}
+DEFAULT_STRUCTURES = ['RedBlackTree', 'IterativeAVLTree', 'SortedBlockMap']
+
+WORKLOADS = ('random', 'sequential')
+DEFAULT_SIZES = [100000, 1000000]
+
+
+def workload_orders(kind, size, seed=0):
+    """返回 (插入顺序, 查找顺序, 删除顺序)"""
+    keys = list(range(size))
+    if kind == 'sequential':
+        return keys, keys, keys
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(3):
+        order = keys[:]
+        rng.shuffle(order)
+        orders.append(order)
+    return tuple(orders)
+
+
+def build(name, keys):
+    factory, takes_value, _ = STRUCTURES[name]
+    tree = factory()
+    insert = tree.insert
+    if takes_value:
+        for key in keys:
+            insert(key, key)
+    else:
+        for key in keys:
+            insert(key)
+    return tree
+
+
+def traverse(name, tree):
+    # 按序遍历全部元素，返回遍历到的键
+    method = getattr(tree, STRUCTURES[name][2])
+    return [item[0] if isinstance(item, tuple) else item for item in method()]
+
+
+def measure_memory(name, keys):
+    """建树过程中新分配的字节数（键和值是预先存在的对象，不计入）"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tree = build(name, keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return current - baseline
+
+
+def benchmark_structure(name, kind, size, repeats=1, seed=0, memory=False):
+    insert_order, search_order, delete_order = workload_orders(kind, size, seed)
+    row = {'structure': name, 'workload': kind, 'size': size, 'repeats': repeats, 'sorted': True}
+    times = {'insert': [], 'search': [], 'traverse': [], 'delete': []}
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        tree = build(name, insert_order)
+        times['insert'].append(time.perf_counter() - begin)
+
+        search = tree.search
+        begin = time.perf_counter()
+        for key in search_order:
+            search(key)
+        times['search'].append(time.perf_counter() - begin)
+
+        begin = time.perf_counter()
+        result = traverse(name, tree)
+        times['traverse'].append(time.perf_counter() - begin)
+        row['sorted'] = row['sorted'] and result == list(range(size))
+        del result
+
+        delete = tree.delete
+        begin = time.perf_counter()
+        for key in delete_order:
+            delete(key)
+        times['delete'].append(time.perf_counter() - begin)
+        del tree
+
+    for operation, samples in times.items():
+        median = statistics.median(samples)
+        row[f'{operation}_time'] = median
+        row[f'{operation}_ops_per_sec'] = size / median if median else float('inf')
+
+    if memory:
+        row['bytes_per_key'] = measure_memory(name, insert_order) / size if size else 0.0
+    return row
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, structures=DEFAULT_STRUCTURES, workloads=WORKLOADS,
+                  repeats=1, seed=0, memory=False, verbose=True):
+    rows = []
+    for size in sizes:
+        for kind in workloads:
+            for name in structures:
+                row = benchmark_structure(name, kind, size, repeats, seed, memory)
+                rows.append(row)
+                if verbose:
+                    print_row(row)
+    return rows
+
+
+def print_row(row):
+    memory = f"  每键 {row['bytes_per_key']:>6.1f} B" if 'bytes_per_key' in row else ""
+    print(f"{row['structure']:<20} {row['workload']:<10} {row['size']:>9}  "
+          f"插入 {row['insert_ops_per_sec']:>10,.0f}/s  查找 {row['search_ops_per_sec']:>10,.0f}/s  "
+          f"遍历 {row['traverse_ops_per_sec']:>11,.0f}/s  删除 {row['delete_ops_per_sec']:>10,.0f}/s"
+          f"{memory}  {'有序' if row['sorted'] else '结果错误'}")
+
+
+def write_json(rows, path, config=None):
+    environment = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment, 'config': config or {}, 'results': rows},
+                  f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="有序映射共享基准测试")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="键的数量")
+    parser.add_argument('--structures', nargs='+', default=DEFAULT_STRUCTURES, choices=list(STRUCTURES))
+    parser.add_argument('--workloads', nargs='+', default=list(WORKLOADS), choices=WORKLOADS)
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--memory', action='store_true', help="额外测量每个键的内存（会再建一次树）")
+    parser.add_argument('--json', help="JSON输出路径")
+    args = parser.parse_args(argv)
+
+    rows = run_benchmark(args.sizes, args.structures, args.workloads, args.repeats, args.seed, args.memory)
+    if args.json:
+        write_json(rows, args.json, {key: value for key, value in vars(args).items() if key != 'json'})
+        print(f"JSON结果已保存到 {args.json}")
+    if not all(row['sorted'] for row in rows):
+        raise SystemExit("遍历结果与预期不一致")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import sys
+import os
+
+# 添加当前目录到路径，以便导入模块
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import random
+
+from sorted_block_map import SortedBlockMap, SortedBlockSet
+
+def check_blocks(tree):
+    """检查块结构：每块非空、有序、不超过 2 * load，maxes 正确，块之间整体有序"""
+    assert len(tree.keys) == len(tree.values) == len(tree.maxes), "块数不一致"
+    previous = None
+    total = 0
+    for keys, values, maximum in zip(tree.keys, tree.values, tree.maxes):
+        assert keys, "存在空块"
+        assert len(keys) == len(values), "键和值的数量不一致"
+        assert len(keys) <= 2 * tree.load, "块过大"
+        assert all(keys[i] < keys[i + 1] for i in range(len(keys) - 1)), "块内无序"
+        assert maximum == keys[-1], "maxes 错误"
+        assert previous is None or previous < keys[0], "块之间无序"
+        previous = keys[-1]
+        total += len(keys)
+    assert total == len(tree), f"元素数 {total} 与 len {len(tree)} 不一致"
+
+def test_insert_search_delete():
+    """测试插入、查找、删除：随机操作后与字典结果一致"""
+    print("测试插入、查找、删除...")
+    rng = random.Random(0)
+    for load in (2, 3, 8, 64):
+        tree = SortedBlockMap(load)
+        expected = {}
+        for step in range(3000):
+            key = rng.randrange(500)
+            if rng.random() < 0.45:
+                assert tree.delete(key) == (key in expected), f"删除 {key} 返回值错误"
+                expected.pop(key, None)
+            else:
+                tree.insert(key, f'value_{key}_{step}')
+                expected[key] = f'value_{key}_{step}'
+            if step % 300 == 0:
+                check_blocks(tree)
+        check_blocks(tree)
+        for key in range(-1, 501):
+            assert tree.search(key) == expected.get(key), f"查找 {key} 失败"
+            assert (key in tree) == (key in expected)
+        assert tree.inorder() == sorted(expected) == list(tree)
+        assert tree.inorder_traversal() == sorted(expected.items()) == list(tree.items())
+    print("插入、查找、删除测试通过！\n")
+
+def test_sequential():
+    """测试顺序插入和顺序删除：块按 load 拆分，删空后结构为空"""
+    print("测试顺序插入和删除...")
+    tree = SortedBlockMap(16)
+    for key in range(1000):
+        tree.insert(key, key)
+    check_blocks(tree)
+    assert tree.inorder() == list(range(1000))
+    for key in range(1000):
+        assert tree.delete(key)
+    check_blocks(tree)
+    assert len(tree) == 0 and tree.keys == [] and tree.search(0) is None
+    assert not tree.delete(0)
+    print("顺序插入和删除测试通过！\n")
+
+def test_range_and_bulk_load():
+    """测试范围查询和从有序序列构建"""
+    print("测试范围查询和批量构建...")
+    rng = random.Random(1)
+    keys = sorted(rng.sample(range(2000), 700))
+    tree = SortedBlockMap.from_sorted(((key, key * 2) for key in keys), load=10)
+    check_blocks(tree)
+    assert tree.inorder() == keys
+    for _ in range(300):
+        lo, hi = rng.randrange(-10, 2010), rng.randrange(-10, 2010)
+        assert list(tree.range(lo, hi)) == [(key, key * 2) for key in keys if lo <= key <= hi], f"range({lo}, {hi}) 错误"
+    try:
+        SortedBlockMap.from_sorted([(2, 'b'), (1, 'a')])
+        assert False, "无序输入应该抛出ValueError"
+    except ValueError:
+        pass
+    print("范围查询和批量构建测试通过！\n")
+
+def test_duplicates_and_missing_keys():
+    """测试重复键和“值为None”与“键不存在”的区分：映射覆盖旧值，集合忽略重复插入"""
+    print("测试重复键和查找结果...")
+    tree = SortedBlockMap(load=4)
+    tree.insert(5)
+    missing = object()
+    assert 5 in tree and tree.search(5) is None and tree.search(5, missing) is None
+    assert 6 not in tree and tree.search(6) is None and tree.search(6, missing) is missing
+    tree.insert(5, 'five')
+    tree.insert(5, 'FIVE')
+    assert len(tree) == 1 and tree.search(5) == 'FIVE'
+    assert tree.inorder_traversal() == [(5, 'FIVE')]
+
+    # SortedBlockSet 与 AVLTree 一样：search 返回带 key 的对象，重复插入被忽略
+    rng = random.Random(2)
+    keys = [rng.randrange(300) for _ in range(1000)]
+    tree = SortedBlockSet(load=4)
+    for key in keys:
+        tree.insert(key)
+    assert len(tree) == len(set(keys)) and tree.inorder() == sorted(set(keys))
+    check_blocks(tree._map)
+    for key in range(-5, 305):
+        found = tree.search(key)
+        assert bool(found) == (key in set(keys)) == (key in tree)
+        assert found is None or found.key == key
+    tree.insert(0)
+    assert tree.search(0).key == 0
+    assert list(tree.range(10, 20)) == [key for key in sorted(set(keys)) if 10 <= key <= 20]
+    for key in set(keys):
+        assert tree.delete(key)
+    assert len(tree) == 0 and tree.search(0) is None and not tree.delete(0)
+    assert SortedBlockSet.from_sorted(range(10), load=4).inorder() == list(range(10))
+    print("重复键和查找结果测试通过！\n")
+
+def run_all_tests():
+    """运行所有测试"""
+    print("=" * 60)
+    print("有序块映射测试套件")
+    print("=" * 60)
+
+    test_insert_search_delete()
+    test_sequential()
+    test_range_and_bulk_load()
+    test_duplicates_and_missing_keys()
+
+    print("=" * 60)
+    print("所有测试通过！")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    run_all_tests()